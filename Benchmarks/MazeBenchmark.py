@@ -0,0 +1,236 @@
+import random
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from Benchmarks.NullSink import NullSink
+from Model.Dijkstra.AStar import AStar
+from Model.Dijkstra.Dijkstra import Dijkstra
+from Model.Dijkstra.JunctionGraph import JunctionGraph
+from Model.Dijkstra.MatrixGraph import MatrixGraph
+from Model.LevelGeneration.Generators.MazeGenerator import MazeGenerator
+from Model.LevelGeneration.Matrix import Matrix
+from Model.LevelGeneration.MatrixPathBuilder import MatrixPathBuilder
+from Model.LevelGeneration.Maze import Maze
+from Model.Render.Camera import Camera
+from Model.Render.Terminal import Terminal
+from Model.colors import Color
+from View.MatrixCharacterView import MatrixCharacterView
+
+
+class MazeBenchmark:
+    """
+    Замеряет время и пиковую память этапов игры на лабиринтах разного размера.
+
+    Этапы: генерация каждой стратегией, построение графа, поиск путей, точечный
+    запрос A* от входа до выхода, построение графа развилок и поиск по нему,
+    поле расстояний до EXIT_FIELD_EXITS выходов, которое строит Maze,
+    сериализация матрицы, первый кадр и отрисовка RENDERED_MOVES ходов персонажа,
+    а также первый кадр в окне просмотра VIEWPORT_COLUMNS x VIEWPORT_ROWS,
+    стоимость которого не зависит от размера уровня.
+    Генерация выполняется с фиксированным зерном, вывод перенаправляется в NullSink.
+    Каждый этап выполняется дважды: первый прогон замеряет время, второй под
+    tracemalloc - пиковую память, чтобы трассировка не искажала время. Этапам,
+    которые меняют свои входные данные или кэшируют результат, перед каждым
+    прогоном создаются новые входные данные, чтобы оба прогона выполняли одну работу.
+    """
+    MAZE_ONE = Color.color_str_back_to_rgb("  ", 46, 222, 16)
+    MAZE_CHARACTER = Color.color_str_back_to_rgb("🙂 ", 21, 54, 17)
+    MAZE_ZERO = Color.color_str_back_to_rgb("  ", 21, 54, 17)
+    MAZE_UNKNOWN = Color.color_str_back_to_rgb("  ", 20, 20, 20)
+    RENDERED_MOVES = 200
+    VIEWPORT_COLUMNS = 40
+    VIEWPORT_ROWS = 20
+    EXIT_FIELD_EXITS = 3
+    MIN_REGRESSION_SECONDS = 0.001
+
+    def __init__(self, generators: list[MazeGenerator], seed: int) -> None:
+        """
+        Инициализирует набор замеров.
+
+        Args:
+            generators: Стратегии генерации, каждая замеряется отдельным этапом.
+            seed: Зерно генератора случайных чисел для воспроизводимых лабиринтов.
+        """
+        self.__generators = generators
+        self.__seed = seed
+        self.__sink = NullSink()
+
+    def run(self, sizes: list[int]) -> list[dict[str, Any]]:
+        """
+        Выполняет все этапы для каждого размера лабиринта.
+
+        Args:
+            sizes: Размеры стороны квадратного лабиринта.
+
+        Returns:
+            Список результатов: этап, размер, время в секундах, пиковая память в байтах
+            и количество выведенных байтов.
+        """
+        results = []
+        Terminal.set_output(self.__sink)
+        try:
+            for size in sizes:
+                results.extend(self.__run_size(size))
+        finally:
+            Terminal.set_output(None)
+        return results
+
+    @staticmethod
+    def compare(results: list[dict[str, Any]], baseline: list[dict[str, Any]],
+                tolerance: float) -> list[str]:
+        """
+        Сравнивает результаты с сохранёнными базовыми и возвращает описания регрессий.
+
+        Регрессией считается превышение базового времени или памяти более чем
+        в tolerance раз; разница во времени меньше MIN_REGRESSION_SECONDS не учитывается.
+
+        Args:
+            results: Текущие результаты.
+            baseline: Базовые результаты.
+            tolerance: Допустимое отношение текущего значения к базовому.
+
+        Returns:
+            Список строк с описанием каждой регрессии.
+        """
+        previous = {(entry["stage"], entry["size"]): entry for entry in baseline}
+        regressions = []
+
+        for entry in results:
+            base = previous.get((entry["stage"], entry["size"]))
+            if base is None:
+                continue
+            if (entry["seconds"] > base["seconds"] * tolerance and
+                    entry["seconds"] - base["seconds"] > MazeBenchmark.MIN_REGRESSION_SECONDS):
+                regressions.append(f"{entry['stage']} {entry['size']}x{entry['size']}: время "
+                                   f"{base['seconds']:.4f} с -> {entry['seconds']:.4f} с")
+            if entry["peak_bytes"] > base["peak_bytes"] * tolerance:
+                regressions.append(f"{entry['stage']} {entry['size']}x{entry['size']}: память "
+                                   f"{base['peak_bytes']} Б -> {entry['peak_bytes']} Б")
+        return regressions
+
+    def __run_size(self, size: int) -> list[dict[str, Any]]:
+        """
+        Выполняет все этапы для лабиринта size x size.
+        Этапы после генерации работают с лабиринтом последней стратегии из списка.
+
+        Args:
+            size: Размер стороны лабиринта.
+        """
+        results = []
+        maze = None
+        for generator in self.__generators:
+            maze = self.__measure(results, f"generation:{type(generator).__name__}", size,
+                                  self.__generate, size, generator)
+
+        matrix = maze.to_matrix()
+        entrance = self.__entrance_x(size), 0
+        graph = self.__measure(results, "graph_build", size, MatrixGraph, matrix, matrix.zero_symbol)
+        dijkstra = self.__measure(results, "solve", size, Dijkstra, graph, *entrance)
+        self.__measure(results, "astar_point_query", size, AStar, graph, *entrance, *maze.exit_coordinate)
+        junctions = self.__measure(results, "junction_graph_build", size, JunctionGraph, matrix,
+                                   matrix.zero_symbol, [entrance, maze.exit_coordinate])
+        self.__measure(results, "junction_solve", size, Dijkstra, junctions, *entrance)
+        generator = self.__generators[-1]
+        self.__measure(results, "exit_distance_field", size, Maze.distance_to_exit,
+                       setup=lambda: (self.__generate(size, generator, MazeBenchmark.EXIT_FIELD_EXITS), *entrance))
+        self.__measure(results, "to_string", size, Matrix.to_string,
+                       setup=lambda: (self.__generate(size, generator).to_matrix(),))
+        path = dijkstra.get_path(*maze.exit_coordinate)
+        self.__measure(results, "first_frame", size, self.__first_frame, matrix, path[0])
+        self.__measure(results, "visualize_move", size, self.__visualize_moves,
+                       setup=lambda: (self.__first_frame(matrix, path[0]), path[1:MazeBenchmark.RENDERED_MOVES + 1]))
+        self.__measure(results, "viewport_first_frame", size, self.__first_frame, matrix, path[0],
+                       Camera(size, size, MazeBenchmark.VIEWPORT_COLUMNS, MazeBenchmark.VIEWPORT_ROWS))
+        return results
+
+    def __measure(self, results: list[dict[str, Any]], stage: str, size: int,
+                  function: Callable[..., Any], *args: Any,
+                  setup: Callable[[], tuple[Any, ...]] | None = None) -> Any:
+        """
+        Замеряет время и пиковую память вызова function(*args) и добавляет результат.
+
+        Args:
+            results: Список, в который добавляется результат замера.
+            stage: Название этапа.
+            size: Размер стороны лабиринта.
+            function: Замеряемая функция.
+            args: Аргументы функции.
+            setup: Необязательная функция, которая перед каждым прогоном создаёт новые
+                аргументы вместо args; её время, память и вывод не учитываются.
+
+        Returns:
+            Значение, которое вернула функция при первом прогоне.
+        """
+        run_args = setup() if setup is not None else args
+        written = self.__sink.written
+        start = time.perf_counter()
+        value = function(*run_args)
+        seconds = time.perf_counter() - start
+        written = self.__sink.written - written
+
+        run_args = setup() if setup is not None else args
+        tracemalloc.start()
+        function(*run_args)
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        results.append({"stage": stage,
+                        "size": size,
+                        "seconds": seconds,
+                        "peak_bytes": peak_bytes,
+                        "written_bytes": written})
+        return value
+
+    def __entrance_x(self, size: int) -> int:
+        """
+        Возвращает координату X входа, одинаковую для всех прогонов одного размера.
+
+        Args:
+            size: Размер стороны лабиринта.
+        """
+        return random.Random(self.__seed + size).randrange(1, size - 1)
+
+    def __generate(self, size: int, generator: MazeGenerator, exits_count: int = 1) -> Maze:
+        """
+        Генерирует лабиринт size x size заданной стратегией с фиксированным зерном.
+
+        Args:
+            size: Размер стороны лабиринта.
+            generator: Стратегия генерации.
+            exits_count: Количество выходов.
+        """
+        random.seed(self.__seed + size)
+        matrix = Matrix(size, size, MazeBenchmark.MAZE_ONE, MazeBenchmark.MAZE_ZERO)
+        return Maze(MatrixPathBuilder(self.__entrance_x(size), 0, matrix), exits_count, generator=generator)
+
+    @staticmethod
+    def __first_frame(matrix: Matrix, position: tuple[int, int], camera: Camera | None = None) -> MatrixCharacterView:
+        """
+        Создаёт представление персонажа и отрисовывает первый, полный кадр.
+
+        Args:
+            matrix: Матрица лабиринта.
+            position: Начальная позиция персонажа.
+            camera: Окно просмотра; по умолчанию выводится вся матрица.
+        """
+        view = MatrixCharacterView(matrix, MazeBenchmark.MAZE_UNKNOWN, MazeBenchmark.MAZE_ZERO,
+                                   MazeBenchmark.MAZE_CHARACTER, camera=camera)
+        view.visualize_move(*position)
+        view.render()
+        Terminal.flush()
+        return view
+
+    @staticmethod
+    def __visualize_moves(view: MatrixCharacterView, path: list[tuple[int, int]]) -> None:
+        """
+        Отрисовывает ходы персонажа по клеткам пути.
+
+        Args:
+            view: Представление персонажа с уже выведенным первым кадром.
+            path: Клетки, по которым проходит персонаж.
+        """
+        for x, y in path:
+            view.visualize_move(x, y)
+            view.render()
+            Terminal.flush()
@@ -0,0 +1,28 @@
+class NullSink:
+    """
+    Поток вывода, который отбрасывает всё записанное и только считает байты.
+    Подставляется вместо консоли, чтобы замерять отрисовку без затрат терминала.
+    """
+    def __init__(self) -> None:
+        """
+        Инициализирует пустой счётчик записанных байтов.
+        """
+        self.written = 0
+
+    def write(self, string: str) -> int:
+        """
+        Отбрасывает строку, увеличивая счётчик на её размер в UTF-8.
+
+        Args:
+            string: Записываемая строка.
+
+        Returns:
+            Количество принятых символов.
+        """
+        self.written += len(string.encode("utf-8"))
+        return len(string)
+
+    def flush(self) -> None:
+        """
+        Ничего не делает: данные не буферизуются.
+        """
@@ -20,7 +20,7 @@ class MatrixCharacter:
             current_y: Начальная координата Y персонажа.
             one_symbol: Символ, обозначающий стену (непроходимую ячейку).
         """
-        self.__one_symbol = one_symbol
+        self.__one_code = matrix.code_of(one_symbol)
         self.__current_x = current_x
         self.__current_y = current_y
         self.__matrix = matrix
@@ -68,4 +68,4 @@ class MatrixCharacter:
         matrix = self.__matrix
 
         return (0 <= next_x < matrix.width and 0 <= next_y < matrix.height and
-                matrix.get(next_x, next_y) != self.__one_symbol)
+                matrix.get_code(next_x, next_y) != self.__one_code)
@@ -0,0 +1,118 @@
+from array import array
+from heapq import heappop, heappush
+
+from Model.Dijkstra.Dijkstra import Dijkstra
+from Model.Dijkstra.MatrixGraph import MatrixGraph
+
+
+class AStar:
+    """
+    Ищет кратчайший путь между двумя точками графа алгоритмом A*.
+
+    Очередь упорядочена по сумме пройденного расстояния и манхэттенского
+    расстояния до цели; эвристика не переоценивает длину пути ни для единичных
+    весов, ни для взвешенных коридоров, поэтому найденный путь кратчайший.
+    Поиск останавливается, как только цель извлечена из очереди, поэтому для
+    запроса одной точки раскрывается лишь часть графа, а не весь граф, как
+    при полном поиске Dijkstra.
+    """
+    def __init__(self, graph: MatrixGraph, start_x: int, start_y: int, target_x: int, target_y: int) -> None:
+        """
+        Выполняет поиск пути от начальной точки до цели.
+
+        Args:
+            graph: Граф, по которому ищется путь.
+            start_x: Начальная координата X.
+            start_y: Начальная координата Y.
+            target_x: Координата X цели.
+            target_y: Координата Y цели.
+        """
+        self.__graph = graph
+        self.__start_index = graph.index_of(start_x, start_y)
+        self.__target_index = graph.index_of(target_x, target_y)
+        self.__target = (target_x, target_y)
+        self.__distances = array("i", [Dijkstra.INFINITY]) * graph.vertex_count
+        self.__parents = array("i", [-1]) * graph.vertex_count
+        self.__expanded_count = 0
+
+        if self.__start_index >= 0 and self.__target_index >= 0:
+            self.__execute()
+
+    @property
+    def distance(self) -> int:
+        """
+        Возвращает длину кратчайшего пути или Dijkstra.INFINITY, если цель недостижима.
+        """
+        if self.__target_index < 0:
+            return Dijkstra.INFINITY
+        return self.__distances[self.__target_index]
+
+    @property
+    def expanded_count(self) -> int:
+        """
+        Возвращает количество вершин, раскрытых во время поиска.
+        """
+        return self.__expanded_count
+
+    def get_path(self) -> list[tuple[int, int]]:
+        """
+        Восстанавливает найденный путь.
+
+        Returns:
+            Список координат вершин от начальной точки до цели включительно.
+            Пустой список, если цель недостижима. Для JunctionGraph это только
+            развилки и опорные точки; клетки коридоров между ними восстанавливает
+            JunctionGraph.expand_path.
+        """
+        if self.distance == Dijkstra.INFINITY:
+            return []
+
+        path = []
+        index = self.__target_index
+        while index >= 0:
+            path.append(self.__graph.coordinates_of(index))
+            index = self.__parents[index]
+        path.reverse()
+        return path
+
+    def __execute(self) -> None:
+        """
+        Раскрывает вершины в порядке возрастания оценки f = g + h до извлечения цели.
+        При равной оценке первой раскрывается вершина с большим пройденным расстоянием,
+        то есть более близкая к цели.
+        """
+        graph = self.__graph
+        distances = self.__distances
+        parents = self.__parents
+        target = self.__target_index
+        target_x, target_y = self.__target
+        closed = bytearray(graph.vertex_count)
+        weighted = graph.is_weighted
+
+        start_x, start_y = graph.coordinates_of(self.__start_index)
+        distances[self.__start_index] = 0
+        heap = [(abs(start_x - target_x) + abs(start_y - target_y), 0, self.__start_index)]
+
+        while heap:
+            _, negative_distance, current = heappop(heap)
+            if closed[current]:
+                continue
+            closed[current] = 1
+            self.__expanded_count += 1
+            if current == target:
+                return
+
+            distance = -negative_distance
+            if weighted:
+                neighbours = graph.neighbour_weights(current)
+            else:
+                neighbours = [(neighbour, 1) for neighbour in graph.neighbour_indices(current)]
+
+            for neighbour, weight in neighbours:
+                next_distance = distance + weight
+                if next_distance < distances[neighbour]:
+                    distances[neighbour] = next_distance
+                    parents[neighbour] = current
+                    x, y = graph.coordinates_of(neighbour)
+                    heappush(heap, (next_distance + abs(x - target_x) + abs(y - target_y),
+                                    -next_distance, neighbour))
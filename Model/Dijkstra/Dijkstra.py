@@ -1,12 +1,25 @@
+from array import array
+from collections import deque
+from heapq import heappop, heappush
+
 from Model.Dijkstra.MatrixGraph import MatrixGraph
 
 
 class Dijkstra:
     """
-    Реализует алгоритм Дейкстры для поиска кратчайшего пути в графе,
-    представленном в виде матрицы.
+    Ищет кратчайшие пути от начальной вершины до всех вершин графа.
+
+    Для графов с единичными весами используется обход в ширину, для взвешенных
+    графов - алгоритм Дейкстры на двоичной куче. Результат хранится в компактных
+    массивах расстояний и родителей, проиндексированных номерами вершин графа,
+    поэтому расстояние и путь до любой вершины доступны без повторного поиска.
+    Поиск можно начать сразу из нескольких точек - тогда за один проход для каждой
+    вершины находится расстояние до ближайшей из них.
     """
-    def __init__(self, matrix_graph: MatrixGraph, start_x: int, start_y: int):
+    INFINITY = 99999999
+
+    def __init__(self, matrix_graph: MatrixGraph, start_x: int, start_y: int,
+                 other_starts: list[tuple[int, int]] | None = None):
         """
         Инициализирует алгоритм Дейкстры с заданным графом и начальной точкой.
 
@@ -14,24 +27,143 @@ class Dijkstra:
             matrix_graph: Граф, представленный в виде MatrixGraph.
             start_x: Начальная координата X.
             start_y: Начальная координата Y.
+            other_starts: Необязательные дополнительные начальные точки; расстояния
+                и пути тогда считаются до ближайшей из всех начальных точек.
         """
         self.__matrixGraph = matrix_graph
-        self.__start_vertex = matrix_graph.get_vertex(start_x, start_y)
-        self.__execute()
+        starts = [(start_x, start_y)] + (other_starts or [])
+        self.__start_indices = [index for index in (matrix_graph.index_of(x, y) for x, y in starts) if index >= 0]
+        self.__distances = array("i", [Dijkstra.INFINITY]) * matrix_graph.vertex_count
+        self.__parents = array("i", [-1]) * matrix_graph.vertex_count
+
+        if not self.__start_indices:
+            return
+
+        if matrix_graph.is_weighted:
+            self.__execute_weighted()
+        else:
+            self.__execute_unweighted()
+
+    @property
+    def distances(self) -> array:
+        """
+        Возвращает массив расстояний от начальной вершины, индексированный номерами вершин.
+        Для недостижимых вершин хранится значение INFINITY.
+        """
+        return self.__distances
+
+    @property
+    def parents(self) -> array:
+        """
+        Возвращает массив номеров родительских вершин на кратчайших путях.
+        Для начальной и недостижимых вершин хранится -1.
+        """
+        return self.__parents
+
+    def get_distance(self, x: int, y: int) -> int:
+        """
+        Возвращает длину кратчайшего пути от начальной вершины до точки (x, y).
+
+        Args:
+            x: Координата X.
+            y: Координата Y.
+
+        Returns:
+            Длина пути или INFINITY, если точка недостижима или не является вершиной.
+        """
+        index = self.__matrixGraph.index_of(x, y)
+        if index < 0:
+            return Dijkstra.INFINITY
+        return self.__distances[index]
+
+    def get_path(self, x: int, y: int) -> list[tuple[int, int]]:
+        """
+        Восстанавливает кратчайший путь от ближайшей начальной вершины до точки (x, y).
+
+        Args:
+            x: Координата X.
+            y: Координата Y.
+
+        Returns:
+            Список координат от начальной точки до (x, y) включительно.
+            Пустой список, если точка недостижима.
+        """
+        graph = self.__matrixGraph
+        index = graph.index_of(x, y)
+        if index < 0 or self.__distances[index] == Dijkstra.INFINITY:
+            return []
+
+        path = []
+        while index >= 0:
+            path.append(graph.coordinates_of(index))
+            index = self.__parents[index]
+        path.reverse()
+        return path
+
+    def get_route_to_start(self, x: int, y: int, steps: int) -> list[tuple[int, int]]:
+        """
+        Возвращает первые шаги кратчайшего пути из точки (x, y) к ближайшей начальной вершине.
+
+        Путь строится по массиву родителей, поэтому время зависит только от steps.
+
+        Args:
+            x: Координата X.
+            y: Координата Y.
+            steps: Максимальное количество шагов.
 
-    def __execute(self) -> None:
+        Returns:
+            Список координат без самой точки (x, y). Пустой список, если точка недостижима.
         """
-        Выполняет алгоритм Дейкстры для поиска кратчайших путей от начальной вершины.
+        graph = self.__matrixGraph
+        index = graph.index_of(x, y)
+        if index < 0 or self.__distances[index] == Dijkstra.INFINITY:
+            return []
+
+        route = []
+        index = self.__parents[index]
+        while index >= 0 and len(route) < steps:
+            route.append(graph.coordinates_of(index))
+            index = self.__parents[index]
+        return route
+
+    def __execute_unweighted(self) -> None:
+        """
+        Выполняет обход в ширину от начальных вершин для графа с единичными весами.
+        """
+        graph = self.__matrixGraph
+        distances = self.__distances
+        parents = self.__parents
+        for start in self.__start_indices:
+            distances[start] = 0
+        queue = deque(self.__start_indices)
+
+        while queue:
+            current = queue.popleft()
+            next_distance = distances[current] + 1
+            for neighbour in graph.neighbour_indices(current):
+                if distances[neighbour] == Dijkstra.INFINITY:
+                    distances[neighbour] = next_distance
+                    parents[neighbour] = current
+                    queue.append(neighbour)
+
+    def __execute_weighted(self) -> None:
+        """
+        Выполняет алгоритм Дейкстры на двоичной куче для взвешенного графа.
         """
-        start_vertex = self.__start_vertex
         graph = self.__matrixGraph
-        start_vertex.distance = 0
-        non_passed_vertices = [*graph.get_neighbours().keys()]
-
-        while non_passed_vertices:
-            current_vertex = min(non_passed_vertices, key=lambda vertex: vertex.distance)
-            for neighbour in graph.get_neighbours()[current_vertex]:
-                if neighbour in non_passed_vertices and neighbour.distance > current_vertex.distance + 1:
-                    neighbour.distance = current_vertex.distance + 1
-                    neighbour.set_parent(current_vertex)
-            non_passed_vertices.remove(current_vertex)
+        distances = self.__distances
+        parents = self.__parents
+        for start in self.__start_indices:
+            distances[start] = 0
+        heap = [(0, start) for start in self.__start_indices]
+
+        while heap:
+            distance, current = heappop(heap)
+            if distance > distances[current]:
+                continue
+            for neighbour, weight in graph.neighbour_weights(current):
+                next_distance = distance + weight
+                if next_distance < distances[neighbour]:
+                    distances[neighbour] = next_distance
+                    parents[neighbour] = current
+                    heappush(heap, (next_distance, neighbour))
@@ -0,0 +1,399 @@
+import re
+from array import array
+from bisect import bisect_right
+from typing import Any
+
+from Model.Dijkstra.Dijkstra import Dijkstra
+from Model.LevelGeneration.Matrix import Matrix
+
+
+class JunctionGraph:
+    """
+    Взвешенный граф лабиринта, в котором каждый коридор сжат в одно ребро.
+
+    Вершинами становятся только развилки, тупики и опорные точки (вход и выходы),
+    а цепочка проходимых ячеек ровно с двумя соседями между ними заменяется
+    ребром с весом, равным длине коридора. Клетки коридоров хранятся подряд
+    в общем массиве, поэтому для клетки посреди коридора известны концы коридора
+    и расстояния до них: запросы из такой клетки проецируются на эти концы.
+
+    Граф поддерживает тот же интерфейс, что и MatrixGraph, и может передаваться
+    в Dijkstra и AStar. Вершины и рёбра хранятся в плоских массивах по четыре
+    слота на вершину, пустой слот обозначается -1.
+    """
+    NEIGHBOUR_SLOTS = 4
+    LINK_MASK = 0b1111
+    PASSABLE_BIT = 0b10000
+
+    def __init__(self, matrix: Matrix, maze_zero_char: Any, anchors: list[tuple[int, int]] | None = None):
+        """
+        Строит граф развилок по матрице.
+
+        Args:
+            matrix: Матрица уровня.
+            maze_zero_char: Символ, обозначающий проходимую ячейку.
+            anchors: Необязательные точки, которые всегда становятся вершинами,
+                даже если лежат посреди коридора; непроходимые точки пропускаются.
+        """
+        self.__matrix = matrix
+        self.__zero_code = matrix.code_of(maze_zero_char)
+        self.__height = matrix.height
+        self.__width = matrix.width
+        self.__cell_vertices = array("i", [-1]) * (self.__width * self.__height)
+        self.__cell_positions = array("i", [-1]) * (self.__width * self.__height)
+        self.__vertex_cells = array("i")
+        self.__adjacency = array("i")
+        self.__weights = array("i")
+        self.__slot_corridors = array("i")
+        self.__corridor_cells = array("i")
+        self.__corridor_starts = array("i")
+        self.__corridor_ends = array("i")
+        self.__generate(anchors or [])
+
+    @property
+    def vertex_count(self) -> int:
+        """
+        Возвращает количество вершин графа.
+        """
+        return len(self.__vertex_cells)
+
+    @property
+    def corridor_count(self) -> int:
+        """
+        Возвращает количество сжатых коридоров, то есть рёбер графа.
+        """
+        return len(self.__corridor_ends) // 2
+
+    @property
+    def is_weighted(self) -> bool:
+        """
+        Возвращает True: вес ребра равен длине коридора.
+        """
+        return True
+
+    def index_of(self, x: int, y: int) -> int:
+        """
+        Возвращает номер вершины с координатами (x, y).
+
+        Args:
+            x: Координата X.
+            y: Координата Y.
+
+        Returns:
+            Номер вершины или -1, если точка непроходима или лежит посреди коридора.
+        """
+        if not (0 <= x < self.__width and 0 <= y < self.__height):
+            return -1
+        return self.__cell_vertices[x * self.__height + y]
+
+    def coordinates_of(self, index: int) -> tuple[int, int]:
+        """
+        Возвращает координаты (x, y) вершины по её номеру.
+
+        Args:
+            index: Номер вершины.
+        """
+        return divmod(self.__vertex_cells[index], self.__height)
+
+    def neighbour_indices(self, index: int) -> list[int]:
+        """
+        Возвращает номера вершин на другом конце коридоров, выходящих из вершины.
+
+        Args:
+            index: Номер вершины.
+        """
+        start = index * JunctionGraph.NEIGHBOUR_SLOTS
+        return [neighbour for neighbour in self.__adjacency[start:start + JunctionGraph.NEIGHBOUR_SLOTS]
+                if neighbour >= 0]
+
+    def neighbour_weights(self, index: int) -> list[tuple[int, int]]:
+        """
+        Возвращает пары (номер соседней вершины, длина коридора до неё).
+
+        Args:
+            index: Номер вершины.
+        """
+        start = index * JunctionGraph.NEIGHBOUR_SLOTS
+        end = start + JunctionGraph.NEIGHBOUR_SLOTS
+        return [(neighbour, weight) for neighbour, weight in zip(self.__adjacency[start:end], self.__weights[start:end])
+                if neighbour >= 0]
+
+    def project(self, x: int, y: int) -> list[tuple[int, int]]:
+        """
+        Проецирует точку на вершины графа.
+
+        Args:
+            x: Координата X.
+            y: Координата Y.
+
+        Returns:
+            Для вершины - одна пара (номер вершины, 0). Для клетки посреди коридора -
+            две пары (номер вершины на конце коридора, расстояние до неё). Для
+            непроходимой точки - пустой список.
+        """
+        if not (0 <= x < self.__width and 0 <= y < self.__height):
+            return []
+        cell = x * self.__height + y
+        vertex = self.__cell_vertices[cell]
+        if vertex >= 0:
+            return [(vertex, 0)]
+        position = self.__cell_positions[cell]
+        if position < 0:
+            return []
+
+        corridor = bisect_right(self.__corridor_starts, position) - 1
+        offset = position - self.__corridor_starts[corridor] + 1
+        length = self.__corridor_length(corridor)
+        return [(self.__corridor_ends[2 * corridor], offset),
+                (self.__corridor_ends[2 * corridor + 1], length - offset)]
+
+    def get_distance(self, field: Dijkstra, x: int, y: int) -> int:
+        """
+        Возвращает расстояние от точки (x, y) до ближайшей начальной вершины поиска.
+
+        Args:
+            field: Поиск Dijkstra, выполненный на этом графе.
+            x: Координата X.
+            y: Координата Y.
+
+        Returns:
+            Длина пути или Dijkstra.INFINITY, если точка недостижима или непроходима.
+        """
+        distances = field.distances
+        return min((distances[vertex] + offset for vertex, offset in self.project(x, y)
+                    if distances[vertex] != Dijkstra.INFINITY), default=Dijkstra.INFINITY)
+
+    def get_route_to_start(self, field: Dijkstra, x: int, y: int, steps: int) -> list[tuple[int, int]]:
+        """
+        Возвращает первые шаги кратчайшего пути из точки (x, y) к ближайшей начальной
+        вершине поиска, разворачивая пройденные коридоры обратно в клетки.
+
+        Args:
+            field: Поиск Dijkstra, выполненный на этом графе.
+            x: Координата X.
+            y: Координата Y.
+            steps: Максимальное количество шагов.
+
+        Returns:
+            Список координат без самой точки (x, y). Пустой список, если точка недостижима.
+        """
+        distances = field.distances
+        parents = field.parents
+        projections = self.project(x, y)
+        if not projections:
+            return []
+        side = min(range(len(projections)), key=lambda i: distances[projections[i][0]] + projections[i][1])
+        vertex = projections[side][0]
+        if distances[vertex] == Dijkstra.INFINITY:
+            return []
+
+        route = []
+        if len(projections) > 1:
+            route.extend(self.__walk_to_end(x * self.__height + y, side))
+        while len(route) < steps and parents[vertex] >= 0:
+            parent = parents[vertex]
+            route.extend(self.__corridor_between(vertex, parent))
+            route.append(self.coordinates_of(parent))
+            vertex = parent
+        return route[:steps]
+
+    def expand_path(self, path: list[tuple[int, int]]) -> list[tuple[int, int]]:
+        """
+        Разворачивает путь по вершинам графа, например результат AStar.get_path,
+        в последовательность клеток, вставляя клетки пройденных коридоров.
+
+        Args:
+            path: Координаты соседних вершин графа по порядку.
+
+        Returns:
+            Список координат клеток от первой вершины пути до последней включительно.
+        """
+        if not path:
+            return []
+        cells = [path[0]]
+        for start, end in zip(path, path[1:]):
+            cells.extend(self.__corridor_between(self.index_of(*start), self.index_of(*end)))
+            cells.append(end)
+        return cells
+
+    def __corridor_length(self, corridor: int) -> int:
+        """
+        Возвращает длину коридора в шагах: количество внутренних клеток плюс один.
+
+        Args:
+            corridor: Номер коридора.
+        """
+        return self.__corridor_starts[corridor + 1] - self.__corridor_starts[corridor] + 1
+
+    def __walk_to_end(self, cell: int, side: int) -> list[tuple[int, int]]:
+        """
+        Возвращает клетки коридора от клетки cell (не включая её) до его конца включительно.
+
+        Args:
+            cell: Плоский номер клетки посреди коридора.
+            side: 0 - идти к первому концу коридора, 1 - ко второму.
+        """
+        position = self.__cell_positions[cell]
+        corridor = bisect_right(self.__corridor_starts, position) - 1
+        if side == 0:
+            positions = range(position - 1, self.__corridor_starts[corridor] - 1, -1)
+        else:
+            positions = range(position + 1, self.__corridor_starts[corridor + 1])
+        route = [divmod(self.__corridor_cells[index], self.__height) for index in positions]
+        route.append(self.coordinates_of(self.__corridor_ends[2 * corridor + side]))
+        return route
+
+    def __corridor_between(self, start: int, end: int) -> list[tuple[int, int]]:
+        """
+        Возвращает внутренние клетки кратчайшего коридора между соседними вершинами
+        в порядке от start к end.
+
+        Args:
+            start: Номер начальной вершины.
+            end: Номер конечной вершины.
+        """
+        slots = range(start * JunctionGraph.NEIGHBOUR_SLOTS, (start + 1) * JunctionGraph.NEIGHBOUR_SLOTS)
+        slot = min((slot for slot in slots if self.__adjacency[slot] == end), key=self.__weights.__getitem__)
+        corridor = self.__slot_corridors[slot]
+        cells = self.__corridor_cells[self.__corridor_starts[corridor]:self.__corridor_starts[corridor + 1]]
+        if self.__corridor_ends[2 * corridor] != start:
+            cells.reverse()
+        return [divmod(cell, self.__height) for cell in cells]
+
+    def __add_vertex(self, cell: int) -> int:
+        """
+        Делает клетку вершиной графа и возвращает номер вершины.
+
+        Args:
+            cell: Плоский номер клетки.
+        """
+        vertex = len(self.__vertex_cells)
+        self.__cell_vertices[cell] = vertex
+        self.__vertex_cells.append(cell)
+        self.__adjacency.extend(array("i", [-1]) * JunctionGraph.NEIGHBOUR_SLOTS)
+        self.__weights.extend(array("i", [0]) * JunctionGraph.NEIGHBOUR_SLOTS)
+        self.__slot_corridors.extend(array("i", [-1]) * JunctionGraph.NEIGHBOUR_SLOTS)
+        return vertex
+
+    def __link(self, vertex: int, neighbour: int, weight: int, corridor: int) -> None:
+        """
+        Записывает ребро в первый свободный слот вершины.
+
+        Args:
+            vertex: Номер вершины.
+            neighbour: Номер вершины на другом конце коридора.
+            weight: Длина коридора.
+            corridor: Номер коридора.
+        """
+        slot = self.__adjacency.index(-1, vertex * JunctionGraph.NEIGHBOUR_SLOTS)
+        self.__adjacency[slot] = neighbour
+        self.__weights[slot] = weight
+        self.__slot_corridors[slot] = corridor
+
+    def __contract_from(self, vertex: int, links: bytes, link_offsets: list[tuple[int, ...]]) -> int:
+        """
+        Проходит все ещё не сжатые коридоры, начинающиеся в вершине, и добавляет их рёбрами.
+
+        Args:
+            vertex: Номер вершины.
+            links: Маски проходимых соседей клеток, см. __neighbour_links.
+            link_offsets: Смещения до проходимых соседей для каждой маски.
+
+        Returns:
+            Количество клеток, ставших внутренними клетками коридоров.
+        """
+        cell_vertices = self.__cell_vertices
+        cell_positions = self.__cell_positions
+        corridor_cells = self.__corridor_cells
+        start_cell = self.__vertex_cells[vertex]
+        contracted = 0
+
+        for first_offset in link_offsets[links[start_cell] & JunctionGraph.LINK_MASK]:
+            first = start_cell + first_offset
+            if cell_positions[first] >= 0 or (cell_vertices[first] >= 0 and first < start_cell):
+                continue
+
+            corridor = len(self.__corridor_starts)
+            self.__corridor_starts.append(len(corridor_cells))
+            previous, current = start_cell, first
+            while cell_vertices[current] < 0:
+                cell_positions[current] = len(corridor_cells)
+                corridor_cells.append(current)
+                forward, backward = link_offsets[links[current] & JunctionGraph.LINK_MASK]
+                following = current + forward
+                if following == previous:
+                    following = current + backward
+                previous, current = current, following
+            end = cell_vertices[current]
+            self.__corridor_ends.extend((vertex, end))
+            weight = len(corridor_cells) - self.__corridor_starts[corridor] + 1
+            contracted += weight - 1
+            if end != vertex:
+                self.__link(vertex, end, weight, corridor)
+                self.__link(end, vertex, weight, corridor)
+        return contracted
+
+    def __neighbour_links(self) -> bytes:
+        """
+        Вычисляет для каждой клетки маску проходимых соседей без цикла по клеткам.
+
+        Биты 0-3 означают проходимость соседа сверху, снизу, слева и справа, бит 4 -
+        проходимость самой клетки. Маски пяти сдвинутых копий матрицы складываются
+        как одно большое число: каждое слагаемое занимает свой бит байта, поэтому
+        переносов между байтами не возникает.
+        """
+        cells = self.__matrix.cells
+        height = self.__height
+        size = len(cells)
+        table = bytearray(256)
+        table[self.__zero_code] = 1
+        passable = cells.translate(table)
+        without_last_row = bytearray(passable)
+        without_last_row[height - 1::height] = bytes(len(without_last_row[height - 1::height]))
+        without_first_row = bytearray(passable)
+        without_first_row[::height] = bytes(len(without_first_row[::height]))
+
+        shifted = (b"\0" + without_last_row[:-1],
+                   without_first_row[1:] + b"\0",
+                   bytes(height) + passable[:-height],
+                   passable[height:] + bytes(height),
+                   passable)
+        total = sum(int.from_bytes(part, "little") << bit for bit, part in enumerate(shifted))
+        return total.to_bytes(size, "little")
+
+    def __generate(self, anchors: list[tuple[int, int]]) -> None:
+        """
+        Строит граф: выбирает вершины, затем проходит коридоры от каждой вершины.
+
+        Вершиной становится проходимая клетка, у которой число проходимых соседей
+        не равно двум, или опорная точка. Замкнутые кольца без развилок, если они
+        остались несжатыми, получают по одной вершине в произвольной клетке.
+        """
+        height = self.__height
+        links = self.__neighbour_links()
+        link_offsets = [tuple(offset for bit, offset in enumerate((-1, 1, -height, height)) if mask >> bit & 1)
+                        for mask in range(JunctionGraph.LINK_MASK + 1)]
+        vertex_table = bytearray(256)
+        for mask in range(JunctionGraph.LINK_MASK + 1):
+            vertex_table[JunctionGraph.PASSABLE_BIT | mask] = len(link_offsets[mask]) != 2
+
+        for x, y in anchors:
+            cell = x * height + y
+            if 0 <= x < self.__width and 0 <= y < height and links[cell] & JunctionGraph.PASSABLE_BIT:
+                if self.__cell_vertices[cell] < 0:
+                    self.__add_vertex(cell)
+        for match in re.finditer(b"\x01", links.translate(vertex_table)):
+            if self.__cell_vertices[match.start()] < 0:
+                self.__add_vertex(match.start())
+
+        covered = len(self.__vertex_cells)
+        for vertex in range(len(self.__vertex_cells)):
+            covered += self.__contract_from(vertex, links, link_offsets)
+
+        passable_count = len(links.translate(None, bytes(range(JunctionGraph.PASSABLE_BIT))))
+        if covered < passable_count:
+            for cell, link in enumerate(links):
+                if link & JunctionGraph.PASSABLE_BIT and self.__cell_vertices[cell] < 0 and self.__cell_positions[cell] < 0:
+                    self.__contract_from(self.__add_vertex(cell), links, link_offsets)
+
+        self.__corridor_starts.append(len(self.__corridor_cells))
@@ -1,6 +1,6 @@
-from typing import Any, Tuple
+from array import array
+from typing import Any
 
-from Model.Dijkstra.Vertex import Vertex
 from Model.LevelGeneration.Matrix import Matrix
 
 
@@ -8,7 +8,18 @@ class MatrixGraph:
     """
     Представляет граф, построенный на основе матрицы, где проходимые ячейки
     являются вершинами графа.
+
+    Ячейка (x, y) отображается в плоский номер x * height + y, по которому
+    хранится номер вершины. Соседи каждой вершины лежат в заранее выделенном
+    массиве по четыре слота на вершину (вверх, вправо, вниз, влево), пустой
+    слот обозначается -1.
     """
+    NEIGHBOUR_SLOTS = 4
+    UP_SLOT = 0
+    RIGHT_SLOT = 1
+    DOWN_SLOT = 2
+    LEFT_SLOT = 3
+
     def __init__(self, matrix: Matrix, maze_zero_char: Any):
         """
         Инициализирует граф на основе матрицы.
@@ -18,66 +29,94 @@ class MatrixGraph:
             maze_zero_char: Символ, обозначающий проходимую ячейку.
         """
         self.__maze_zero_char = maze_zero_char
-        self.__vertex_neighbours = {}
         self.__matrix = matrix
+        self.__height = matrix.height
+        self.__width = matrix.width
+        self.__cell_vertices = array("i", [-1]) * (self.__width * self.__height)
+        self.__vertex_cells = array("i")
+        self.__adjacency = array("i")
         self.__generate()
 
-    def get_neighbours(self) -> dict[Vertex, list[Vertex]]:
+    @property
+    def vertex_count(self) -> int:
+        """
+        Возвращает количество вершин графа.
+        """
+        return len(self.__vertex_cells)
+
+    @property
+    def is_weighted(self) -> bool:
         """
-        Возвращает словарь, где ключи - это вершины, а значения - списки их соседей.
+        Возвращает False: все рёбра графа матрицы имеют единичный вес.
         """
-        return self.__vertex_neighbours
+        return False
 
-    def get_vertex(self, x: int, y: int) -> Vertex | None:
+    def index_of(self, x: int, y: int) -> int:
         """
-        Находит и возвращает вершину по её координатам.
+        Возвращает номер вершины с координатами (x, y).
 
         Args:
             x: Координата X.
             y: Координата Y.
 
         Returns:
-            Объект Vertex или None, если вершина не найдена.
+            Номер вершины или -1, если в точке нет вершины.
         """
-        for vertex in self.__vertex_neighbours.keys():
-            if vertex.x == x and vertex.y == y:
-                return vertex
-        return None
+        if not (0 <= x < self.__width and 0 <= y < self.__height):
+            return -1
+        return self.__cell_vertices[x * self.__height + y]
 
-    def __generate(self) -> None:
-        """
-        Генерирует граф, создавая вершины для всех проходимых ячеек
-        и устанавливая связи между соседними вершинами.
+    def coordinates_of(self, index: int) -> tuple[int, int]:
         """
-        matrix = self.__matrix
-
-        for x in range(matrix.width):
-            for y in range(matrix.height):
-                if matrix.get(x, y) == self.__maze_zero_char:
-                    self.__vertex_neighbours[Vertex(x, y)] = []
+        Возвращает координаты (x, y) вершины по её номеру.
 
-        for x in range(matrix.width):
-            for y in range(matrix.height):
-                if matrix.get(x, y) == self.__maze_zero_char:
-                    vertex = self.get_vertex(x, y)
-                    if vertex:
-                        self.__vertex_neighbours[vertex] = self.__neighbours((x, y))
+        Args:
+            index: Номер вершины.
+        """
+        return divmod(self.__vertex_cells[index], self.__height)
 
-    def __neighbours(self, point: Tuple[int, int]) -> list[Vertex]:
+    def neighbour_indices(self, index: int) -> list[int]:
         """
-        Находит всех проходимых соседей для данной точки (вершины).
+        Возвращает номера соседних вершин для вершины с заданным номером.
 
         Args:
-            point: Кортеж с координатами (x, y).
+            index: Номер вершины.
+        """
+        start = index * MatrixGraph.NEIGHBOUR_SLOTS
+        return [neighbour for neighbour in self.__adjacency[start:start + MatrixGraph.NEIGHBOUR_SLOTS]
+                if neighbour >= 0]
 
-        Returns:
-            Список соседних вершин.
+    def __generate(self) -> None:
+        """
+        Генерирует граф за один проход по кодам ячеек матрицы.
+
+        Каждой проходимой ячейке присваивается очередной номер вершины, после чего
+        она связывается с уже пронумерованными соседями слева и сверху; обратные
+        связи записываются в слоты этих соседей.
         """
-        matrix = self.__matrix
-        points = [(point[0], point[1] - 1),
-                  (point[0] + 1, point[1]),
-                  (point[0], point[1] + 1),
-                  (point[0] - 1, point[1])]
-        points = [p for p in points if 0 <= p[0] < matrix.width and 0 <= p[1] < matrix.height]
-
-        return [self.get_vertex(*p) for p in points if self.get_vertex(*p) and matrix.get(*p) == self.__maze_zero_char]
+        height = self.__height
+        zero_code = self.__matrix.code_of(self.__maze_zero_char)
+        cell_vertices = self.__cell_vertices
+        vertex_cells = self.__vertex_cells
+        adjacency = self.__adjacency
+        empty_slots = array("i", [-1]) * MatrixGraph.NEIGHBOUR_SLOTS
+
+        for cell, code in enumerate(self.__matrix.cells):
+            if code != zero_code:
+                continue
+
+            vertex = len(vertex_cells)
+            cell_vertices[cell] = vertex
+            vertex_cells.append(cell)
+            adjacency.extend(empty_slots)
+            slots = vertex * MatrixGraph.NEIGHBOUR_SLOTS
+
+            up = cell_vertices[cell - 1] if cell % height > 0 else -1
+            if up >= 0:
+                adjacency[slots + MatrixGraph.UP_SLOT] = up
+                adjacency[up * MatrixGraph.NEIGHBOUR_SLOTS + MatrixGraph.DOWN_SLOT] = vertex
+
+            left = cell_vertices[cell - height] if cell >= height else -1
+            if left >= 0:
+                adjacency[slots + MatrixGraph.LEFT_SLOT] = left
+                adjacency[left * MatrixGraph.NEIGHBOUR_SLOTS + MatrixGraph.RIGHT_SLOT] = vertex
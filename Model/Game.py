@@ -1,56 +1,120 @@
-import keyboard
+import asyncio
+import os
 import random
 import sys
+from typing import Callable
 
 from Model.LevelGeneration.MatrixPathBuilder import MatrixPathBuilder
 from Model.Character.MatrixCharacter import MatrixCharacter
 from Model.Menu.Menu import Menu
+from Model.Render.Camera import Camera
+from Model.Render.FrameDiffRenderer import FrameDiffRenderer
+from Model.Render.MiniMap import MiniMap
 from Model.Render.Renderer import Renderer
 from View.MatrixCharacterView import MatrixCharacterView
-from Model.Dijkstra.MatrixGraph import MatrixGraph
 from Model.LevelGeneration.Matrix import Matrix
-from Model.Dijkstra.Dijkstra import Dijkstra
+from Model.Input.Backends.InputBackend import InputBackend
+from Model.Input.Backends.KeyboardInputBackend import KeyboardInputBackend
+from Model.Input.Backends.TerminalInputBackend import TerminalInputBackend
+from Model.Input.InputLoop import InputLoop
 from Model.Input.KeyBinds import MOVE_BINDS
 from Model.LevelGeneration.Maze import Maze
+from Model.LevelGeneration.EndlessMaze import EndlessMaze
+from Model.LevelGeneration.LevelPrefetcher import LevelPrefetcher
+from Model.LevelGeneration.Generators.MazeGenerator import MazeGenerator
+from Model.LevelPack.LevelPack import LevelPack
+from Model.LevelGeneration.Generators.BacktrackerGenerator import BacktrackerGenerator
+from Model.LevelGeneration.Generators.PrimGenerator import PrimGenerator
+from Model.LevelGeneration.Generators.KruskalGenerator import KruskalGenerator
+from Model.LevelGeneration.Generators.WilsonGenerator import WilsonGenerator
+from Model.LevelGeneration.Generators.EllerGenerator import EllerGenerator
 from View.MenuView import MenuView
+from View.EndlessMazeView import EndlessMazeView
 from Model.colors import Color
+from Model.Profiling.Profiler import Profiler
 
 
 class Game:
     """
     Основной класс игры, управляющий игровым процессом, меню и уровнями.
     """
-    def __init__(self) -> None:
+    def __init__(self, level_pack: LevelPack | None = None, input_backend: InputBackend | None = None) -> None:
         """
         Инициализирует игру, устанавливая начальные значения для размеров лабиринта,
         сложности и других игровых параметров.
+
+        Args:
+            level_pack: Необязательный набор готовых уровней; если задан, уровни
+                берутся из него по порядку вместо генерации.
+            input_backend: Бэкенд ввода; по умолчанию в Windows используется библиотека
+                keyboard, в остальных системах - стандартный ввод терминала.
         """
         self.HARD_LEVEL_SIZE_INCREASE = 5
         self.EASY_LEVEL_SIZE_INCREASE = 3
-        self.MAZE_ONE = Color.color_str_back_to_rgb("  ", 46, 222, 16)
-        self.MAZE_CHARACTER = Color.color_str_back_to_rgb("🙂 ", 21, 54, 17)
-        self.MAZE_ZERO = Color.color_str_back_to_rgb("  ", 21, 54, 17)
-        self.MAZE_UNKNOWN = Color.color_str_back_to_rgb("  ", 20, 20, 20)
+        self.HARD_EXITS_COUNT = 1
+        self.EASY_EXITS_COUNT = 3
+        self.ANIMATE_GENERATION = False
+        self.FRAME_RATE = 60
+        self.ENDLESS_MAZE_WIDTH = 31
+        self.ENDLESS_VIEW_HEIGHT = 21
+        self.HINT_STEPS = 5
+        self.HUD_ROWS = 3
+        self.GENERATORS = [BacktrackerGenerator(),
+                           PrimGenerator(),
+                           KruskalGenerator(),
+                           WilsonGenerator(),
+                           EllerGenerator()]
+        self.MAZE_UNKNOWN, self.MAZE_ZERO, self.MAZE_CHARACTER, self.MAZE_ONE, self.MAZE_HINT = (
+            Color.compile_back_palette([("  ", 20, 20, 20),
+                                        ("  ", 21, 54, 17),
+                                        ("🙂 ", 21, 54, 17),
+                                        ("  ", 46, 222, 16),
+                                        ("  ", 150, 120, 30)]))
 
         self.__level_size_increase = 3
+        self.__exits_count = self.HARD_EXITS_COUNT
         self.__easy_mode = False
+        self.__hint_mode = False
+        self.__minimap_mode = False
+        self.__generator = self.GENERATORS[0]
         self.__maze_height = 8
         self.__maze_width = 8
+        self.__prefetcher = LevelPrefetcher(self.__build_level)
+        self.__level_pack = level_pack
+        if input_backend is None:
+            input_backend = KeyboardInputBackend() if os.name == "nt" else TerminalInputBackend()
+        self.__input_loop = InputLoop(self.FRAME_RATE, input_backend)
+        self.__pack_level = 0
         self.__current_window = self.__main_menu
 
     def play(self) -> None:
         """
         Запускает основной игровой цикл, который продолжается до выхода из игры.
         """
-        while True:
-            self.__current_window()
+        asyncio.run(self.__run())
+
+    async def __run(self) -> None:
+        """
+        Показывает экраны игры в цикле событий asyncio, пока игрок не выйдет.
+        """
+        self.__input_loop.start()
+        try:
+            while True:
+                await self.__current_window()
+        finally:
+            self.__prefetcher.close()
+            self.__input_loop.stop()
 
-    def __main_menu(self) -> None:
+    async def __main_menu(self) -> None:
         """
         Отображает главное меню и обрабатывает выбор пользователя.
         """
         items = ["Играть",
+                 "Бесконечный коридор",
                  "Выбор сложности",
+                 "Алгоритм генерации",
+                 "Подсказки",
+                 "Мини-карта",
                  "Выйти"]
         game_name = Color.color_str_to_rgb("⛏ МАЙНКРАФТ КРИПЕР ЛАБИРИНТ ⛏", 40, 214, 34)
         banner = (f"╔══════════════════════════════════════════════════════════════════════════╗\n"
@@ -59,27 +123,33 @@ class Game:
 
         main_menu = Menu(items, MenuView(), banner)
 
-        match main_menu.get_selected_item():
+        match await main_menu.get_selected_item(self.__input_loop):
             case "Играть":
                 self.__current_window = self.__start_game_cycle
+            case "Бесконечный коридор":
+                self.__current_window = self.__start_endless_cycle
             case "Выйти":
                 sys.exit()
             case "Выбор сложности":
                 self.__current_window = self.__difficulty_settings
+            case "Алгоритм генерации":
+                self.__current_window = self.__generator_settings
+            case "Подсказки":
+                self.__current_window = self.__hint_settings
+            case "Мини-карта":
+                self.__current_window = self.__minimap_settings
 
-    def __win(self) -> None:
+    async def __win(self) -> None:
         """
         Отображает экран победы после прохождения уровня, показывая статистику
         и предлагая варианты для продолжения.
         """
-        graph = MatrixGraph(self.maze.to_matrix(), self.MAZE_ZERO)
-        Dijkstra(graph, self.enter_x, 0)
         banner = (f"╔══════════════════════════════════════════════════════════════════════════╗\n"
                   f"║                           УРОВЕНЬ ПРОЙДЕН                                ║\n"                             
                   f"╚══════════════════════════════════════════════════════════════════════════╝\n"
                   f"════════════════════════════════════════════════════════════════════════════\n"
                   f"Пройденное расстояние: {self.moves_counter}\n"
-                  f"Минимально возможное расстояние: {graph.get_vertex(*self.maze.exit_coordinate).distance}\n"
+                  f"Минимально возможное расстояние: {self.maze.optimal_distance()}\n"
                   f"════════════════════════════════════════════════════════════════════════════\n"
                   f"{self.maze.to_matrix().to_string()}\n"
                   f"════════════════════════════════════════════════════════════════════════════\n")
@@ -98,7 +168,7 @@ class Game:
         self.__maze_width += self.__level_size_increase
         self.__maze_height += self.__level_size_increase
 
-        match menu.get_selected_item():
+        match await menu.get_selected_item(self.__input_loop):
             case "Вернуться в главное меню":
                 self.__current_window = self.__main_menu
             case "Выйти":
@@ -106,7 +176,7 @@ class Game:
             case "Перейти на следующий уровень":
                 self.__current_window = self.__start_game_cycle
 
-    def __difficulty_settings(self) -> None:
+    async def __difficulty_settings(self) -> None:
         """
         Отображает меню выбора сложности и обновляет соответствующие настройки игры.
         """
@@ -119,32 +189,136 @@ class Game:
 
         main_menu = Menu(items, MenuView(), banner)
 
-        match main_menu.get_selected_item():
+        match await main_menu.get_selected_item(self.__input_loop):
             case "Легко":
                 self.__level_size_increase = self.EASY_LEVEL_SIZE_INCREASE
+                self.__exits_count = self.EASY_EXITS_COUNT
                 self.__easy_mode = True
             case "Сложно":
                 self.__level_size_increase = self.HARD_LEVEL_SIZE_INCREASE
+                self.__exits_count = self.HARD_EXITS_COUNT
                 self.__easy_mode = False
 
         self.__current_window = self.__main_menu
 
-    def __start_game_cycle(self) -> None:
+    async def __generator_settings(self) -> None:
+        """
+        Отображает меню выбора алгоритма генерации лабиринта и запоминает выбор.
+        """
+        items = [generator.NAME for generator in self.GENERATORS]
+
+        banner = ("╔══════════════════════════════════════════════════════════════════════════╗\n"
+                  "║                         АЛГОРИТМ ГЕНЕРАЦИИ                               ║\n"
+                  "╚══════════════════════════════════════════════════════════════════════════╝\n")
+
+        generator_menu = Menu(items, MenuView(), banner)
+        selected_item = await generator_menu.get_selected_item(self.__input_loop)
+        self.__generator = self.GENERATORS[items.index(selected_item)]
+
+        self.__current_window = self.__main_menu
+
+    async def __hint_settings(self) -> None:
+        """
+        Отображает меню режима подсказок, в котором на карте показываются
+        следующие HINT_STEPS шагов кратчайшего пути до выхода.
+        """
+        items = ["Включить",
+                 "Выключить"]
+
+        banner = ("╔══════════════════════════════════════════════════════════════════════════╗\n"
+                  "║                              ПОДСКАЗКИ                                   ║\n"
+                  "╚══════════════════════════════════════════════════════════════════════════╝\n")
+
+        hint_menu = Menu(items, MenuView(), banner)
+        self.__hint_mode = await hint_menu.get_selected_item(self.__input_loop) == "Включить"
+
+        self.__current_window = self.__main_menu
+
+    async def __minimap_settings(self) -> None:
+        """
+        Отображает меню мини-карты, которая показывает рядом с окном просмотра
+        схему всего уровня с исследованными областями и положением персонажа.
+        """
+        items = ["Включить",
+                 "Выключить"]
+
+        banner = ("╔══════════════════════════════════════════════════════════════════════════╗\n"
+                  "║                              МИНИ-КАРТА                                  ║\n"
+                  "╚══════════════════════════════════════════════════════════════════════════╝\n")
+
+        minimap_menu = Menu(items, MenuView(), banner)
+        self.__minimap_mode = await minimap_menu.get_selected_item(self.__input_loop) == "Включить"
+
+        self.__current_window = self.__main_menu
+
+    @staticmethod
+    def __draw_generation_step(matrix: Matrix) -> None:
+        """
+        Отрисовывает промежуточное состояние лабиринта во время генерации.
+
+        Args:
+            matrix: Матрица строящегося лабиринта.
+        """
+        Renderer.clear()
+        matrix.print_matrix()
+        Renderer.flush()
+
+    def __build_level(self, width: int, height: int, generator: MazeGenerator, exits_count: int,
+                      on_step: Callable[[Matrix], None] | None = None) -> Maze:
+        """
+        Генерирует лабиринт уровня со случайным входом в верхней стене.
+
+        Args:
+            width: Ширина лабиринта.
+            height: Высота лабиринта.
+            generator: Стратегия генерации.
+            exits_count: Количество выходов.
+            on_step: Необязательный обработчик, получающий матрицу после каждого шага генерации.
+        """
+        enter_x = random.randrange(1, width - 1)
+        path_builder = MatrixPathBuilder(enter_x, 0, Matrix(width, height, self.MAZE_ONE, self.MAZE_ZERO))
+        return Maze(path_builder, exits_count, on_step, generator)
+
+    async def __start_game_cycle(self) -> None:
         """
         Инициализирует и запускает игровой цикл для нового уровня, создавая лабиринт,
         персонажа и обрабатывая вводы пользователя до достижения цели.
+
+        Лабиринт берётся у предзагрузчика, а сразу после старта уровня заказывается
+        генерация следующего, чтобы переход на него был мгновенным. При анимации
+        генерации уровень строится синхронно, чтобы показать её на экране.
+        Если задан набор уровней, очередной уровень читается из него по кругу.
+        На экран выводится окно по размеру терминала, которое следует за персонажем.
+        Под окном резервируются HUD_ROWS строк состояния и ещё одна строка, на которую
+        переходит курсор после перевода строки в последней из них, чтобы экран не прокручивался.
         """
-        self.enter_x = random.randrange(1, self.__maze_width - 1)
-        self.path_builder = MatrixPathBuilder(self.enter_x, 0,
-                                              Matrix(self.__maze_width,
-                                                     self.__maze_height,
-                                                     self.MAZE_ONE,
-                                                     self.MAZE_ZERO))
-        self.maze = Maze(self.path_builder, 1)
-        self.character_view = MatrixCharacterView(self.maze.to_matrix(),
+        with Profiler.measure("generation"):
+            if self.__level_pack is not None:
+                record = self.__level_pack[self.__pack_level % len(self.__level_pack)]
+                self.__pack_level += 1
+                self.maze = Maze.from_record(record, self.MAZE_ONE, self.MAZE_ZERO)
+            elif self.ANIMATE_GENERATION:
+                self.maze = self.__build_level(self.__maze_width, self.__maze_height, self.__generator,
+                                               self.__exits_count, self.__draw_generation_step)
+            else:
+                self.maze = self.__prefetcher.take(self.__maze_width, self.__maze_height, self.__generator,
+                                                   self.__exits_count)
+                self.__prefetcher.prefetch(self.__maze_width + self.__level_size_increase,
+                                           self.__maze_height + self.__level_size_increase,
+                                           self.__generator,
+                                           self.__exits_count)
+        self.enter_x = self.maze.entrance_coordinate[0]
+        matrix = self.maze.to_matrix()
+        camera = Camera.for_terminal(matrix.width, matrix.height, FrameDiffRenderer.CELL_WIDTH, self.HUD_ROWS + 1,
+                                     MiniMap.reserved_columns() if self.__minimap_mode else 0)
+        minimap = MiniMap(matrix.width, matrix.height, camera.rows) if self.__minimap_mode else None
+        self.character_view = MatrixCharacterView(matrix,
                                                   self.MAZE_UNKNOWN,
                                                   self.MAZE_ZERO,
-                                                  self.MAZE_CHARACTER)
+                                                  self.MAZE_CHARACTER,
+                                                  self.MAZE_HINT,
+                                                  camera,
+                                                  minimap)
 
         self.character = MatrixCharacter(self.maze.to_matrix(),
                                          self.character_view,
@@ -153,24 +327,92 @@ class Game:
                                          self.MAZE_ONE)
 
         self.moves_counter = 0
+        self.__render_level_frame()
+
+        while not self.maze.is_exit(*self.character.position):
 
-        while self.character.position != self.maze.exit_coordinate:
+            with Profiler.measure("input_wait"):
+                keys = await self.__input_loop.next_batch()
 
-            user_input = keyboard.read_event()
+            if "esc" in keys:
+                sys.exit(0)
 
-            if user_input.event_type == keyboard.KEY_DOWN:
-                if user_input.name == "esc":
-                    sys.exit(0)
+            with Profiler.measure("frame"):
+                for key in keys:
+                    if key not in MOVE_BINDS or self.maze.is_exit(*self.character.position):
+                        continue
 
-                if self.character.allowed_move(MOVE_BINDS[user_input.name]):
-                    self.moves_counter += 1
+                    if self.character.allowed_move(MOVE_BINDS[key]):
+                        self.moves_counter += 1
 
-                self.character.try_move(MOVE_BINDS[user_input.name])
-                Renderer.render(f"Пройденное расстояние: {self.moves_counter}")
+                    self.character.try_move(MOVE_BINDS[key])
 
-                if self.__easy_mode:
-                    graph = MatrixGraph(self.maze.to_matrix(), self.MAZE_ZERO)
-                    Dijkstra(graph, *self.character.position)
-                    Renderer.render(f"Расстояние до выхода: {graph.get_vertex(*self.maze.exit_coordinate).distance}")
+                self.__render_level_frame()
 
         self.__current_window = self.__win
+
+    def __render_level_frame(self) -> None:
+        """
+        Выводит кадр уровня вместе со строками состояния и сбрасывает буфер терминала.
+        """
+        self.__show_hint()
+        self.character_view.render()
+        Renderer.render(f"Пройденное расстояние: {self.moves_counter}")
+
+        if self.__easy_mode:
+            Renderer.render(f"Расстояние до ближайшего выхода: {self.maze.distance_to_exit(*self.character.position)}")
+
+        if Profiler.enabled:
+            Renderer.render(Profiler.overlay())
+
+        Renderer.flush()
+
+    def __show_hint(self) -> None:
+        """
+        Показывает следующие шаги кратчайшего пути до выхода, если включён режим подсказок.
+        """
+        if self.__hint_mode:
+            self.character_view.show_hint(self.maze.route_to_exit(*self.character.position, self.HINT_STEPS))
+
+    async def __start_endless_cycle(self) -> None:
+        """
+        Запускает режим «бесконечный коридор»: лабиринт порождается строка за строкой
+        по мере спуска персонажа, а в памяти хранится только окно вокруг него.
+        Выход в главное меню - по клавише esc.
+        """
+        maze = EndlessMaze(self.ENDLESS_MAZE_WIDTH,
+                           self.MAZE_ONE,
+                           self.MAZE_ZERO,
+                           self.ENDLESS_VIEW_HEIGHT,
+                           self.ENDLESS_VIEW_HEIGHT)
+        view = EndlessMazeView(maze, self.MAZE_CHARACTER, self.ENDLESS_VIEW_HEIGHT)
+        character = MatrixCharacter(maze,
+                                    view,
+                                    maze.entrance_x,
+                                    0,
+                                    self.MAZE_ONE)
+        max_depth = 0
+        view.render()
+
+        while True:
+            with Profiler.measure("input_wait"):
+                keys = await self.__input_loop.next_batch()
+
+            if "esc" in keys:
+                break
+
+            with Profiler.measure("frame"):
+                for key in keys:
+                    if key in MOVE_BINDS:
+                        character.try_move(MOVE_BINDS[key])
+                        max_depth = max(max_depth, character.position[1])
+
+                view.render()
+                Renderer.render(f"Глубина: {max_depth}")
+
+                if Profiler.enabled:
+                    Renderer.render(Profiler.overlay())
+
+                Renderer.flush()
+
+        self.__current_window = self.__main_menu
@@ -0,0 +1,28 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Callable
+
+
+class InputBackend(ABC):
+    """
+    Абстрактный источник нажатий клавиш для InputLoop.
+
+    Бэкенд передаёт в цикл событий только нажатия (не отпускания) в виде имён
+    клавиш в формате библиотеки keyboard: "up", "down", "left", "right",
+    "enter", "esc" или сам символ для остальных клавиш.
+    """
+    @abstractmethod
+    def start(self, loop: asyncio.AbstractEventLoop, on_key: Callable[[str], None]) -> None:
+        """
+        Начинает передавать нажатия клавиш.
+
+        Args:
+            loop: Работающий цикл событий; on_key должен вызываться в его потоке.
+            on_key: Обработчик, получающий имя нажатой клавиши.
+        """
+
+    @abstractmethod
+    def stop(self) -> None:
+        """
+        Прекращает передавать нажатия и возвращает устройство ввода в исходное состояние.
+        """
@@ -0,0 +1,107 @@
+class KeyDecoder:
+    """
+    Переводит байты, прочитанные из терминала, в имена клавиш.
+
+    Стрелки и другие специальные клавиши приходят управляющими
+    последовательностями, начинающимися с ESC. Последовательность может прийти
+    по частям, поэтому незавершённый хвост сохраняется до следующего вызова feed.
+    Одиночный ESC неотличим от начала последовательности, пока не истечёт
+    небольшая пауза, - по её окончании вызывающий код вызывает flush. Уже
+    начатая последовательность (ESC [ или ESC O) паузой не прерывается: при
+    вводе по сети её конец может прийти заметно позже, а считать её нажатием
+    ESC нельзя - ESC завершает игру.
+    """
+    ESCAPE = "\x1b"
+    SEQUENCE_PREFIXES = "[O"
+    SEQUENCES = {
+        "\x1b[A": "up",
+        "\x1b[B": "down",
+        "\x1b[C": "right",
+        "\x1b[D": "left",
+        "\x1bOA": "up",
+        "\x1bOB": "down",
+        "\x1bOC": "right",
+        "\x1bOD": "left",
+        "\x1b[H": "home",
+        "\x1b[F": "end",
+        "\x1b[3~": "delete",
+    }
+    KEYS = {
+        "\r": "enter",
+        "\n": "enter",
+        "\t": "tab",
+        " ": "space",
+        "\x7f": "backspace",
+    }
+
+    def __init__(self) -> None:
+        """
+        Инициализирует декодер с пустым хвостом.
+        """
+        self.__pending = ""
+
+    @property
+    def has_pending(self) -> bool:
+        """
+        Возвращает True, если сохранён незавершённый ESC или последовательность.
+        """
+        return bool(self.__pending)
+
+    def feed(self, text: str) -> list[str]:
+        """
+        Декодирует очередную порцию ввода.
+
+        Неизвестные управляющие последовательности пропускаются целиком.
+
+        Args:
+            text: Прочитанные символы.
+
+        Returns:
+            Имена клавиш в порядке нажатия.
+        """
+        text = self.__pending + text
+        self.__pending = ""
+        keys = []
+        index = 0
+
+        while index < len(text):
+            char = text[index]
+            if char != KeyDecoder.ESCAPE:
+                keys.append(KeyDecoder.KEYS.get(char, char))
+                index += 1
+                continue
+
+            if index + 1 == len(text):
+                self.__pending = text[index:]
+                break
+            if text[index + 1] not in KeyDecoder.SEQUENCE_PREFIXES:
+                keys.append("esc")
+                index += 1
+                continue
+
+            end = index + 2
+            while end < len(text) and not "\x40" <= text[end] <= "\x7e":
+                end += 1
+            if end == len(text):
+                self.__pending = text[index:]
+                break
+
+            name = KeyDecoder.SEQUENCES.get(text[index:end + 1])
+            if name is not None:
+                keys.append(name)
+            index = end + 1
+
+        return keys
+
+    def flush(self) -> list[str]:
+        """
+        Завершает ожидание продолжения после одиночного ESC: он считается нажатием
+        ESC. Начатая последовательность остаётся сохранённой до следующего вызова feed.
+
+        Returns:
+            Имена клавиш из сохранённого хвоста.
+        """
+        if self.__pending != KeyDecoder.ESCAPE:
+            return []
+        self.__pending = ""
+        return ["esc"]
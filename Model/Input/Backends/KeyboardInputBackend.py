@@ -0,0 +1,46 @@
+import asyncio
+from typing import Callable
+
+from Model.Input.Backends.InputBackend import InputBackend
+
+
+class KeyboardInputBackend(InputBackend):
+    """
+    Источник нажатий на основе библиотеки keyboard.
+
+    Работает в Windows без дополнительных прав; в Linux библиотека читает
+    глобальные события устройств и требует прав root. События приходят
+    из потока библиотеки и передаются в цикл событий потокобезопасно.
+    Библиотека импортируется только при запуске бэкенда.
+    """
+    def __init__(self) -> None:
+        """
+        Инициализирует бэкенд.
+        """
+        self.__keyboard = None
+        self.__hook = None
+
+    def start(self, loop: asyncio.AbstractEventLoop, on_key: Callable[[str], None]) -> None:
+        """
+        Подписывается на события клавиатуры.
+
+        Args:
+            loop: Работающий цикл событий.
+            on_key: Обработчик, получающий имя нажатой клавиши.
+        """
+        import keyboard
+
+        def on_event(event) -> None:
+            if event.event_type == keyboard.KEY_DOWN:
+                loop.call_soon_threadsafe(on_key, event.name)
+
+        self.__keyboard = keyboard
+        self.__hook = keyboard.hook(on_event)
+
+    def stop(self) -> None:
+        """
+        Отписывается от событий клавиатуры.
+        """
+        if self.__hook is not None:
+            self.__keyboard.unhook(self.__hook)
+            self.__hook = None
@@ -0,0 +1,100 @@
+import asyncio
+import codecs
+import os
+import sys
+from typing import Callable, TextIO
+
+from Model.Input.Backends.InputBackend import InputBackend
+from Model.Input.Backends.KeyDecoder import KeyDecoder
+
+
+class TerminalInputBackend(InputBackend):
+    """
+    Источник нажатий, читающий стандартный ввод терминала в режиме cbreak.
+
+    Не требует прав root и доступа к устройствам: терминал переводится
+    в посимвольный режим без эха через termios, а цикл событий следит за
+    дескриптором ввода через селектор (loop.add_reader) и читает только
+    готовые байты, не блокируясь. Управляющие последовательности стрелок
+    декодирует KeyDecoder. Работает в Linux и macOS; модули termios и tty
+    импортируются только при запуске бэкенда.
+    """
+    ESCAPE_TIMEOUT = 0.1
+    READ_SIZE = 1024
+
+    def __init__(self, stream: TextIO | None = None) -> None:
+        """
+        Инициализирует бэкенд.
+
+        Args:
+            stream: Поток ввода терминала; по умолчанию sys.stdin.
+        """
+        self.__stream = stream
+        self.__decoder = KeyDecoder()
+        self.__text_decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__on_key: Callable[[str], None] | None = None
+        self.__descriptor: int | None = None
+        self.__attributes = None
+        self.__escape_timer: asyncio.TimerHandle | None = None
+
+    def start(self, loop: asyncio.AbstractEventLoop, on_key: Callable[[str], None]) -> None:
+        """
+        Переводит терминал в режим cbreak и начинает следить за вводом.
+
+        Args:
+            loop: Работающий цикл событий.
+            on_key: Обработчик, получающий имя нажатой клавиши.
+        """
+        import termios
+        import tty
+
+        self.__loop = loop
+        self.__on_key = on_key
+        self.__descriptor = (self.__stream or sys.stdin).fileno()
+        self.__attributes = termios.tcgetattr(self.__descriptor)
+        tty.setcbreak(self.__descriptor)
+        loop.add_reader(self.__descriptor, self.__read)
+
+    def stop(self) -> None:
+        """
+        Прекращает следить за вводом и восстанавливает настройки терминала.
+        """
+        if self.__descriptor is None:
+            return
+
+        import termios
+
+        if self.__escape_timer is not None:
+            self.__escape_timer.cancel()
+            self.__escape_timer = None
+        self.__loop.remove_reader(self.__descriptor)
+        termios.tcsetattr(self.__descriptor, termios.TCSADRAIN, self.__attributes)
+        self.__descriptor = None
+
+    def __read(self) -> None:
+        """
+        Читает готовые байты ввода и передаёт декодированные нажатия обработчику.
+        """
+        data = os.read(self.__descriptor, TerminalInputBackend.READ_SIZE)
+        if not data:
+            self.__loop.remove_reader(self.__descriptor)
+            return
+
+        if self.__escape_timer is not None:
+            self.__escape_timer.cancel()
+            self.__escape_timer = None
+
+        for key in self.__decoder.feed(self.__text_decoder.decode(data)):
+            self.__on_key(key)
+
+        if self.__decoder.has_pending:
+            self.__escape_timer = self.__loop.call_later(TerminalInputBackend.ESCAPE_TIMEOUT, self.__flush_escape)
+
+    def __flush_escape(self) -> None:
+        """
+        Считает одиночный ESC нажатием клавиши ESC после паузы.
+        """
+        self.__escape_timer = None
+        for key in self.__decoder.flush():
+            self.__on_key(key)
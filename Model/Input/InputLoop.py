@@ -0,0 +1,60 @@
+import asyncio
+
+from Model.Input.Backends.InputBackend import InputBackend
+
+
+class InputLoop:
+    """
+    Асинхронный источник нажатий клавиш для игрового цикла на asyncio.
+
+    Нажатия приходят от бэкенда ввода и складываются в очередь цикла событий.
+    Метод next_batch отдаёт все накопившиеся нажатия одним пакетом не чаще
+    одного раза за кадр, поэтому при зажатой клавише автоповтор не копит
+    очередь и задержка между нажатием и кадром не превышает одного кадра.
+    """
+    def __init__(self, frame_rate: int, backend: InputBackend) -> None:
+        """
+        Инициализирует источник ввода.
+
+        Args:
+            frame_rate: Максимальное количество кадров (пакетов ввода) в секунду.
+            backend: Бэкенд, поставляющий нажатия клавиш.
+        """
+        self.__frame_interval = 1 / frame_rate
+        self.__backend = backend
+        self.__queue: asyncio.Queue[str] | None = None
+        self.__last_batch_time = 0.0
+
+    def start(self) -> None:
+        """
+        Запускает бэкенд ввода. Вызывается внутри работающего цикла событий.
+        """
+        self.__queue = asyncio.Queue()
+        self.__backend.start(asyncio.get_running_loop(), self.__queue.put_nowait)
+
+    def stop(self) -> None:
+        """
+        Останавливает бэкенд ввода.
+        """
+        self.__backend.stop()
+
+    async def next_batch(self) -> list[str]:
+        """
+        Ожидает нажатия и возвращает имена всех клавиш, нажатых с прошлого пакета.
+
+        Если с прошлого пакета не прошёл интервал кадра, сначала дожидается его,
+        чтобы собрать нажатия за это время в один пакет.
+
+        Returns:
+            Непустой список имён клавиш в порядке нажатия.
+        """
+        loop = asyncio.get_running_loop()
+        delay = self.__last_batch_time + self.__frame_interval - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        keys = [await self.__queue.get()]
+        while not self.__queue.empty():
+            keys.append(self.__queue.get_nowait())
+        self.__last_batch_time = loop.time()
+        return keys
@@ -1,8 +1,6 @@
 """
 Этот модуль определяет привязки клавиш для управления движением и меню в игре.
 """
-import keyboard
-
 from Model.Input.InputEnums import *
 
 MOVE_BINDS = {
@@ -0,0 +1,209 @@
+import sys
+from collections import deque
+from typing import Any
+
+from Model.LevelGeneration.Generators.EllerGenerator import EllerGenerator
+from Model.Render.AnsiEncoder import AnsiEncoder
+
+
+class EndlessMaze:
+    """
+    Бесконечный вниз лабиринт фиксированной ширины для режима «бесконечный коридор».
+
+    Строки лабиринта порождаются лениво потоковым алгоритмом Эллера. В памяти
+    хранится только скользящее окно строк вокруг игрока: строки, ушедшие выше
+    окна, удаляются и дальше считаются стенами. Поэтому расход памяти не зависит
+    от того, как глубоко спустился игрок.
+
+    Путь вниз из кармана лабиринта Эллера может подниматься выше окна. Строка
+    удаляется, только если из клетки игрока можно дойти до последней порождённой
+    строки, не заходя в неё, иначе игрок оказался бы заперт. В таком случае окно
+    временно растёт, пока множества Эллера ниже не соединятся.
+
+    Предоставляет те же методы чтения, что и Matrix (width, height, get, get_code,
+    code_of), поэтому по нему может перемещаться MatrixCharacter.
+    """
+    ZERO_CODE = 0
+    ONE_CODE = 1
+
+    def __init__(self, width: int, one_symbol: Any, zero_symbol: Any, rows_behind: int, rows_ahead: int) -> None:
+        """
+        Инициализирует бесконечный лабиринт и порождает первые строки.
+
+        Args:
+            width: Ширина лабиринта вместе с боковыми стенами.
+            one_symbol: Символ стены.
+            zero_symbol: Символ проходимой ячейки.
+            rows_behind: Сколько строк выше игрока хранить в окне.
+            rows_ahead: Сколько строк ниже игрока порождать заранее.
+        """
+        self.__width = width
+        self.__palette = [zero_symbol, one_symbol]
+        self.__encoder = AnsiEncoder(self.__palette)
+        self.__rows_behind = rows_behind
+        self.__rows_ahead = rows_ahead
+        self.__columns = len(range(1, width - 1, 2))
+        self.__rows = EllerGenerator().rows(self.__columns)
+        self.__window: deque[bytearray] = deque()
+        self.__first_row = 0
+
+        entrance_row = bytearray([EndlessMaze.ONE_CODE]) * width
+        entrance_row[self.entrance_x] = EndlessMaze.ZERO_CODE
+        self.__window.append(entrance_row)
+        self.scroll_to(self.entrance_x, 0)
+
+    @property
+    def width(self) -> int:
+        """
+        Возвращает ширину лабиринта.
+        """
+        return self.__width
+
+    @property
+    def height(self) -> int:
+        """
+        Возвращает высоту лабиринта; лабиринт не ограничен снизу.
+        """
+        return sys.maxsize
+
+    @property
+    def entrance_x(self) -> int:
+        """
+        Возвращает координату X входа в верхней строке.
+        """
+        return 1
+
+    @property
+    def first_row(self) -> int:
+        """
+        Возвращает координату Y первой строки, хранящейся в окне.
+        """
+        return self.__first_row
+
+    @property
+    def last_row(self) -> int:
+        """
+        Возвращает координату Y последней порождённой строки.
+        """
+        return self.__first_row + len(self.__window) - 1
+
+    @property
+    def palette(self) -> list[Any]:
+        """
+        Возвращает палитру лабиринта: символ с кодом c хранится по индексу c.
+        Список предназначен только для чтения.
+        """
+        return self.__palette
+
+    def code_of(self, symbol: Any) -> int:
+        """
+        Возвращает код символа стены или проходимой ячейки.
+
+        Args:
+            symbol: Символ, код которого нужно получить.
+
+        Raises:
+            ValueError: Если символ не является ни стеной, ни проходимой ячейкой.
+        """
+        return self.__palette.index(symbol)
+
+    def get_code(self, x: int, y: int) -> int:
+        """
+        Возвращает код ячейки (x, y), при необходимости порождая недостающие строки.
+        Строки, удалённые из окна, считаются стенами.
+
+        Args:
+            x: Координата по оси X.
+            y: Координата по оси Y.
+        """
+        if y < self.__first_row:
+            return EndlessMaze.ONE_CODE
+        self.__generate_until(y)
+        return self.__window[y - self.__first_row][x]
+
+    def get(self, x: int, y: int) -> Any:
+        """
+        Возвращает символ ячейки (x, y).
+
+        Args:
+            x: Координата по оси X.
+            y: Координата по оси Y.
+        """
+        return self.__palette[self.get_code(x, y)]
+
+    def row_to_string(self, y: int) -> str:
+        """
+        Возвращает строку y лабиринта в виде символов, склеенных через AnsiEncoder.
+
+        Args:
+            y: Координата строки по оси Y.
+        """
+        if y < self.__first_row:
+            return self.__encoder.encode(bytes([EndlessMaze.ONE_CODE]) * self.__width)
+        self.__generate_until(y)
+        return self.__encoder.encode(self.__window[y - self.__first_row])
+
+    def scroll_to(self, x: int, y: int) -> None:
+        """
+        Сдвигает окно к игроку: порождает строки ниже него и удаляет строки,
+        ушедшие выше окна, если без них игрок по-прежнему может спуститься.
+
+        Args:
+            x: Координата X игрока.
+            y: Координата Y строки, на которой находится игрок.
+        """
+        self.__generate_until(y + self.__rows_ahead)
+        while self.__first_row < y - self.__rows_behind and self.__reaches_last_row(x, y, self.__first_row + 1):
+            self.__window.popleft()
+            self.__first_row += 1
+
+    def __reaches_last_row(self, x: int, y: int, top: int) -> bool:
+        """
+        Проверяет поиском в ширину, можно ли из клетки (x, y) дойти до последней
+        порождённой строки, не поднимаясь выше строки top.
+
+        Args:
+            x: Координата X начальной клетки.
+            y: Координата Y начальной клетки.
+            top: Координата Y самой верхней строки, по которой можно идти.
+        """
+        window = self.__window
+        first_row = self.__first_row
+        last_row = self.last_row
+        visited = {(x, y)}
+        queue = deque(visited)
+        while queue:
+            cell_x, cell_y = queue.popleft()
+            if cell_y == last_row:
+                return True
+            for next_x, next_y in ((cell_x, cell_y + 1), (cell_x - 1, cell_y),
+                                   (cell_x + 1, cell_y), (cell_x, cell_y - 1)):
+                if (top <= next_y <= last_row and 0 <= next_x < self.__width and (next_x, next_y) not in visited
+                        and window[next_y - first_row][next_x] == EndlessMaze.ZERO_CODE):
+                    visited.add((next_x, next_y))
+                    queue.append((next_x, next_y))
+        return False
+
+    def __generate_until(self, y: int) -> None:
+        """
+        Порождает строки лабиринта, пока не будет построена строка y.
+
+        Каждая строка алгоритма Эллера даёт две строки матрицы: строку клеток
+        с горизонтальными проходами и строку вертикальных проходов.
+
+        Args:
+            y: Координата Y строки, которая должна быть построена.
+        """
+        while self.last_row < y:
+            right, down = next(self.__rows)
+            cells_row = bytearray([EndlessMaze.ONE_CODE]) * self.__width
+            passages_row = bytearray([EndlessMaze.ONE_CODE]) * self.__width
+            for column in range(self.__columns):
+                x = 1 + 2 * column
+                cells_row[x] = EndlessMaze.ZERO_CODE
+                if column < self.__columns - 1 and right[column]:
+                    cells_row[x + 1] = EndlessMaze.ZERO_CODE
+                if down[column]:
+                    passages_row[x] = EndlessMaze.ZERO_CODE
+            self.__window.append(cells_row)
+            self.__window.append(passages_row)
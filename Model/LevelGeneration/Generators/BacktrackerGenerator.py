@@ -0,0 +1,61 @@
+import random
+from typing import Callable
+
+from Model.LevelGeneration.Generators.MazeGenerator import MazeGenerator
+from Model.LevelGeneration.Matrix import Matrix
+from Model.LevelGeneration.MatrixPathBuilder import MatrixPathBuilder
+
+
+class BacktrackerGenerator(MazeGenerator):
+    """
+    Генерация итеративным поиском в глубину (алгоритм с возвратом).
+
+    Курсор строителя пути прокладывает коридор в случайном допустимом направлении,
+    а в тупике откатывается по traceback. Выходы открываются в тупиках у границы.
+    """
+    NAME = "Поиск в глубину"
+
+    def generate(self, path_builder: MatrixPathBuilder, exits_count: int,
+                 on_step: Callable[[Matrix], None] | None = None) -> list[tuple[int, int]]:
+        """
+        Генерирует лабиринт в матрице строителя пути.
+
+        Если случайный выбор тупиков не дал нужного количества выходов, недостающие
+        выходы открываются в запомненных тупиках у границы.
+
+        Args:
+            path_builder: Строитель пути, курсор которого стоит на входе в лабиринт.
+            exits_count: Количество выходов, которые нужно сгенерировать.
+            on_step: Необязательный обработчик прогресса, получающий матрицу после каждого шага.
+
+        Returns:
+            Список координат клеток, из которых открыт выход за границу уровня.
+        """
+        entrance = path_builder.get_cursor()
+        exits = []
+        exit_candidates = []
+
+        while path_builder.traceback:
+            directions = path_builder.allowed_build_directions()
+            if directions:
+                path_builder.build(1, random.choice(directions))
+            else:
+                cursor = path_builder.get_cursor()
+                if cursor != entrance and path_builder.can_make_exit():
+                    if len(exits) < exits_count and random.randint(0, len(exits) + 1) == 0:
+                        path_builder.try_make_exit()
+                        exits.append(cursor)
+                    else:
+                        exit_candidates.append(cursor)
+                path_builder.rollback()
+            if on_step:
+                on_step(path_builder.matrix)
+
+        random.shuffle(exit_candidates)
+        while len(exits) < exits_count and exit_candidates:
+            cursor = exit_candidates.pop()
+            path_builder.set_cursor(*cursor)
+            path_builder.try_make_exit()
+            exits.append(cursor)
+
+        return exits
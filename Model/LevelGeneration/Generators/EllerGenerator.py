@@ -0,0 +1,94 @@
+import random
+from typing import Iterator
+
+from Model.LevelGeneration.Generators.Lattice import Lattice
+from Model.LevelGeneration.Generators.LatticeMazeGenerator import LatticeMazeGenerator
+
+
+class EllerGenerator(LatticeMazeGenerator):
+    """
+    Генерация алгоритмом Эллера, строящим лабиринт строка за строкой.
+
+    В памяти хранится только разбиение текущей строки на множества, поэтому
+    расход памяти не зависит от высоты лабиринта. Метки множеств каждой строки
+    перенумеровываются в диапазон [0, columns).
+    """
+    NAME = "Алгоритм Эллера"
+
+    def _carve(self, lattice: Lattice, start_cell: int) -> None:
+        """
+        Соединяет все клетки решётки в остовное дерево.
+
+        Args:
+            lattice: Решётка клеток лабиринта.
+            start_cell: Номер клетки решётки, к которой подведён вход.
+        """
+        for row, (right, down) in enumerate(self.rows(lattice.columns, lattice.rows)):
+            for column in range(lattice.columns):
+                cell = lattice.cell_at(column, row)
+                lattice.carve_cell(cell)
+                if column < lattice.columns - 1 and right[column]:
+                    lattice.carve_passage(cell, lattice.cell_at(column + 1, row))
+                if down[column]:
+                    lattice.carve_passage(cell, cell + 1)
+            lattice.step()
+
+    def rows(self, columns: int, rows: int | None = None) -> Iterator[tuple[bytearray, bytearray]]:
+        """
+        Лениво порождает строки лабиринта шириной columns клеток.
+
+        Args:
+            columns: Количество клеток в строке.
+            rows: Количество строк. Если не задано, строки порождаются бесконечно,
+                и последняя строка никогда не замыкается.
+
+        Yields:
+            Пару (right, down): right[i] == 1, если клетка i соединена с клеткой i + 1
+            той же строки; down[i] == 1, если клетка i соединена с клеткой под ней.
+        """
+        sets = list(range(columns))
+        row = 0
+
+        while rows is None or row < rows:
+            last = rows is not None and row == rows - 1
+            parents = list(range(columns))
+            right = bytearray(max(columns - 1, 0))
+            for column in range(columns - 1):
+                root = self.__find(parents, sets[column])
+                neighbour_root = self.__find(parents, sets[column + 1])
+                if root != neighbour_root and (last or random.getrandbits(1)):
+                    parents[neighbour_root] = root
+                    right[column] = 1
+            sets = [self.__find(parents, label) for label in sets]
+
+            down = bytearray(columns)
+            if not last:
+                members: dict[int, list[int]] = {}
+                for column, label in enumerate(sets):
+                    members.setdefault(label, []).append(column)
+                for group in members.values():
+                    down[random.choice(group)] = 1
+                    for column in group:
+                        if random.getrandbits(1):
+                            down[column] = 1
+
+                kept = {sets[column] for column in range(columns) if down[column]}
+                free = (label for label in range(columns) if label not in kept)
+                sets = [sets[column] if down[column] else next(free) for column in range(columns)]
+
+            yield right, down
+            row += 1
+
+    @staticmethod
+    def __find(parents: list[int], label: int) -> int:
+        """
+        Возвращает корень множества метки, сокращая путь вдвое по ходу поиска.
+
+        Args:
+            parents: Список родителей меток текущей строки.
+            label: Метка множества.
+        """
+        while parents[label] != label:
+            parents[label] = parents[parents[label]]
+            label = parents[label]
+        return label
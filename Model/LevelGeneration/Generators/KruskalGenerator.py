@@ -0,0 +1,52 @@
+import random
+from array import array
+
+from Model.LevelGeneration.Generators.Lattice import Lattice
+from Model.LevelGeneration.Generators.LatticeMazeGenerator import LatticeMazeGenerator
+
+
+class KruskalGenerator(LatticeMazeGenerator):
+    """
+    Генерация рандомизированным алгоритмом Краскала.
+
+    Рёбра решётки перебираются в случайном порядке, ребро вырезается, если соединяет
+    разные компоненты. Компоненты хранятся в системе непересекающихся множеств
+    со сжатием путей.
+    """
+    NAME = "Алгоритм Краскала"
+
+    def _carve(self, lattice: Lattice, start_cell: int) -> None:
+        """
+        Соединяет все клетки решётки в остовное дерево.
+
+        Args:
+            lattice: Решётка клеток лабиринта.
+            start_cell: Номер клетки решётки, к которой подведён вход.
+        """
+        parents = array("i", range(lattice.size))
+        edges = [(cell, neighbour) for cell in range(lattice.size)
+                 for neighbour in lattice.neighbours(cell) if neighbour > cell]
+        random.shuffle(edges)
+        lattice.carve_cell(start_cell)
+
+        for cell, neighbour in edges:
+            root = self.__find(parents, cell)
+            neighbour_root = self.__find(parents, neighbour)
+            if root != neighbour_root:
+                parents[neighbour_root] = root
+                lattice.carve_passage(cell, neighbour)
+                lattice.step()
+
+    @staticmethod
+    def __find(parents: array, cell: int) -> int:
+        """
+        Возвращает корень множества клетки, сокращая путь вдвое по ходу поиска.
+
+        Args:
+            parents: Массив родителей системы непересекающихся множеств.
+            cell: Номер клетки решётки.
+        """
+        while parents[cell] != cell:
+            parents[cell] = parents[parents[cell]]
+            cell = parents[cell]
+        return cell
@@ -0,0 +1,195 @@
+import random
+from typing import Callable
+
+from Model.LevelGeneration.Matrix import Matrix
+
+
+class Lattice:
+    """
+    Решётка клеток лабиринта, вложенная в матрицу уровня.
+
+    Клетки решётки занимают каждую вторую ячейку матрицы внутри границ, а ячейки
+    между ними служат стенами, которые вырезаются при соединении соседних клеток.
+    Клетка (i, j) решётки имеет номер i * rows + j и координаты
+    (origin_x + 2 * i, 1 + 2 * j) в матрице. Столбцы выравниваются так, чтобы
+    вход в лабиринт попадал на столбец решётки.
+    """
+    def __init__(self, matrix: Matrix, start_x: int, on_step: Callable[[Matrix], None] | None = None) -> None:
+        """
+        Инициализирует решётку в матрице уровня.
+
+        Args:
+            matrix: Матрица уровня, в которой вырезаются проходы.
+            start_x: Координата X входа, по которой выравниваются столбцы решётки.
+            on_step: Необязательный обработчик прогресса, получающий матрицу после каждого шага.
+        """
+        self.__matrix = matrix
+        self.__on_step = on_step
+        self.__origin_x = 1 if start_x % 2 else 2
+        self.__columns = len(range(self.__origin_x, matrix.width - 1, 2))
+        self.__rows = len(range(1, matrix.height - 1, 2))
+
+    @property
+    def columns(self) -> int:
+        """
+        Возвращает количество столбцов решётки.
+        """
+        return self.__columns
+
+    @property
+    def rows(self) -> int:
+        """
+        Возвращает количество строк решётки.
+        """
+        return self.__rows
+
+    @property
+    def size(self) -> int:
+        """
+        Возвращает количество клеток решётки.
+        """
+        return self.__columns * self.__rows
+
+    @property
+    def matrix(self) -> Matrix:
+        """
+        Возвращает матрицу уровня.
+        """
+        return self.__matrix
+
+    def cell_at(self, column: int, row: int) -> int:
+        """
+        Возвращает номер клетки решётки по её столбцу и строке.
+
+        Args:
+            column: Номер столбца решётки.
+            row: Номер строки решётки.
+        """
+        return column * self.__rows + row
+
+    def coordinates(self, cell: int) -> tuple[int, int]:
+        """
+        Возвращает координаты (x, y) клетки решётки в матрице.
+
+        Args:
+            cell: Номер клетки решётки.
+        """
+        column, row = divmod(cell, self.__rows)
+        return self.__origin_x + 2 * column, 1 + 2 * row
+
+    def neighbours(self, cell: int) -> list[int]:
+        """
+        Возвращает номера соседних по четырём направлениям клеток решётки.
+
+        Args:
+            cell: Номер клетки решётки.
+        """
+        column, row = divmod(cell, self.__rows)
+        neighbours = []
+        if row > 0:
+            neighbours.append(cell - 1)
+        if column < self.__columns - 1:
+            neighbours.append(cell + self.__rows)
+        if row < self.__rows - 1:
+            neighbours.append(cell + 1)
+        if column > 0:
+            neighbours.append(cell - self.__rows)
+        return neighbours
+
+    def carve_cell(self, cell: int) -> None:
+        """
+        Делает клетку решётки проходимой.
+
+        Args:
+            cell: Номер клетки решётки.
+        """
+        self.__matrix.set_zero(*self.coordinates(cell))
+
+    def carve_passage(self, cell: int, neighbour: int) -> None:
+        """
+        Соединяет две соседние клетки решётки, вырезая обе клетки и стену между ними.
+
+        Args:
+            cell: Номер первой клетки.
+            neighbour: Номер соседней клетки.
+        """
+        x, y = self.coordinates(cell)
+        neighbour_x, neighbour_y = self.coordinates(neighbour)
+        matrix = self.__matrix
+        matrix.set_zero(x, y)
+        matrix.set_zero((x + neighbour_x) // 2, (y + neighbour_y) // 2)
+        matrix.set_zero(neighbour_x, neighbour_y)
+
+    def step(self) -> None:
+        """
+        Сообщает обработчику прогресса о завершении очередного шага генерации.
+        """
+        if self.__on_step:
+            self.__on_step(self.__matrix)
+
+    def connect_entrance(self, start_x: int, start_y: int) -> int:
+        """
+        Соединяет вход в лабиринт с ближайшей клеткой решётки.
+
+        Args:
+            start_x: Координата X входа.
+            start_y: Координата Y входа.
+
+        Returns:
+            Номер клетки решётки, к которой подведён вход.
+        """
+        column = min(max(0, (start_x - self.__origin_x) // 2), self.__columns - 1)
+        row = min(max(0, (start_y - 1) // 2), self.__rows - 1)
+        cell = self.cell_at(column, row)
+        target_x, target_y = self.coordinates(cell)
+        x, y = start_x, start_y
+
+        self.__matrix.set_zero(x, y)
+        while (x, y) != (target_x, target_y):
+            if y != target_y:
+                y += 1 if target_y > y else -1
+            else:
+                x += 1 if target_x > x else -1
+            self.__matrix.set_zero(x, y)
+        return cell
+
+    def open_exits(self, exits_count: int, entrance_cell: int) -> list[tuple[int, int]]:
+        """
+        Открывает выходы из случайных клеток на краях решётки к границе уровня.
+
+        Между крайней клеткой решётки и границей может оставаться стена толщиной
+        в одну ячейку - она вырезается. Верхний край, где находится вход, используется
+        только если на остальных краях клеток не хватило.
+
+        Args:
+            exits_count: Количество выходов, которые нужно открыть.
+            entrance_cell: Номер клетки решётки, к которой подведён вход.
+
+        Returns:
+            Список координат клеток, из которых открыт выход за границу уровня.
+        """
+        matrix = self.__matrix
+        columns, rows = self.__columns, self.__rows
+        sides = [(self.cell_at(0, row), (-1, 0)) for row in range(rows)]
+        sides += [(self.cell_at(columns - 1, row), (1, 0)) for row in range(rows)]
+        sides += [(self.cell_at(column, rows - 1), (0, 1)) for column in range(columns)]
+        top = [(self.cell_at(column, 0), (0, -1)) for column in range(columns)]
+        random.shuffle(sides)
+        random.shuffle(top)
+
+        exits = []
+        used_cells = {entrance_cell}
+        for cell, (dx, dy) in sides + top:
+            if len(exits) >= exits_count:
+                break
+            if cell in used_cells:
+                continue
+            used_cells.add(cell)
+            x, y = self.coordinates(cell)
+            while 0 < x + dx < matrix.width - 1 and 0 < y + dy < matrix.height - 1:
+                x += dx
+                y += dy
+                matrix.set_zero(x, y)
+            matrix.set_zero(x + dx, y + dy)
+            exits.append((x, y))
+        return exits
@@ -0,0 +1,47 @@
+from abc import abstractmethod
+from typing import Callable
+
+from Model.LevelGeneration.Generators.Lattice import Lattice
+from Model.LevelGeneration.Generators.MazeGenerator import MazeGenerator
+from Model.LevelGeneration.Matrix import Matrix
+from Model.LevelGeneration.MatrixPathBuilder import MatrixPathBuilder
+
+
+class LatticeMazeGenerator(MazeGenerator):
+    """
+    Базовый класс генераторов, строящих остовное дерево на решётке клеток.
+
+    Подводит вход к решётке, поручает наследнику соединить клетки решётки
+    и открывает выходы на её краях.
+    """
+    def generate(self, path_builder: MatrixPathBuilder, exits_count: int,
+                 on_step: Callable[[Matrix], None] | None = None) -> list[tuple[int, int]]:
+        """
+        Генерирует лабиринт в матрице строителя пути.
+
+        Args:
+            path_builder: Строитель пути, курсор которого стоит на входе в лабиринт.
+            exits_count: Количество выходов, которые нужно сгенерировать.
+            on_step: Необязательный обработчик прогресса, получающий матрицу после каждого шага.
+
+        Returns:
+            Список координат клеток, из которых открыт выход за границу уровня.
+        """
+        start_x, start_y = path_builder.get_cursor()
+        lattice = Lattice(path_builder.matrix, start_x, on_step)
+        if lattice.size == 0:
+            return []
+
+        entrance_cell = lattice.connect_entrance(start_x, start_y)
+        self._carve(lattice, entrance_cell)
+        return lattice.open_exits(exits_count, entrance_cell)
+
+    @abstractmethod
+    def _carve(self, lattice: Lattice, start_cell: int) -> None:
+        """
+        Соединяет все клетки решётки в остовное дерево.
+
+        Args:
+            lattice: Решётка клеток лабиринта.
+            start_cell: Номер клетки решётки, к которой подведён вход.
+        """
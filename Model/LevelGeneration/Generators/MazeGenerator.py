@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+
+from Model.LevelGeneration.Matrix import Matrix
+from Model.LevelGeneration.MatrixPathBuilder import MatrixPathBuilder
+
+
+class MazeGenerator(ABC):
+    """
+    Базовый класс стратегии генерации лабиринта.
+
+    Стратегия вырезает проходы в матрице строителя пути, начиная от его курсора
+    (входа в лабиринт), и открывает выходы у границ уровня.
+    """
+    NAME = ""
+
+    @abstractmethod
+    def generate(self, path_builder: MatrixPathBuilder, exits_count: int,
+                 on_step: Callable[[Matrix], None] | None = None) -> list[tuple[int, int]]:
+        """
+        Генерирует лабиринт в матрице строителя пути.
+
+        Args:
+            path_builder: Строитель пути, курсор которого стоит на входе в лабиринт.
+            exits_count: Количество выходов, которые нужно сгенерировать.
+            on_step: Необязательный обработчик прогресса, получающий матрицу после каждого шага.
+
+        Returns:
+            Список координат клеток, из которых открыт выход за границу уровня.
+        """
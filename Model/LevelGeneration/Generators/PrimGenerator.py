@@ -0,0 +1,41 @@
+import random
+
+from Model.LevelGeneration.Generators.Lattice import Lattice
+from Model.LevelGeneration.Generators.LatticeMazeGenerator import LatticeMazeGenerator
+
+
+class PrimGenerator(LatticeMazeGenerator):
+    """
+    Генерация рандомизированным алгоритмом Прима.
+
+    Лабиринт растёт от входа, на каждом шаге присоединяя случайное ребро из границы
+    уже построенной области. Случайное ребро извлекается обменом с последним
+    элементом списка, поэтому каждый шаг выполняется за O(1).
+    """
+    NAME = "Алгоритм Прима"
+
+    def _carve(self, lattice: Lattice, start_cell: int) -> None:
+        """
+        Соединяет все клетки решётки в остовное дерево.
+
+        Args:
+            lattice: Решётка клеток лабиринта.
+            start_cell: Номер клетки решётки, к которой подведён вход.
+        """
+        in_maze = bytearray(lattice.size)
+        in_maze[start_cell] = 1
+        lattice.carve_cell(start_cell)
+        frontier = [(start_cell, neighbour) for neighbour in lattice.neighbours(start_cell)]
+
+        while frontier:
+            index = random.randrange(len(frontier))
+            frontier[index], frontier[-1] = frontier[-1], frontier[index]
+            cell, neighbour = frontier.pop()
+            if in_maze[neighbour]:
+                continue
+
+            in_maze[neighbour] = 1
+            lattice.carve_passage(cell, neighbour)
+            frontier.extend((neighbour, following) for following in lattice.neighbours(neighbour)
+                            if not in_maze[following])
+            lattice.step()
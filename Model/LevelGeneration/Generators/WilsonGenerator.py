@@ -0,0 +1,41 @@
+import random
+from array import array
+
+from Model.LevelGeneration.Generators.Lattice import Lattice
+from Model.LevelGeneration.Generators.LatticeMazeGenerator import LatticeMazeGenerator
+
+
+class WilsonGenerator(LatticeMazeGenerator):
+    """
+    Генерация алгоритмом Уилсона (случайные блуждания со стиранием петель).
+
+    Даёт равномерно распределённое остовное дерево. Петли стираются неявно:
+    для каждой клетки хранится только последний шаг блуждания из неё.
+    """
+    NAME = "Алгоритм Уилсона"
+
+    def _carve(self, lattice: Lattice, start_cell: int) -> None:
+        """
+        Соединяет все клетки решётки в остовное дерево.
+
+        Args:
+            lattice: Решётка клеток лабиринта.
+            start_cell: Номер клетки решётки, к которой подведён вход.
+        """
+        in_tree = bytearray(lattice.size)
+        in_tree[start_cell] = 1
+        lattice.carve_cell(start_cell)
+        walk = array("i", [-1]) * lattice.size
+
+        for cell in range(lattice.size):
+            current = cell
+            while not in_tree[current]:
+                walk[current] = random.choice(lattice.neighbours(current))
+                current = walk[current]
+
+            current = cell
+            while not in_tree[current]:
+                in_tree[current] = 1
+                lattice.carve_passage(current, walk[current])
+                current = walk[current]
+            lattice.step()
@@ -0,0 +1,112 @@
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Callable
+
+from Model.LevelGeneration.Generators.MazeGenerator import MazeGenerator
+from Model.LevelGeneration.Matrix import Matrix
+from Model.LevelGeneration.Maze import Maze
+
+
+class LevelPrefetcher:
+    """
+    Заранее генерирует следующий уровень в фоновом потоке, пока игрок проходит текущий.
+
+    Уровень задаётся размерами, стратегией генерации и количеством выходов.
+    Готовый лабиринт отдаётся только при совпадении этих параметров с запрошенными:
+    если игрок успел сменить сложность или алгоритм, заготовка отбрасывается
+    и уровень строится синхронно.
+    Фоновый поток ждёт ввода игрока почти всё время, поэтому генерация
+    не мешает отрисовке.
+
+    Последним аргументом функция построения получает обработчик шагов генерации,
+    который прерывает её после вызова close. Иначе при выходе из игры интерпретатор
+    дожидался бы окончания начатой генерации большого уровня.
+    """
+    def __init__(self, build_level: Callable[[int, int, MazeGenerator, int, Callable[[Matrix], None] | None],
+                                             Maze]) -> None:
+        """
+        Инициализирует предзагрузчик.
+
+        Args:
+            build_level: Функция, строящая лабиринт по ширине, высоте, стратегии генерации,
+                количеству выходов и обработчику шагов генерации.
+        """
+        self.__build_level = build_level
+        self.__closed = False
+        self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-prefetch")
+        self.__pending: Future | None = None
+        self.__pending_key: tuple[int, int, MazeGenerator, int] | None = None
+
+    def prefetch(self, width: int, height: int, generator: MazeGenerator, exits_count: int) -> None:
+        """
+        Запускает фоновую генерацию уровня, если такой уровень ещё не заказан.
+        Заказ уровня с другими параметрами отменяет предыдущий.
+
+        Args:
+            width: Ширина лабиринта.
+            height: Высота лабиринта.
+            generator: Стратегия генерации.
+            exits_count: Количество выходов.
+        """
+        key = (width, height, generator, exits_count)
+        if self.__pending_key == key:
+            return
+        self.cancel()
+        self.__pending_key = key
+        self.__pending = self.__executor.submit(self.__build_level, width, height, generator, exits_count,
+                                                self.__abort_if_closed)
+
+    def take(self, width: int, height: int, generator: MazeGenerator, exits_count: int) -> Maze:
+        """
+        Возвращает уровень с заданными параметрами.
+
+        Если заготовка с такими параметрами готова, она возвращается сразу; если
+        ещё строится - дожидается её, что не дольше генерации с нуля. Иначе уровень
+        генерируется синхронно в текущем потоке.
+
+        Args:
+            width: Ширина лабиринта.
+            height: Высота лабиринта.
+            generator: Стратегия генерации.
+            exits_count: Количество выходов.
+        """
+        pending = self.__pending
+        if (pending is not None and self.__pending_key == (width, height, generator, exits_count)
+                and not pending.cancelled()):
+            self.__pending = None
+            self.__pending_key = None
+            return pending.result()
+
+        self.cancel()
+        return self.__build_level(width, height, generator, exits_count, None)
+
+    def cancel(self) -> None:
+        """
+        Отменяет заказанный уровень. Уже начатая генерация доводится до конца
+        в фоне, но её результат отбрасывается.
+        """
+        if self.__pending is not None:
+            self.__pending.cancel()
+        self.__pending = None
+        self.__pending_key = None
+
+    def close(self) -> None:
+        """
+        Отменяет заказанный уровень, прерывает начатую генерацию и останавливает
+        фоновый поток, не дожидаясь его. Вызывается при выходе из игры.
+        """
+        self.__closed = True
+        self.cancel()
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+
+    def __abort_if_closed(self, matrix: Matrix) -> None:
+        """
+        Обработчик шагов фоновой генерации: прерывает её, если предзагрузчик закрыт.
+
+        Args:
+            matrix: Матрица строящегося лабиринта.
+
+        Raises:
+            CancelledError: Если вызван close.
+        """
+        if self.__closed:
+            raise CancelledError
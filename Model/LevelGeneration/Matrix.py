@@ -1,5 +1,6 @@
 from typing import Any
 
+from Model.Render.AnsiEncoder import AnsiEncoder
 from Model.Render.Renderer import Renderer
 
 
@@ -7,10 +8,17 @@ class Matrix:
     """
     Класс матрицы символов с фиксированной шириной и высотой.
 
-    Матрица хранится как список столбцов (по оси X), каждый из которых содержит
-    список символов по оси Y. Предоставляет методы для чтения, записи и печати,
-    а также поиска координаты первого вхождения символа.
+    Ячейки хранятся в непрерывном bytearray в виде однобайтовых кодов: ячейка
+    (x, y) лежит по индексу x * height + y. Коды сопоставляются символам через
+    палитру, к строкам для вывода они превращаются только при печати. Предоставляет
+    методы для чтения, записи и печати, а также поиска координаты первого
+    вхождения символа.
+
+    Строки для вывода собираются через AnsiEncoder, который выводит цвет только
+    при его смене, и кэшируются построчно; запись в ячейку сбрасывает кэш только
+    её строки, поэтому повторная печать пересобирает лишь изменившиеся строки.
     """
+    MAX_PALETTE_SIZE = 256
 
     def __init__(self, width: object, height: object, fill_symbol: object, zero_symbol) -> None:
         """
@@ -22,8 +30,15 @@ class Matrix:
             fill_symbol: Символ, которым заполняются все ячейки по умолчанию.
             zero_symbol: Символ, используемый для обозначения «пустой/проходимой» ячейки.
         """
-        self.__matrix = [[fill_symbol for y in range(height)] for x in range(width)]
+        self.__width = width
+        self.__height = height
+        self.__palette: list[Any] = []
+        self.__encoder = AnsiEncoder(self.__palette)
+        self.__codes: dict[Any, int] = {}
         self.__zero_symbol = zero_symbol
+        self.__zero_code = self.code_of(zero_symbol)
+        self.__cells = bytearray([self.code_of(fill_symbol)]) * (width * height)
+        self.__row_strings: list[str | None] = [None] * height
 
     @property
     def height(self) -> int:
@@ -33,7 +48,7 @@ class Matrix:
         Returns:
             Целое число — высота матрицы.
         """
-        return len(self.__matrix[0])
+        return self.__height
 
     @property
     def width(self) -> int:
@@ -43,9 +58,54 @@ class Matrix:
         Returns:
             Целое число — ширина матрицы.
         """
-        return len(self.__matrix)
+        return self.__width
+
+    @property
+    def zero_symbol(self) -> object:
+        """
+        Возвращает символ, обозначающий «пустую/проходимую» ячейку.
+        """
+        return self.__zero_symbol
+
+    @property
+    def cells(self) -> bytearray:
+        """
+        Возвращает коды всех ячеек матрицы; ячейка (x, y) лежит по индексу x * height + y.
+        Массив предназначен только для чтения, изменять ячейки следует через set_symbol и set_zero.
+        """
+        return self.__cells
+
+    @property
+    def palette(self) -> list[Any]:
+        """
+        Возвращает палитру матрицы: символ с кодом c хранится по индексу c.
+        Список предназначен только для чтения, новые символы добавляет code_of.
+        """
+        return self.__palette
 
-    def get(self, x: object, y: object) -> list[Any] | list[list[Any]]:
+    def code_of(self, symbol: object) -> int:
+        """
+        Возвращает код символа в палитре матрицы, добавляя символ в палитру при необходимости.
+
+        Args:
+            symbol: Символ, код которого нужно получить.
+
+        Returns:
+            Целое число от 0 до 255 — код символа.
+
+        Raises:
+            ValueError: Если палитра уже содержит максимальное количество символов.
+        """
+        code = self.__codes.get(symbol)
+        if code is None:
+            if len(self.__palette) >= Matrix.MAX_PALETTE_SIZE:
+                raise ValueError(f"Палитра матрицы не может содержать больше {Matrix.MAX_PALETTE_SIZE} символов")
+            code = len(self.__palette)
+            self.__palette.append(symbol)
+            self.__codes[symbol] = code
+        return code
+
+    def get(self, x: object, y: object) -> Any:
         """
         Возвращает значение ячейки по координатам (x, y).
 
@@ -56,7 +116,20 @@ class Matrix:
         Returns:
             Значение, содержащееся в ячейке матрицы по указанным координатам.
         """
-        return self.__matrix[x][y]
+        return self.__palette[self.__cells[x * self.__height + y]]
+
+    def get_code(self, x: int, y: int) -> int:
+        """
+        Возвращает код ячейки по координатам (x, y).
+
+        Args:
+            x: Координата по оси X (столбец).
+            y: Координата по оси Y (строка).
+
+        Returns:
+            Код символа ячейки в палитре матрицы.
+        """
+        return self.__cells[x * self.__height + y]
 
     def get_symbol_coord(self, symbol: object) -> tuple[int, int]:
         """
@@ -69,9 +142,10 @@ class Matrix:
             Кортеж (x, y) координат первого найденного вхождения символа.
             Если символ не найден, возвращает (0, 0).
         """
-        i = [(x, y) for x in range(self.width) for y in range(self.height) if self.__matrix[x][y] == symbol]
-        if i:
-            return i[0]
+        code = self.__codes.get(symbol)
+        index = self.__cells.find(code) if code is not None else -1
+        if index >= 0:
+            return divmod(index, self.__height)
         else:
             return 0, 0
 
@@ -85,7 +159,8 @@ class Matrix:
         Returns:
             True, если символ найден в матрице, иначе False.
         """
-        return any(char == symbol for raw in self.__matrix for char in raw)
+        code = self.__codes.get(symbol)
+        return code is not None and code in self.__cells
 
     def set_zero(self, x: object, y: object) -> None:
         """
@@ -95,7 +170,7 @@ class Matrix:
             x: Координата по оси X (столбец).
             y: Координата по оси Y (строка).
         """
-        self.__matrix[x][y] = self.__zero_symbol
+        self.__write(x * self.__height + y, self.__zero_code)
 
     def set_symbol(self, x: object, y: object, symbol: object) -> None:
         """
@@ -106,28 +181,63 @@ class Matrix:
             y: Координата по оси Y (строка).
             symbol: Символ для записи в ячейку.
         """
-        self.__matrix[x][y] = symbol
+        self.__write(x * self.__height + y, self.code_of(symbol))
 
     def print_matrix(self) -> None:
         """
         Печатает матрицу построчно, используя рендерер.
 
-        Каждая строка формируется транспонированием данных (по Y), после чего
-        передаётся в Renderer.render для вывода.
+        Строки берутся из кэша row_to_string и передаются в Renderer.render для вывода.
         """
-        for raw in zip(*self.__matrix):
-            Renderer.render("".join(raw))
+        for y in range(self.__height):
+            Renderer.render(self.row_to_string(y))
 
-    def to_string(self):
+    def to_string(self) -> str:
         """
         Возвращает строковое представление матрицы.
 
         Returns:
             Строка, содержащая построчное представление матрицы с переводами строк.
         """
-        result = ""
+        return "\n".join(map(self.row_to_string, range(self.__height))) + "\n"
 
-        for raw in zip(*self.__matrix):
-            result = result + "".join(raw) + "\n"
+    def row_to_string(self, y: int) -> str:
+        """
+        Переводит коды строки y в символы палитры и склеивает их через AnsiEncoder.
+        Результат кэшируется до следующей записи в любую ячейку строки.
 
-        return result
+        Args:
+            y: Координата строки по оси Y.
+        """
+        row = self.__row_strings[y]
+        if row is None:
+            row = self.__encoder.encode(self.__cells[y::self.__height])
+            self.__row_strings[y] = row
+        return row
+
+    def row_slice_to_string(self, y: int, start: int, end: int) -> str:
+        """
+        Переводит коды ячеек строки y с координатами X от start до end (не включая)
+        в символы палитры и склеивает их через AnsiEncoder. Для всей строки используется
+        кэш row_to_string.
+
+        Args:
+            y: Координата строки по оси Y.
+            start: Координата X первой ячейки.
+            end: Координата X после последней ячейки.
+        """
+        if start == 0 and end == self.__width:
+            return self.row_to_string(y)
+        height = self.__height
+        return self.__encoder.encode(self.__cells[start * height + y:end * height:height])
+
+    def __write(self, index: int, code: int) -> None:
+        """
+        Записывает код в ячейку с плоским индексом, сбрасывая кэш строки ячейки.
+
+        Args:
+            index: Плоский индекс ячейки x * height + y.
+            code: Код символа.
+        """
+        self.__cells[index] = code
+        self.__row_strings[index % self.__height] = None
@@ -7,6 +7,7 @@
 """
 
 import random
+from array import array
 from typing import Any
 
 from Model.Input.InputEnums import MoveVectors
@@ -18,8 +19,16 @@ class MatrixPathBuilder:
     Класс для пошагового построения пути в матрице уровня.
 
     Управляет положением курсора, отмечает пройденные клетки, хранит путь
-    (traceback) и позволяет создавать выход у границы, е��ли это возможно.
+    (traceback) и позволяет создавать выход у границы, если это возможно.
+    Начальная позиция курсора считается входом и не используется как проход
+    на границе для выхода.
+
+    Пройденные клетки отмечаются в bytearray, а путь хранится массивом
+    плоских индексов x * height + y, поэтому состояние занимает несколько байтов
+    на клетку, а проверки шагов не создают объектов. Принадлежность границе
+    проверяется по координатам.
     """
+    BUILD_DIRECTIONS = (MoveVectors.UP, MoveVectors.RIGHT, MoveVectors.LEFT, MoveVectors.DOWN)
 
     def __init__(self, cursor_x: object, cursor_y: object, matrix: Matrix) -> None:
         """
@@ -35,22 +44,19 @@ class MatrixPathBuilder:
         self.__width = matrix.width
         self.__cursor_x = cursor_x
         self.__cursor_y = cursor_y
-        self.__passed_points = set()
-        self.__border_points = set()
-        self.__traceback = []
+        self.__entrance = (cursor_x, cursor_y)
+        self.__passed_cells = bytearray(self.__width * self.__height)
+        self.__traceback = array("i")
         matrix.set_zero(cursor_x, cursor_y)
         self.__update_traceback()
-        for p in [(x, y) for x in range(self.__width) for y in range(self.__height)
-                  if x == 0 or x == self.__width - 1 or y == self.__height - 1 or y == 0]:
-            self.__border_points.add(p)
 
     @property
-    def traceback(self) -> list[Any]:
+    def traceback(self) -> array:
         """
         Возвращает накопленный путь перемещения курсора.
 
         Returns:
-            Список кортежей координат (x, y), отражающих последовательность
+            Массив плоских индексов x * height + y, отражающих последовательность
             пройденных точек, включая текущую позицию.
         """
         return self.__traceback
@@ -71,7 +77,7 @@ class MatrixPathBuilder:
 
         На каждом шаге проверяет допустимость перемещения; если шаг допустим,
         перемещает курсор, отмечает клетку как посещённую и обновляет traceback.
-        По завершении печатает матрицу.
+        Ничего не выводит: отрисовкой хода генерации управляет вызывающий код.
 
         Args:
             distance: Количество шагов, которое нужно сделать.
@@ -82,10 +88,9 @@ class MatrixPathBuilder:
                 self.__cursor_x += direction.value[0]
                 self.__cursor_y += direction.value[1]
                 self.__matrix.set_zero(self.__cursor_x, self.__cursor_y)
-                self.__passed_points.add((self.__cursor_x, self.__cursor_y))
+                self.__passed_cells[self.__cursor_x * self.__height + self.__cursor_y] = 1
 
             self.__update_traceback()
-        self.__matrix.print_matrix()
 
     def set_cursor(self, x: object, y: object) -> None:
         """
@@ -105,9 +110,9 @@ class MatrixPathBuilder:
         Удаляет последний элемент из traceback и устанавливает курсор на
         предыдущую позицию, если таковая существует.
         """
-        self.__traceback = self.__traceback[:-1]
+        self.__traceback.pop()
         if self.__traceback:
-            self.set_cursor(*self.__traceback[-1])
+            self.set_cursor(*divmod(self.__traceback[-1], self.__height))
 
     def is_allowed_build(self, direction: MoveVectors) -> bool:
         """
@@ -125,13 +130,23 @@ class MatrixPathBuilder:
         Returns:
             True, если шаг допустим, иначе False.
         """
-        next_x = self.__cursor_x + direction.value[0]
-        next_y = self.__cursor_y + direction.value[1]
+        delta_x, delta_y = direction.value
+        next_x = self.__cursor_x + delta_x
+        next_y = self.__cursor_y + delta_y
+        height = self.__height
+
+        if not (0 < next_x < self.__width - 1 and 0 < next_y < height - 1):
+            return False
 
-        return ((0 < next_x < self.__width - 1) and (0 < next_y < self.__height - 1) and
-                (next_x, next_y) not in self.__passed_points and
-                all(point == (self.__cursor_x, self.__cursor_y) or point not in self.__passed_points
-                    for point in self.__neighbour_points((next_x, next_y))))
+        passed = self.__passed_cells
+        index = next_x * height + next_y
+        cursor = self.__cursor_x * height + self.__cursor_y
+
+        return not (passed[index] or
+                    (passed[index - 1] and index - 1 != cursor) or
+                    (passed[index + height] and index + height != cursor) or
+                    (passed[index + 1] and index + 1 != cursor) or
+                    (passed[index - height] and index - height != cursor))
 
     def allowed_build_directions(self) -> list[int]:
         """
@@ -140,10 +155,7 @@ class MatrixPathBuilder:
         Returns:
             Список элементов MoveVectors, соответствующих допустимым направлениям.
         """
-        return [i for i in [MoveVectors.UP,
-                            MoveVectors.RIGHT,
-                            MoveVectors.LEFT,
-                            MoveVectors.DOWN] if self.is_allowed_build(i)]
+        return [direction for direction in MatrixPathBuilder.BUILD_DIRECTIONS if self.is_allowed_build(direction)]
 
     def get_cursor(self) -> tuple[Any, Any]:
         """
@@ -164,12 +176,11 @@ class MatrixPathBuilder:
         """
         Пытается создать выход у границы, если соседняя клетка является границей.
 
-        Если у текущей позиции курсора есть соседи, принадлежащие множеству
-        граничных точек, случайным образом выбирается один из таких соседей и
-        отмечается как проходимый (нуль-символом в матрице).
+        Если у текущей позиции курсора есть соседи на границе матрицы, кроме входа,
+        случайным образом выбирается один из таких соседей и отмечается
+        как проходимый (нуль-символом в матрице).
         """
-        neighbours = self.__neighbour_points((self.__cursor_x, self.__cursor_y))
-        border_neighbours = [point for point in neighbours if point in self.__border_points]
+        border_neighbours = self.__border_neighbours()
         if border_neighbours:
             self.__matrix.set_zero(*random.choice(border_neighbours))
 
@@ -178,17 +189,34 @@ class MatrixPathBuilder:
         Проверяет возможность создания выхода у границы из текущей позиции.
 
         Returns:
-            True, если среди соседей текущей позиции есть граничные точки, иначе False.
+            True, если среди соседей текущей позиции есть граничные точки, кроме входа,
+            иначе False.
+        """
+        return bool(self.__border_neighbours())
+
+    def __border_neighbours(self) -> list[tuple[int, int]]:
+        """
+        Возвращает соседние с курсором точки на границе матрицы, кроме входа.
         """
         neighbours = self.__neighbour_points((self.__cursor_x, self.__cursor_y))
-        border_neighbours = [point for point in neighbours if point in self.__border_points]
-        return len(border_neighbours) > 0
+        return [point for point in neighbours if point != self.__entrance and self.__is_border(*point)]
 
     def __update_traceback(self) -> None:
         """
         Добавляет текущую позицию курсора в историю пути (traceback).
         """
-        self.__traceback.append((self.__cursor_x, self.__cursor_y))
+        self.__traceback.append(self.__cursor_x * self.__height + self.__cursor_y)
+
+    def __is_border(self, x: int, y: int) -> bool:
+        """
+        Проверяет, что точка лежит внутри матрицы на её границе.
+
+        Args:
+            x: Координата по оси X.
+            y: Координата по оси Y.
+        """
+        return (0 <= x < self.__width and 0 <= y < self.__height and
+                (x == 0 or x == self.__width - 1 or y == 0 or y == self.__height - 1))
 
     @staticmethod
     def __neighbour_points(point: object) -> list:
@@ -1,51 +1,195 @@
-import random
+from typing import Callable
 
+from Model.Dijkstra.AStar import AStar
+from Model.Dijkstra.Dijkstra import Dijkstra
+from Model.Dijkstra.JunctionGraph import JunctionGraph
+from Model.LevelGeneration.Generators.BacktrackerGenerator import BacktrackerGenerator
+from Model.LevelGeneration.Generators.MazeGenerator import MazeGenerator
 from Model.LevelGeneration.Matrix import Matrix
 from Model.LevelGeneration.MatrixPathBuilder import MatrixPathBuilder
+from Model.LevelPack.LevelRecord import LevelRecord
+from Model.Profiling.Profiler import Profiler
 
 
 class Maze:
     """
     Класс для генерации лабиринта с использованием MatrixPathBuilder.
+
+    Алгоритм построения задаётся стратегией MazeGenerator, по умолчанию
+    используется поиск в глубину.
     """
-    def __init__(self, path_builder: MatrixPathBuilder, exits_count: int):
+    def __init__(self, path_builder: MatrixPathBuilder, exits_count: int,
+                 on_step: Callable[[Matrix], None] | None = None,
+                 generator: MazeGenerator | None = None):
         """
         Инициализирует генератор лабиринта.
 
+        По умолчанию генерация выполняется без вывода на экран. Чтобы показать
+        ход построения, передайте on_step - он вызывается после каждого шага.
+
         Args:
             path_builder: Строитель пути для создания структуры лабиринта.
             exits_count: Количество выходов, которые нужно сгенерировать.
+            on_step: Необязательный обработчик прогресса, получающий матрицу после каждого шага.
+            generator: Стратегия генерации; по умолчанию BacktrackerGenerator.
+        """
+        self.__initialize(path_builder.matrix, path_builder.get_cursor(), [])
+        self.__generate(path_builder, exits_count, on_step, generator or BacktrackerGenerator())
+
+    @classmethod
+    def from_record(cls, record: LevelRecord, one_symbol: object, zero_symbol: object) -> "Maze":
+        """
+        Создаёт лабиринт из готового уровня набора без повторной генерации.
+
+        Args:
+            record: Запись уровня.
+            one_symbol: Символ стены.
+            zero_symbol: Символ прохода.
         """
-        self.__path_builder = path_builder
-        self.__exits_count = exits_count
-        self.__exit_coordinate = (0, 0)
-        self.__generate()
+        maze = cls.__new__(cls)
+        maze.__initialize(record.to_matrix(one_symbol, zero_symbol), record.entrance, [record.exit_coordinate],
+                          record.optimal_distance)
+        return maze
+
+    def __initialize(self, matrix: Matrix, entrance_coordinate: tuple[int, int], exits: list[tuple[int, int]],
+                     optimal_distance: int | None = None) -> None:
+        """
+        Задаёт состояние лабиринта; общая часть __init__ и from_record.
+
+        Args:
+            matrix: Матрица лабиринта.
+            entrance_coordinate: Координаты входа.
+            exits: Координаты выходов.
+            optimal_distance: Известная длина кратчайшего пути от входа до выхода или None.
+        """
+        self.__matrix = matrix
+        self.__entrance_coordinate = entrance_coordinate
+        self.__exits = exits
+        self.__graph: JunctionGraph | None = None
+        self.__exit_distances: Dijkstra | None = None
+        self.__optimal_distance = optimal_distance
 
     def to_matrix(self) -> Matrix:
         """
         Возвращает сгенерированный лабиринт в виде объекта Matrix.
         """
-        return self.__path_builder.matrix
+        return self.__matrix
+
+    @property
+    def entrance_coordinate(self) -> tuple[int, int]:
+        """
+        Возвращает координаты входа, с которого начиналась генерация.
+        """
+        return self.__entrance_coordinate
+
+    @property
+    def exits(self) -> list[tuple[int, int]]:
+        """
+        Возвращает координаты всех выходов лабиринта.
+        """
+        return self.__exits
 
     @property
     def exit_coordinate(self) -> tuple[int, int]:
         """
-        Возвращает координаты последнего сгенерированного выхода.
+        Возвращает координаты последнего сгенерированного выхода или (0, 0), если выходов нет.
         """
-        return self.__exit_coordinate
+        return self.__exits[-1] if self.__exits else (0, 0)
 
-    def __generate(self) -> None:
+    def is_exit(self, x: int, y: int) -> bool:
         """
-        Выполняет генерацию лабиринта, создавая пути и выходы.
+        Проверяет, является ли точка (x, y) одним из выходов.
+
+        Args:
+            x: Координата X.
+            y: Координата Y.
+        """
+        return (x, y) in self.__exits
+
+    def distance_to_exit(self, x: int, y: int) -> int:
         """
-        exits = 0
-        while len(self.__path_builder.traceback) > 0:
-            if self.__path_builder.allowed_build_directions():
-                self.__path_builder.build(1, random.choice(self.__path_builder.allowed_build_directions()))
+        Возвращает длину кратчайшего пути от точки (x, y) до ближайшего выхода.
+
+        Поле расстояний строится один раз за уровень поиском по графу развилок,
+        начатым одновременно из всех выходов, и кэшируется. Запрос из клетки
+        посреди коридора сводится к сравнению расстояний до двух концов коридора.
+
+        Args:
+            x: Координата X.
+            y: Координата Y.
+
+        Returns:
+            Длина пути или Dijkstra.INFINITY, если выход недостижим из точки.
+        """
+        return self.__solver_graph().get_distance(self.__exit_field(), x, y)
+
+    def route_to_exit(self, x: int, y: int, steps: int) -> list[tuple[int, int]]:
+        """
+        Возвращает первые шаги кратчайшего пути от точки (x, y) к ближайшему выходу.
+        Использует то же кэшированное поле расстояний, что и distance_to_exit.
+
+        Args:
+            x: Координата X.
+            y: Координата Y.
+            steps: Максимальное количество шагов.
+
+        Returns:
+            Список координат без самой точки (x, y).
+        """
+        return self.__solver_graph().get_route_to_start(self.__exit_field(), x, y, steps)
+
+    def optimal_distance(self) -> int:
+        """
+        Возвращает длину кратчайшего пути от входа до ближайшего выхода.
+
+        Если поле расстояний уже построено или выходов несколько, значение читается
+        из поля, иначе выполняется точечный поиск A*, который не раскрывает весь
+        лабиринт. Результат кэшируется.
+        """
+        if self.__optimal_distance is None:
+            if self.__exit_distances is not None or len(self.__exits) > 1:
+                self.__optimal_distance = self.distance_to_exit(*self.__entrance_coordinate)
+            elif not self.__exits:
+                self.__optimal_distance = Dijkstra.INFINITY
             else:
-                if exits < self.__exits_count and self.__path_builder.can_make_exit() and random.randint(0, exits + 1) == 0:
-                    self.__path_builder.try_make_exit()
-                    self.__exit_coordinate = self.__path_builder.get_cursor()
-                    exits += 1
-                self.__path_builder.rollback()
-            print()
+                with Profiler.measure("solve"):
+                    self.__optimal_distance = AStar(self.__solver_graph(), *self.__entrance_coordinate,
+                                                    *self.__exits[0]).distance
+        return self.__optimal_distance
+
+    def __solver_graph(self) -> JunctionGraph:
+        """
+        Возвращает граф развилок лабиринта, построенный один раз за уровень.
+        Вход и выходы всегда являются вершинами графа.
+        """
+        if self.__graph is None:
+            matrix = self.to_matrix()
+            with Profiler.measure("graph_build"):
+                self.__graph = JunctionGraph(matrix, matrix.zero_symbol, [self.__entrance_coordinate] + self.__exits)
+            Profiler.count("graph_vertices", self.__graph.vertex_count)
+        return self.__graph
+
+    def __exit_field(self) -> Dijkstra:
+        """
+        Возвращает поле расстояний до ближайшего выхода, построенное один раз
+        за уровень поиском, начатым одновременно из всех выходов.
+        """
+        if self.__exit_distances is None:
+            graph = self.__solver_graph()
+            first_exit, *other_exits = self.__exits or [(-1, -1)]
+            with Profiler.measure("solve"):
+                self.__exit_distances = Dijkstra(graph, *first_exit, other_exits)
+        return self.__exit_distances
+
+    def __generate(self, path_builder: MatrixPathBuilder, exits_count: int,
+                   on_step: Callable[[Matrix], None] | None, generator: MazeGenerator) -> None:
+        """
+        Выполняет генерацию лабиринта выбранной стратегией, создавая пути и выходы.
+
+        Args:
+            path_builder: Строитель пути для создания структуры лабиринта.
+            exits_count: Количество выходов.
+            on_step: Необязательный обработчик прогресса.
+            generator: Стратегия генерации.
+        """
+        self.__exits = generator.generate(path_builder, exits_count, on_step)
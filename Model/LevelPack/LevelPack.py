@@ -0,0 +1,130 @@
+import mmap
+import struct
+from array import array
+from typing import Iterable
+
+from Model.LevelPack.LevelRecord import LevelRecord
+
+
+class LevelPack:
+    """
+    Набор уровней в компактном двоичном файле, открываемом через mmap.
+
+    Формат файла (все числа little-endian):
+        заголовок   - HEADER: сигнатура MAGIC, версия, количество уровней, смещение индекса;
+        записи      - RECORD: зерно, размеры, вход, выход, длина кратчайшего пути,
+                      длина имени стратегии, затем имя стратегии в ASCII
+                      и побитовая сетка проходов;
+        индекс      - смещения записей, по INDEX_ENTRY на уровень.
+
+    При открытии читается только заголовок, поэтому набор любого размера
+    открывается мгновенно, а отдельный уровень читается по смещению из индекса
+    без разбора остального файла.
+    """
+    MAGIC = b"MZPK"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHxxQQ")
+    RECORD = struct.Struct("<qHHHHHHIB")
+    INDEX_ENTRY = struct.Struct("<Q")
+
+    def __init__(self, path: str) -> None:
+        """
+        Открывает файл набора уровней.
+
+        Args:
+            path: Путь к файлу набора.
+
+        Raises:
+            ValueError: Если файл не является набором уровней поддерживаемой версии.
+        """
+        self.__file = open(path, "rb")
+        try:
+            self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, self.__count, self.__index_offset = LevelPack.HEADER.unpack_from(self.__map)
+        except (ValueError, struct.error):
+            self.__file.close()
+            raise ValueError(f"{path} не является набором уровней")
+        if magic != LevelPack.MAGIC or version != LevelPack.VERSION:
+            self.close()
+            raise ValueError(f"{path} не является набором уровней версии {LevelPack.VERSION}")
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество уровней в наборе.
+        """
+        return self.__count
+
+    def __getitem__(self, number: int) -> LevelRecord:
+        """
+        Читает уровень с заданным номером.
+
+        Args:
+            number: Номер уровня от 0 до len - 1.
+
+        Raises:
+            IndexError: Если уровня с таким номером нет.
+        """
+        if not 0 <= number < self.__count:
+            raise IndexError(f"в наборе нет уровня {number}")
+
+        offset, = LevelPack.INDEX_ENTRY.unpack_from(self.__map,
+                                                    self.__index_offset + number * LevelPack.INDEX_ENTRY.size)
+        (seed, width, height, entrance_x, entrance_y, exit_x, exit_y,
+         optimal_distance, name_length) = LevelPack.RECORD.unpack_from(self.__map, offset)
+        offset += LevelPack.RECORD.size
+        generator_name = self.__map[offset:offset + name_length].decode("ascii")
+        offset += name_length
+        passages = self.__map[offset:offset + (width * height + 7) // 8]
+        return LevelRecord(seed, generator_name, width, height, (entrance_x, entrance_y),
+                           (exit_x, exit_y), optimal_distance, passages)
+
+    def __enter__(self) -> "LevelPack":
+        """
+        Возвращает сам набор для использования в операторе with.
+        """
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Закрывает набор при выходе из оператора with.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Закрывает отображение и файл набора.
+        """
+        self.__map.close()
+        self.__file.close()
+
+    @staticmethod
+    def save(path: str, records: Iterable[LevelRecord]) -> int:
+        """
+        Записывает уровни в файл набора по мере их поступления.
+        Индекс и итоговый заголовок дописываются после последней записи.
+
+        Args:
+            path: Путь к файлу набора.
+            records: Записи уровней.
+
+        Returns:
+            Количество записанных уровней.
+        """
+        offsets = array("Q")
+        with open(path, "wb") as file:
+            file.write(LevelPack.HEADER.pack(LevelPack.MAGIC, LevelPack.VERSION, 0, 0))
+            for record in records:
+                offsets.append(file.tell())
+                name = record.generator_name.encode("ascii")
+                file.write(LevelPack.RECORD.pack(record.seed, record.width, record.height,
+                                                 *record.entrance, *record.exit_coordinate,
+                                                 record.optimal_distance, len(name)))
+                file.write(name)
+                file.write(record.passages)
+
+            index_offset = file.tell()
+            for offset in offsets:
+                file.write(LevelPack.INDEX_ENTRY.pack(offset))
+            file.seek(0)
+            file.write(LevelPack.HEADER.pack(LevelPack.MAGIC, LevelPack.VERSION, len(offsets), index_offset))
+        return len(offsets)
@@ -0,0 +1,122 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
+
+from Model.Dijkstra.Dijkstra import Dijkstra
+from Model.Dijkstra.MatrixGraph import MatrixGraph
+from Model.LevelGeneration.Generators.BacktrackerGenerator import BacktrackerGenerator
+from Model.LevelGeneration.Generators.EllerGenerator import EllerGenerator
+from Model.LevelGeneration.Generators.KruskalGenerator import KruskalGenerator
+from Model.LevelGeneration.Generators.MazeGenerator import MazeGenerator
+from Model.LevelGeneration.Generators.PrimGenerator import PrimGenerator
+from Model.LevelGeneration.Generators.WilsonGenerator import WilsonGenerator
+from Model.LevelGeneration.Matrix import Matrix
+from Model.LevelGeneration.MatrixPathBuilder import MatrixPathBuilder
+from Model.LevelGeneration.Maze import Maze
+from Model.LevelPack.LevelRecord import LevelRecord
+
+
+class LevelPackBuilder:
+    """
+    Статический класс параллельной генерации наборов проверенных уровней.
+
+    Уровни генерируются в пуле процессов. Уровень с номером i строится с зерном
+    seed + i, поэтому набор воспроизводится независимо от числа процессов
+    и порядка их работы. Каждый уровень проверяется поиском путей от входа:
+    все проходы должны быть связны, а выход - быть достижим и открываться на границу.
+    """
+    GENERATORS: dict[str, type[MazeGenerator]] = {"backtracker": BacktrackerGenerator,
+                                                  "prim": PrimGenerator,
+                                                  "kruskal": KruskalGenerator,
+                                                  "wilson": WilsonGenerator,
+                                                  "eller": EllerGenerator}
+
+    @staticmethod
+    def build(count: int, width: int, height: int, generator_name: str, seed: int,
+              workers: int | None = None) -> Iterator[LevelRecord | None]:
+        """
+        Генерирует уровни в пуле процессов и возвращает их в порядке номеров.
+
+        Args:
+            count: Количество уровней.
+            width: Ширина лабиринтов.
+            height: Высота лабиринтов.
+            generator_name: Ключ стратегии генерации из GENERATORS.
+            seed: Зерно первого уровня.
+            workers: Количество процессов; по умолчанию - число ядер.
+
+        Returns:
+            Итератор записей; для уровней, не прошедших проверку, - None.
+        """
+        tasks = [(seed + index, width, height, generator_name) for index in range(count)]
+        chunk_size = max(1, count // ((workers or 1) * 16))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(LevelPackBuilder.build_record, tasks, chunksize=chunk_size)
+
+    @staticmethod
+    def build_record(task: tuple[int, int, int, str]) -> LevelRecord | None:
+        """
+        Генерирует и проверяет один уровень. Выполняется в процессе пула.
+
+        Args:
+            task: Зерно, ширина, высота и ключ стратегии генерации.
+
+        Returns:
+            Запись уровня или None, если уровень не прошёл проверку.
+        """
+        seed, width, height, generator_name = task
+        random.seed(seed)
+        enter_x = random.randrange(1, width - 1)
+        matrix = Matrix(width, height, LevelRecord.WALL, LevelRecord.PASSAGE)
+        maze = Maze(MatrixPathBuilder(enter_x, 0, matrix), 1,
+                    generator=LevelPackBuilder.GENERATORS[generator_name]())
+
+        optimal_distance = LevelPackBuilder.validate(maze)
+        if optimal_distance is None:
+            return None
+        return LevelRecord(seed, generator_name, width, height,
+                           maze.entrance_coordinate, maze.exit_coordinate, optimal_distance,
+                           LevelRecord.pack_passages(matrix))
+
+    @staticmethod
+    def validate(maze: Maze) -> int | None:
+        """
+        Проверяет связность лабиринта и достижимость выхода.
+
+        Args:
+            maze: Сгенерированный лабиринт.
+
+        Returns:
+            Длина кратчайшего пути от входа до выхода или None, если проверка не пройдена.
+        """
+        matrix = maze.to_matrix()
+        exit_x, exit_y = maze.exit_coordinate
+        if not LevelPackBuilder.__opens_to_border(matrix, exit_x, exit_y, maze.entrance_coordinate):
+            return None
+
+        dijkstra = Dijkstra(MatrixGraph(matrix, matrix.zero_symbol), *maze.entrance_coordinate)
+        distance = dijkstra.get_distance(exit_x, exit_y)
+        if distance == Dijkstra.INFINITY or Dijkstra.INFINITY in dijkstra.distances:
+            return None
+        return distance
+
+    @staticmethod
+    def __opens_to_border(matrix: Matrix, x: int, y: int, entrance: tuple[int, int]) -> bool:
+        """
+        Проверяет, что проходная клетка (x, y) лежит на границе или граничит
+        с проходной клеткой на границе матрицы. Вход не считается проходом
+        на границе, иначе клетка прямо под входом сошла бы за выход.
+
+        Args:
+            matrix: Матрица лабиринта.
+            x: Координата X клетки.
+            y: Координата Y клетки.
+            entrance: Координаты входа.
+        """
+        zero_code = matrix.code_of(matrix.zero_symbol)
+        for cell_x, cell_y in ((x, y), (x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if (0 <= cell_x < matrix.width and 0 <= cell_y < matrix.height and (cell_x, cell_y) != entrance and
+                    (cell_x in (0, matrix.width - 1) or cell_y in (0, matrix.height - 1)) and
+                    matrix.get_code(cell_x, cell_y) == zero_code):
+                return True
+        return False
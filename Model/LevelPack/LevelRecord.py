@@ -0,0 +1,129 @@
+from Model.LevelGeneration.Matrix import Matrix
+
+
+class LevelRecord:
+    """
+    Готовый проверенный уровень из набора уровней.
+
+    Хранит размеры лабиринта, сетку проходов, координаты входа и выхода,
+    зерно и стратегию генерации, а также длину кратчайшего пути от входа
+    до выхода. Сетка хранится побитово: бит с номером x * height + y равен 1,
+    если клетка (x, y) проходима, - так же, как ячейки лежат в Matrix. Поэтому
+    запись занимает width * height / 8 байтов и не зависит от цветов, которыми
+    лабиринт выводится в игре.
+    """
+    WALL = "#"
+    PASSAGE = "."
+
+    def __init__(self, seed: int, generator_name: str, width: int, height: int,
+                 entrance: tuple[int, int], exit_coordinate: tuple[int, int],
+                 optimal_distance: int, passages: bytes) -> None:
+        """
+        Инициализирует запись уровня.
+
+        Args:
+            seed: Зерно генератора случайных чисел, с которым построен уровень.
+            generator_name: Имя стратегии генерации.
+            width: Ширина лабиринта.
+            height: Высота лабиринта.
+            entrance: Координаты входа.
+            exit_coordinate: Координаты выхода.
+            optimal_distance: Длина кратчайшего пути от входа до выхода.
+            passages: Побитовая сетка проходов.
+        """
+        self.__seed = seed
+        self.__generator_name = generator_name
+        self.__width = width
+        self.__height = height
+        self.__entrance = entrance
+        self.__exit_coordinate = exit_coordinate
+        self.__optimal_distance = optimal_distance
+        self.__passages = passages
+
+    @property
+    def seed(self) -> int:
+        """
+        Возвращает зерно, с которым построен уровень.
+        """
+        return self.__seed
+
+    @property
+    def generator_name(self) -> str:
+        """
+        Возвращает имя стратегии генерации.
+        """
+        return self.__generator_name
+
+    @property
+    def width(self) -> int:
+        """
+        Возвращает ширину лабиринта.
+        """
+        return self.__width
+
+    @property
+    def height(self) -> int:
+        """
+        Возвращает высоту лабиринта.
+        """
+        return self.__height
+
+    @property
+    def entrance(self) -> tuple[int, int]:
+        """
+        Возвращает координаты входа.
+        """
+        return self.__entrance
+
+    @property
+    def exit_coordinate(self) -> tuple[int, int]:
+        """
+        Возвращает координаты выхода.
+        """
+        return self.__exit_coordinate
+
+    @property
+    def optimal_distance(self) -> int:
+        """
+        Возвращает длину кратчайшего пути от входа до выхода.
+        """
+        return self.__optimal_distance
+
+    @property
+    def passages(self) -> bytes:
+        """
+        Возвращает побитовую сетку проходов.
+        """
+        return self.__passages
+
+    @staticmethod
+    def pack_passages(matrix: Matrix) -> bytes:
+        """
+        Упаковывает проходы матрицы в побитовую сетку; все символы,
+        кроме символа прохода, считаются стенами.
+
+        Args:
+            matrix: Матрица лабиринта.
+        """
+        table = bytearray(b"0" * Matrix.MAX_PALETTE_SIZE)
+        table[matrix.code_of(matrix.zero_symbol)] = ord("1")
+        bits = matrix.cells.translate(table)
+        return int(bits[::-1] or b"0", 2).to_bytes((len(bits) + 7) // 8, "little")
+
+    def to_matrix(self, one_symbol: object, zero_symbol: object) -> Matrix:
+        """
+        Восстанавливает матрицу лабиринта с заданными символами стен и проходов.
+
+        Args:
+            one_symbol: Символ стены.
+            zero_symbol: Символ прохода.
+        """
+        height = self.__height
+        size = self.__width * height
+        bits = format(int.from_bytes(self.__passages, "little"), f"0{size}b")[::-1]
+        matrix = Matrix(self.__width, height, one_symbol, zero_symbol)
+        index = bits.find("1")
+        while index >= 0:
+            matrix.set_zero(index // height, index % height)
+            index = bits.find("1", index + 1)
+        return matrix
@@ -1,6 +1,7 @@
-import keyboard
 from typing import Any
 
+from Model.Input.InputLoop import InputLoop
+
 
 class Menu:
     """
@@ -20,19 +21,26 @@ class Menu:
         self.__view = view
         self.__cursor_position = 0
 
-    def get_selected_item(self) -> str:
+    async def get_selected_item(self, input_loop: InputLoop) -> str:
         """
         Отображает меню и ожидает выбора пользователя.
 
+        Нажатия обрабатываются пакетами; меню перерисовывается только если
+        положение курсора изменилось.
+
+        Args:
+            input_loop: Источник нажатий клавиш.
+
         Возвращает:
             Строку с текстом выбранного пункта меню.
         """
+        self.__view.Visualize(self.__cursor_position, self.__items, self.__general_banner)
+
         while True:
-            self.__view.Visualize(self.__cursor_position, self.__items, self.__general_banner)
-            user_input = keyboard.read_event()
+            previous_position = self.__cursor_position
 
-            if user_input.event_type == keyboard.KEY_DOWN:
-                match user_input.name:
+            for key in await input_loop.next_batch():
+                match key:
                     case "up":
                         self.__cursor_position = max(0, self.__cursor_position - 1)
 
@@ -41,3 +49,6 @@ class Menu:
 
                     case "enter":
                         return self.__items[self.__cursor_position]
+
+            if self.__cursor_position != previous_position:
+                self.__view.Visualize(self.__cursor_position, self.__items, self.__general_banner)
@@ -0,0 +1,114 @@
+import os
+from contextlib import AbstractContextManager, nullcontext
+
+from Model.Profiling.ProfilerTimer import ProfilerTimer
+
+
+class Profiler:
+    """
+    Статический класс необязательной инструментации игрового цикла.
+
+    Собирает длительности участков кода (генерация, построение графа, поиск пути,
+    ожидание ввода, отрисовка, очистка) и счётчики (записанные ячейки, выведенные
+    байты, вершины графа). По умолчанию выключен: measure возвращает общий пустой
+    контекстный менеджер, а дорогие для подсчёта счётчики вызывающий код
+    проверяет через Profiler.enabled. Включается переменной окружения MAZE_PROFILE
+    или флагом --profile в main.py.
+    """
+    ENVIRONMENT_VARIABLE = "MAZE_PROFILE"
+    enabled = False
+
+    __DISABLED_TIMER = nullcontext()
+    __timings: dict[str, list[float]] = {}
+    __counters: dict[str, int] = {}
+
+    @classmethod
+    def enable(cls) -> None:
+        """
+        Включает сбор замеров и счётчиков.
+        """
+        cls.enabled = True
+
+    @classmethod
+    def enable_from_environment(cls) -> None:
+        """
+        Включает профилирование, если задана непустая переменная окружения MAZE_PROFILE
+        со значением, отличным от "0".
+        """
+        if os.environ.get(Profiler.ENVIRONMENT_VARIABLE, "0") not in ("", "0"):
+            cls.enable()
+
+    @classmethod
+    def measure(cls, name: str) -> AbstractContextManager:
+        """
+        Возвращает контекстный менеджер, замеряющий длительность блока.
+
+        Args:
+            name: Имя замера.
+        """
+        if not cls.enabled:
+            return Profiler.__DISABLED_TIMER
+        return ProfilerTimer(name, cls.__record)
+
+    @classmethod
+    def count(cls, name: str, amount: int = 1) -> None:
+        """
+        Увеличивает счётчик, если профилирование включено.
+
+        Args:
+            name: Имя счётчика.
+            amount: Величина увеличения.
+        """
+        if cls.enabled:
+            cls.__counters[name] = cls.__counters.get(name, 0) + amount
+
+    @classmethod
+    def last(cls, name: str) -> float:
+        """
+        Возвращает длительность последнего замера в секундах или 0, если замеров не было.
+
+        Args:
+            name: Имя замера.
+        """
+        timing = cls.__timings.get(name)
+        return timing[3] if timing else 0.0
+
+    @classmethod
+    def overlay(cls) -> str:
+        """
+        Возвращает строку отладки с длительностями последнего кадра.
+        """
+        return (f"[профиль] кадр: {cls.last('frame') * 1000:.2f} мс | "
+                f"отрисовка: {cls.last('render') * 1000:.2f} мс | "
+                f"ожидание ввода: {cls.last('input_wait') * 1000:.0f} мс")
+
+    @classmethod
+    def summary(cls) -> str:
+        """
+        Возвращает сводную таблицу всех замеров и счётчиков.
+        """
+        lines = [f"{'замер':<16}{'вызовов':>10}{'всего, мс':>14}{'среднее, мс':>14}{'макс, мс':>12}"]
+        for name, (count, total, maximum, last) in sorted(cls.__timings.items()):
+            lines.append(f"{name:<16}{int(count):>10}{total * 1000:>14.2f}"
+                         f"{total / count * 1000:>14.3f}{maximum * 1000:>12.3f}")
+        for name, value in sorted(cls.__counters.items()):
+            lines.append(f"{name:<16}{value:>10}")
+        return "\n".join(lines)
+
+    @classmethod
+    def __record(cls, name: str, seconds: float) -> None:
+        """
+        Добавляет длительность замера в статистику: количество, сумма, максимум, последнее значение.
+
+        Args:
+            name: Имя замера.
+            seconds: Длительность в секундах.
+        """
+        timing = cls.__timings.get(name)
+        if timing is None:
+            cls.__timings[name] = [1, seconds, seconds, seconds]
+        else:
+            timing[0] += 1
+            timing[1] += seconds
+            timing[2] = max(timing[2], seconds)
+            timing[3] = seconds
@@ -0,0 +1,33 @@
+import time
+from typing import Callable
+
+
+class ProfilerTimer:
+    """
+    Контекстный менеджер, замеряющий длительность блока кода.
+    По выходе из блока передаёт имя замера и длительность в секундах в функцию записи.
+    """
+    def __init__(self, name: str, record: Callable[[str, float], None]) -> None:
+        """
+        Инициализирует таймер.
+
+        Args:
+            name: Имя замера.
+            record: Функция, принимающая имя замера и длительность в секундах.
+        """
+        self.__name = name
+        self.__record = record
+        self.__start = 0.0
+
+    def __enter__(self) -> "ProfilerTimer":
+        """
+        Запоминает момент входа в блок.
+        """
+        self.__start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exception_info: object) -> None:
+        """
+        Передаёт длительность блока в функцию записи.
+        """
+        self.__record(self.__name, time.perf_counter() - self.__start)
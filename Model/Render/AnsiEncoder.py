@@ -0,0 +1,144 @@
+import re
+import sys
+
+from Model.colors import Color
+
+
+class AnsiEncoder:
+    """
+    Склеивает коды ячеек строки в строку вывода, выводя цвет только при его смене.
+
+    Символ ячейки, построенный Color, содержит собственную последовательность цвета
+    и завершающий Color.RESET, поэтому простая склейка повторяет их в каждой ячейке.
+    Кодировщик один раз разбирает каждый символ палитры на стиль и видимый текст
+    и строит таблицу переходов: для каждой пары соседних кодов хранится то, что
+    нужно вывести для второй ячейки - только текст, если стиль не меняется, или
+    новый стиль и текст. В конце строки выводится один сброс. Склейка строки
+    выполняется одним проходом map по парам кодов без цикла на Python.
+
+    Новый стиль выводится без сброса, если он задаёт те же или более широкие
+    атрибуты (цвет текста, цвет фона), что и предыдущий, - иначе сначала
+    выводится Color.RESET. Цвет распознаётся в любой из форм, которые строит
+    Color: 24-битной, из палитры 256 цветов и из 16 стандартных. Символы,
+    у которых последовательности стоят внутри текста, выводятся как есть,
+    после них состояние терминала считается неизвестным.
+    """
+    SGR_SEQUENCE = re.compile(r"\033\[([0-9;]*)m")
+    SYMBOL_LAYOUT = re.compile(r"((?:\033\[[0-9;]*m)*)([^\033]*)(?:\033\[0?m)?", re.DOTALL)
+    OVERRIDABLE_ATTRIBUTES = frozenset(("38", "48"))
+    FOREGROUND_PARAMETERS = frozenset(["38", "39"] + [str(code) for code in (*range(30, 38), *range(90, 98))])
+    BACKGROUND_PARAMETERS = frozenset(["48", "49"] + [str(code) for code in (*range(40, 48), *range(100, 108))])
+    CODE_RANGE = 256
+
+    def __init__(self, palette: list[object]) -> None:
+        """
+        Инициализирует кодировщик для палитры.
+
+        Args:
+            palette: Палитра: символ с кодом c хранится по индексу c. Список может
+                пополняться, таблица переходов тогда перестраивается при следующей склейке.
+        """
+        self.__palette = palette
+        self.__compiled_size = 0
+        self.__openings: list[str] = []
+        self.__closings: list[str] = []
+        self.__transitions: dict[int, str] = {}
+
+    def encode(self, codes: bytes | bytearray) -> str:
+        """
+        Склеивает ячейки с заданными кодами.
+
+        Args:
+            codes: Коды ячеек в порядке вывода.
+
+        Returns:
+            Строка, после вывода которой терминал возвращается к стилю по умолчанию.
+        """
+        if not codes:
+            return ""
+        if self.__compiled_size != len(self.__palette):
+            self.__compile()
+
+        pairs = bytearray(2 * (len(codes) - 1))
+        if sys.byteorder == "little":
+            pairs[0::2], pairs[1::2] = codes[1:], codes[:-1]
+        else:
+            pairs[0::2], pairs[1::2] = codes[:-1], codes[1:]
+        return (self.__openings[codes[0]]
+                + "".join(map(self.__transitions.__getitem__, memoryview(pairs).cast("H")))
+                + self.__closings[codes[-1]])
+
+    def __compile(self) -> None:
+        """
+        Разбирает символы палитры и строит таблицы начала строки, переходов и конца строки.
+        Ключ перехода - пара (предыдущий код, следующий код), упакованная в одно число.
+        """
+        parsed = [AnsiEncoder.__parse(symbol) for symbol in self.__palette]
+        default = ("", "", frozenset())
+        self.__openings = [AnsiEncoder.__transition(default, cell) for cell in parsed]
+        self.__closings = [Color.RESET if cell[0] or cell[2] is None else "" for cell in parsed]
+        self.__transitions = {previous * AnsiEncoder.CODE_RANGE + code: AnsiEncoder.__transition(parsed[previous], cell)
+                              for previous in range(len(parsed)) for code, cell in enumerate(parsed)}
+        self.__compiled_size = len(parsed)
+
+    @staticmethod
+    def __transition(previous: tuple[str, str, frozenset[str] | None],
+                     cell: tuple[str, str, frozenset[str] | None]) -> str:
+        """
+        Возвращает вывод для ячейки cell, идущей после ячейки previous.
+
+        Args:
+            previous: Разобранный символ предыдущей ячейки.
+            cell: Разобранный символ ячейки.
+        """
+        previous_style, _, previous_attributes = previous
+        style, text, attributes = cell
+        if attributes is None:
+            return (Color.RESET if previous_style or previous_attributes is None else "") + text
+        if previous_attributes is not None and style == previous_style:
+            return text
+        if style == "":
+            return Color.RESET + text
+        if (previous_attributes is not None and previous_attributes <= attributes
+                and attributes <= AnsiEncoder.OVERRIDABLE_ATTRIBUTES):
+            return style + text
+        return Color.RESET + style + text
+
+    @staticmethod
+    def __parse(symbol: object) -> tuple[str, str, frozenset[str] | None]:
+        """
+        Разбирает символ ячейки на стиль, видимый текст и набор задаваемых атрибутов.
+
+        Args:
+            symbol: Символ ячейки.
+
+        Returns:
+            Кортеж (стиль, текст, атрибуты). Для символа, который нельзя разобрать,
+            возвращается (пустая строка, символ целиком, None).
+        """
+        text = str(symbol)
+        layout = AnsiEncoder.SYMBOL_LAYOUT.fullmatch(text)
+        if layout is None:
+            return "", text, None
+        style = layout.group(1)
+        attributes = frozenset(AnsiEncoder.__attribute(parameters.split(";")[0])
+                               for parameters in AnsiEncoder.SGR_SEQUENCE.findall(style))
+        if "0" in attributes or "" in attributes:
+            return "", text, None
+        return style, layout.group(2), attributes
+
+    @staticmethod
+    def __attribute(parameter: str) -> str:
+        """
+        Возвращает атрибут, который задаёт первый параметр последовательности SGR:
+        "38" для любой формы цвета текста, "48" для любой формы цвета фона,
+        иначе сам параметр.
+
+        Args:
+            parameter: Первый параметр последовательности.
+        """
+        if parameter in AnsiEncoder.FOREGROUND_PARAMETERS:
+            return "38"
+        if parameter in AnsiEncoder.BACKGROUND_PARAMETERS:
+            return "48"
+        return parameter
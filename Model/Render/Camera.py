@@ -0,0 +1,128 @@
+import os
+
+
+class Camera:
+    """
+    Окно просмотра уровня, которое следует за персонажем.
+
+    Хранит левый верхний угол и размер видимой области в клетках. Окно сдвигается,
+    только когда персонаж подходит к его краю ближе чем на MARGIN клеток (в маленьком
+    окне - ближе чем на четверть его размера), и тогда центрируется на персонаже,
+    поэтому полная перерисовка нужна редко. Окно никогда не выходит за границы уровня.
+    """
+    MARGIN = 3
+
+    def __init__(self, level_width: int, level_height: int, columns: int, rows: int) -> None:
+        """
+        Инициализирует окно в левом верхнем углу уровня.
+
+        Args:
+            level_width: Ширина уровня в клетках.
+            level_height: Высота уровня в клетках.
+            columns: Ширина окна в клетках; ограничивается шириной уровня.
+            rows: Высота окна в клетках; ограничивается высотой уровня.
+        """
+        self.__level_width = level_width
+        self.__level_height = level_height
+        self.__columns = max(1, min(columns, level_width))
+        self.__rows = max(1, min(rows, level_height))
+        self.__left = 0
+        self.__top = 0
+
+    @classmethod
+    def for_terminal(cls, level_width: int, level_height: int, cell_width: int,
+                     reserved_rows: int, reserved_columns: int = 0) -> "Camera":
+        """
+        Создаёт окно по размеру терминала. Если размер терминала узнать нельзя,
+        например при выводе не в терминал или в псевдотерминал без заданного размера,
+        окно охватывает весь уровень.
+
+        Args:
+            level_width: Ширина уровня в клетках.
+            level_height: Высота уровня в клетках.
+            cell_width: Количество колонок терминала на одну клетку.
+            reserved_rows: Строки терминала под строкой состояния.
+            reserved_columns: Колонки терминала справа от окна, например под мини-карту.
+        """
+        try:
+            size = os.get_terminal_size()
+        except OSError:
+            size = None
+        if size is None or size.columns <= 0 or size.lines <= 0:
+            return cls(level_width, level_height, level_width, level_height)
+        return cls(level_width, level_height,
+                   (size.columns - reserved_columns) // cell_width,
+                   size.lines - reserved_rows)
+
+    @property
+    def left(self) -> int:
+        """
+        Возвращает координату X левой колонки окна.
+        """
+        return self.__left
+
+    @property
+    def top(self) -> int:
+        """
+        Возвращает координату Y верхней строки окна.
+        """
+        return self.__top
+
+    @property
+    def columns(self) -> int:
+        """
+        Возвращает ширину окна в клетках.
+        """
+        return self.__columns
+
+    @property
+    def rows(self) -> int:
+        """
+        Возвращает высоту окна в клетках.
+        """
+        return self.__rows
+
+    def contains(self, x: int, y: int) -> bool:
+        """
+        Проверяет, попадает ли клетка (x, y) в окно.
+
+        Args:
+            x: Координата X.
+            y: Координата Y.
+        """
+        return self.__left <= x < self.__left + self.__columns and self.__top <= y < self.__top + self.__rows
+
+    def follow(self, x: int, y: int) -> bool:
+        """
+        Сдвигает окно к персонажу, если он подошёл к краю окна.
+
+        Args:
+            x: Координата X персонажа.
+            y: Координата Y персонажа.
+
+        Returns:
+            True, если окно сдвинулось и кадр нужно вывести целиком.
+        """
+        left = Camera.__scroll(self.__left, x, self.__columns, self.__level_width)
+        top = Camera.__scroll(self.__top, y, self.__rows, self.__level_height)
+        if (left, top) == (self.__left, self.__top):
+            return False
+        self.__left = left
+        self.__top = top
+        return True
+
+    @staticmethod
+    def __scroll(origin: int, position: int, size: int, level_size: int) -> int:
+        """
+        Возвращает новое начало окна по одной оси.
+
+        Args:
+            origin: Текущее начало окна.
+            position: Координата персонажа.
+            size: Размер окна.
+            level_size: Размер уровня.
+        """
+        margin = min(Camera.MARGIN, size // 4)
+        if origin + margin <= position < origin + size - margin:
+            return origin
+        return min(max(0, position - size // 2), level_size - size)
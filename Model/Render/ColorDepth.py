@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class ColorDepth(Enum):
+    """
+    Перечисление, определяющее количество цветов, которое поддерживает терминал.
+    Значение элемента совпадает с вариантом флага --color в main.py.
+    """
+    TRUECOLOR = "truecolor"
+    COLORS_256 = "256"
+    COLORS_16 = "16"
@@ -0,0 +1,153 @@
+import re
+import unicodedata
+
+from Model.LevelGeneration.Matrix import Matrix
+from Model.Profiling.Profiler import Profiler
+from Model.Render.Camera import Camera
+from Model.Render.Renderer import Renderer
+from Model.Render.Terminal import Terminal
+
+
+class FrameDiffRenderer:
+    """
+    Выводит матрицу на экран, перерисовывая между кадрами только изменившиеся ячейки.
+
+    Выводится только область матрицы внутри окна Camera, поэтому стоимость кадра
+    зависит от размера экрана, а не уровня. Первый кадр (и кадр после invalidate)
+    выводится целиком. Дальше для каждой отмеченной ячейки внутри окна выводится
+    последовательность позиционирования курсора и сам символ; соседние ячейки
+    строки выводятся одним отрезком, а цвет - только при смене. Кадр добавляется
+    в буфер вывода и уходит в консоль одной записью при Renderer.flush вместе
+    со строкой состояния. После кадра курсор ставится под окном, чтобы следующий
+    вывод попадал в строку состояния.
+    """
+    CELL_WIDTH = 2
+    ESCAPE_SEQUENCE = re.compile(r"\033\[[0-9;]*m")
+
+    def __init__(self, matrix: Matrix, camera: Camera | None = None) -> None:
+        """
+        Инициализирует рендерер для матрицы.
+
+        Args:
+            matrix: Матрица, которая выводится на экран.
+            camera: Окно просмотра; по умолчанию выводится вся матрица.
+        """
+        self.__matrix = matrix
+        self.__camera = camera or Camera(matrix.width, matrix.height, matrix.width, matrix.height)
+        self.__dirty_cells: set[tuple[int, int]] = set()
+        self.__full_redraw = True
+        self.__symbol_widths: dict[object, int] = {}
+
+    def mark_dirty(self, x: int, y: int) -> None:
+        """
+        Отмечает ячейку (x, y) как изменившуюся с прошлого кадра.
+
+        Args:
+            x: Координата X ячейки.
+            y: Координата Y ячейки.
+        """
+        self.__dirty_cells.add((x, y))
+
+    def invalidate(self) -> None:
+        """
+        Требует вывести следующий кадр целиком, например после очистки экрана.
+        """
+        self.__full_redraw = True
+
+    def render_frame(self) -> None:
+        """
+        Выводит кадр: целиком, если это первый кадр, иначе только изменившиеся ячейки.
+        """
+        with Profiler.measure("render"):
+            if self.__full_redraw:
+                if Profiler.enabled:
+                    Profiler.count("cells_written", self.__camera.columns * self.__camera.rows)
+                frame = self.__full_frame()
+                self.__full_redraw = False
+            else:
+                frame = self.__diff_frame()
+            self.__dirty_cells.clear()
+
+            frame.append(Terminal.cursor_position(self.__camera.rows + 1, 1))
+            frame.append(Terminal.ERASE_SCREEN_END)
+            Terminal.write("".join(frame))
+
+    def __full_frame(self) -> list[str]:
+        """
+        Собирает кадр со всеми строками матрицы внутри окна.
+
+        Символы шире CELL_WIDTH колонок сдвигают остаток строки, поэтому после
+        каждого такого символа остаток строки выводится повторно с правильной позиции.
+        """
+        matrix = self.__matrix
+        camera = self.__camera
+        left, right = camera.left, camera.left + camera.columns
+        wide_codes = {code for code, symbol in enumerate(matrix.palette)
+                      if self.__width_of(symbol) > FrameDiffRenderer.CELL_WIDTH}
+        Renderer.clear()
+        frame = []
+
+        for row, y in enumerate(range(camera.top, camera.top + camera.rows)):
+            frame.append(Terminal.cursor_position(row + 1, 1))
+            frame.append(matrix.row_slice_to_string(y, left, right))
+            if not wide_codes:
+                continue
+            for x, code in enumerate(matrix.cells[left * matrix.height + y:(right - 1) * matrix.height:matrix.height],
+                                     start=left):
+                if code in wide_codes:
+                    frame.append(Terminal.cursor_position(row + 1, (x + 1 - left) * FrameDiffRenderer.CELL_WIDTH + 1))
+                    frame.append(matrix.row_slice_to_string(y, x + 1, right))
+                    frame.append(Terminal.ERASE_LINE_END)
+        return frame
+
+    def __diff_frame(self) -> list[str]:
+        """
+        Собирает кадр только из изменившихся ячеек внутри окна.
+
+        Соседние изменившиеся ячейки одной строки выводятся одним отрезком после
+        одного позиционирования курсора и склеиваются через AnsiEncoder. Если
+        изменившаяся ячейка шире CELL_WIDTH колонок, отрезок на ней заканчивается,
+        а соседняя справа ячейка выводится повторно со своей позиции, чтобы закрыть
+        залезший на неё символ.
+        """
+        matrix = self.__matrix
+        camera = self.__camera
+        right = camera.left + camera.columns
+        cells = {cell for cell in self.__dirty_cells if camera.contains(*cell)}
+        wide_cells = {(x, y) for x, y in cells if self.__width_of(matrix.get(x, y)) > FrameDiffRenderer.CELL_WIDTH}
+        cells.update((x + 1, y) for x, y in wide_cells if x + 1 < right)
+
+        Profiler.count("cells_written", len(cells))
+        frame = []
+        run_start = None
+        ordered = sorted(cells, key=lambda cell: (cell[1], cell[0]))
+        for index, (x, y) in enumerate(ordered):
+            if run_start is None:
+                run_start = x
+            following = ordered[index + 1] if index + 1 < len(ordered) else None
+            if following == (x + 1, y) and (x, y) not in wide_cells:
+                continue
+
+            frame.append(Terminal.cursor_position(y - camera.top + 1,
+                                                  (run_start - camera.left) * FrameDiffRenderer.CELL_WIDTH + 1))
+            frame.append(matrix.row_slice_to_string(y, run_start, x + 1))
+            if x == right - 1:
+                frame.append(Terminal.ERASE_LINE_END)
+            run_start = None
+        return frame
+
+    def __width_of(self, symbol: object) -> int:
+        """
+        Возвращает количество колонок консоли, занимаемых символом ячейки.
+        Управляющие последовательности не учитываются, широкие символы занимают две колонки.
+
+        Args:
+            symbol: Символ ячейки.
+        """
+        width = self.__symbol_widths.get(symbol)
+        if width is None:
+            text = FrameDiffRenderer.ESCAPE_SEQUENCE.sub("", str(symbol))
+            width = sum(2 if unicodedata.east_asian_width(char) in "WF" else 1
+                        for char in text if not unicodedata.combining(char))
+            self.__symbol_widths[symbol] = width
+        return width
@@ -0,0 +1,87 @@
+from Model.Render.Camera import Camera
+from Model.Render.FrameDiffRenderer import FrameDiffRenderer
+from Model.Render.Terminal import Terminal
+
+
+class MiniMap:
+    """
+    Уменьшенная схема всего уровня, выводимая рядом с окном просмотра.
+
+    Каждый символ мини-карты обозначает прямоугольный блок клеток уровня и
+    показывает, исследован ли блок, попадает ли он в окно Camera и находится
+    ли в нём персонаж. Исследованные блоки отмечаются по мере открытия клеток,
+    поэтому вывод мини-карты не просматривает уровень и стоит не больше её размера.
+    """
+    UNKNOWN = "·"
+    EXPLORED = "▒"
+    UNKNOWN_IN_VIEW = "░"
+    EXPLORED_IN_VIEW = "▓"
+    CHARACTER = "@"
+    MAX_COLUMNS = 24
+    MAX_ROWS = 12
+    MARGIN_COLUMNS = 2
+
+    def __init__(self, level_width: int, level_height: int, max_rows: int = MAX_ROWS) -> None:
+        """
+        Инициализирует мини-карту уровня.
+
+        Args:
+            level_width: Ширина уровня в клетках.
+            level_height: Высота уровня в клетках.
+            max_rows: Наибольшая высота мини-карты в строках, не больше MAX_ROWS;
+                обычно равна высоте окна просмотра.
+        """
+        self.__block_width = -(-level_width // MiniMap.MAX_COLUMNS)
+        self.__block_height = -(-level_height // max(1, min(max_rows, MiniMap.MAX_ROWS)))
+        self.__columns = -(-level_width // self.__block_width)
+        self.__rows = -(-level_height // self.__block_height)
+        self.__explored = bytearray(self.__columns * self.__rows)
+
+    @staticmethod
+    def reserved_columns() -> int:
+        """
+        Возвращает количество колонок терминала, которые занимает мини-карта вместе с отступом.
+        """
+        return MiniMap.MAX_COLUMNS + MiniMap.MARGIN_COLUMNS
+
+    def mark_explored(self, x: int, y: int) -> None:
+        """
+        Отмечает блок, содержащий клетку (x, y), как исследованный.
+
+        Args:
+            x: Координата X клетки.
+            y: Координата Y клетки.
+        """
+        self.__explored[y // self.__block_height * self.__columns + x // self.__block_width] = 1
+
+    def render(self, camera: Camera, character_position: tuple[int, int] | None) -> None:
+        """
+        Добавляет мини-карту в буфер вывода справа от окна просмотра.
+
+        Args:
+            camera: Окно просмотра; блоки внутри него выделяются.
+            character_position: Координаты персонажа или None.
+        """
+        block_width = self.__block_width
+        block_height = self.__block_height
+        view_columns = range(camera.left // block_width, (camera.left + camera.columns - 1) // block_width + 1)
+        view_rows = range(camera.top // block_height, (camera.top + camera.rows - 1) // block_height + 1)
+        character_block = None
+        if character_position is not None:
+            character_block = (character_position[0] // block_width, character_position[1] // block_height)
+        screen_column = camera.columns * FrameDiffRenderer.CELL_WIDTH + MiniMap.MARGIN_COLUMNS + 1
+
+        frame = []
+        for row in range(self.__rows):
+            symbols = []
+            for column in range(self.__columns):
+                explored = self.__explored[row * self.__columns + column]
+                if (column, row) == character_block:
+                    symbols.append(MiniMap.CHARACTER)
+                elif column in view_columns and row in view_rows:
+                    symbols.append(MiniMap.EXPLORED_IN_VIEW if explored else MiniMap.UNKNOWN_IN_VIEW)
+                else:
+                    symbols.append(MiniMap.EXPLORED if explored else MiniMap.UNKNOWN)
+            frame.append(Terminal.cursor_position(row + 1, screen_column))
+            frame.append("".join(symbols))
+        Terminal.write("".join(frame))
@@ -1,28 +1,50 @@
-import os
-
+from Model.Profiling.Profiler import Profiler
+from Model.Render.Terminal import Terminal
 from Model.colors import Color
 
 
 class Renderer:
     """
     Статический класс для управления выводом в консоль, включая очистку экрана и изменение цвета текста.
+
+    Вывод накапливается в буфере Terminal и попадает на экран при вызове flush,
+    поэтому многострочные экраны выводятся одной записью.
     """
     @staticmethod
     def render(string: str) -> None:
         """
-        Выводит переданную строку в консоль.
+        Добавляет переданную строку с переводом строки в буфер вывода.
 
         Args:
             string: Строка для вывода.
         """
-        print(string)
+        Terminal.write(string + "\n")
+
+    @staticmethod
+    def write(string: str) -> None:
+        """
+        Выводит строку в консоль одной записью без перевода строки и сразу сбрасывает буфер.
+
+        Args:
+            string: Строка для вывода, может содержать управляющие последовательности.
+        """
+        Terminal.write(string)
+        Terminal.flush()
+
+    @staticmethod
+    def flush() -> None:
+        """
+        Выводит на экран всё, что накоплено в буфере.
+        """
+        Terminal.flush()
 
     @staticmethod
     def clear() -> None:
         """
         Очищает экран консоли.
         """
-        os.system("cls")
+        with Profiler.measure("clear"):
+            Terminal.clear()
 
     @staticmethod
     def set_render_color(r: int, g: int, b: int) -> None:
@@ -34,11 +56,11 @@ class Renderer:
             g: Зеленый компонент (0-255).
             b: Синий компонент (0-255).
         """
-        print(f"\033[38;2;{r};{g};{b}m")
+        Terminal.write(Color.foreground(r, g, b))
 
     @staticmethod
     def reset_render_color() -> None:
         """
         Сбрасывает цвет текста в консоли к значению по умолчанию.
         """
-        print(Color.RESET)
+        Terminal.write(Color.RESET)
@@ -0,0 +1,157 @@
+import os
+import sys
+from typing import TextIO
+
+from Model.Profiling.Profiler import Profiler
+
+
+class Terminal:
+    """
+    Статический класс управления терминалом через ANSI-последовательности.
+
+    Все команды выполняются в процессе игры без запуска внешних программ.
+    Вывод накапливается в общем буфере и отправляется в поток одной записью
+    при вызове flush; каждая такая запись обрамляется последовательностями
+    синхронного обновления, чтобы терминал показывал кадр целиком.
+    """
+    CLEAR_SCREEN = "\033[2J"
+    CURSOR_HOME = "\033[H"
+    CURSOR_POSITION = "\033[{};{}H"
+    ERASE_LINE_END = "\033[K"
+    ERASE_SCREEN_END = "\033[J"
+    ALTERNATE_SCREEN_ON = "\033[?1049h"
+    ALTERNATE_SCREEN_OFF = "\033[?1049l"
+    HIDE_CURSOR = "\033[?25l"
+    SHOW_CURSOR = "\033[?25h"
+    SYNCHRONIZED_UPDATE_BEGIN = "\033[?2026h"
+    SYNCHRONIZED_UPDATE_END = "\033[?2026l"
+    WINDOWS_STD_OUTPUT_HANDLE = -11
+    WINDOWS_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+
+    __buffer: list[str] = []
+    __output: TextIO | None = None
+
+    @classmethod
+    def set_output(cls, output: TextIO | None) -> None:
+        """
+        Перенаправляет вывод терминала в указанный поток.
+
+        Args:
+            output: Поток для вывода или None, чтобы выводить в sys.stdout.
+        """
+        cls.__output = output
+
+    @classmethod
+    def write(cls, string: str) -> None:
+        """
+        Добавляет строку в буфер вывода.
+
+        Args:
+            string: Строка, может содержать управляющие последовательности.
+        """
+        cls.__buffer.append(string)
+
+    @classmethod
+    def flush(cls) -> None:
+        """
+        Отправляет накопленный буфер в поток вывода одной записью.
+        """
+        if not cls.__buffer:
+            return
+        output = cls.__output or sys.stdout
+        payload = Terminal.SYNCHRONIZED_UPDATE_BEGIN + "".join(cls.__buffer) + Terminal.SYNCHRONIZED_UPDATE_END
+        if Profiler.enabled:
+            Profiler.count("bytes_emitted", len(payload.encode("utf-8")))
+        output.write(payload)
+        output.flush()
+        cls.__buffer.clear()
+
+    @staticmethod
+    def cursor_position(row: int, column: int) -> str:
+        """
+        Возвращает последовательность перемещения курсора.
+
+        Args:
+            row: Номер строки экрана, начиная с 1.
+            column: Номер колонки экрана, начиная с 1.
+        """
+        return Terminal.CURSOR_POSITION.format(row, column)
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Очищает экран и переводит курсор в левый верхний угол.
+        """
+        cls.write(Terminal.CLEAR_SCREEN + Terminal.CURSOR_HOME)
+
+    @classmethod
+    def home(cls) -> None:
+        """
+        Переводит курсор в левый верхний угол без очистки экрана.
+        """
+        cls.write(Terminal.CURSOR_HOME)
+
+    @classmethod
+    def enter_alternate_screen(cls) -> None:
+        """
+        Переключает терминал на альтернативный экранный буфер.
+        """
+        cls.write(Terminal.ALTERNATE_SCREEN_ON)
+
+    @classmethod
+    def leave_alternate_screen(cls) -> None:
+        """
+        Возвращает терминал к основному экранному буферу.
+        """
+        cls.write(Terminal.ALTERNATE_SCREEN_OFF)
+
+    @classmethod
+    def hide_cursor(cls) -> None:
+        """
+        Скрывает курсор.
+        """
+        cls.write(Terminal.HIDE_CURSOR)
+
+    @classmethod
+    def show_cursor(cls) -> None:
+        """
+        Показывает курсор.
+        """
+        cls.write(Terminal.SHOW_CURSOR)
+
+    @classmethod
+    def setup(cls) -> None:
+        """
+        Готовит терминал к игре: включает обработку ANSI-последовательностей в консоли
+        Windows, переключает на альтернативный экран и скрывает курсор.
+        """
+        cls.__enable_virtual_terminal()
+        cls.enter_alternate_screen()
+        cls.hide_cursor()
+        cls.flush()
+
+    @classmethod
+    def restore(cls) -> None:
+        """
+        Возвращает терминал в исходное состояние после игры.
+        """
+        cls.show_cursor()
+        cls.leave_alternate_screen()
+        cls.flush()
+
+    @staticmethod
+    def __enable_virtual_terminal() -> None:
+        """
+        Включает режим обработки виртуального терминала в консоли Windows.
+        В остальных системах ANSI-последовательности поддерживаются без настройки.
+        """
+        if os.name != "nt":
+            return
+
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(Terminal.WINDOWS_STD_OUTPUT_HANDLE)
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | Terminal.WINDOWS_VIRTUAL_TERMINAL_PROCESSING)
@@ -0,0 +1,80 @@
+import os
+import sys
+from typing import Mapping
+
+from Model.Render.ColorDepth import ColorDepth
+
+
+class TerminalCapabilities:
+    """
+    Статический класс определения возможностей терминала при запуске.
+
+    Глубина цвета определяется по переменным окружения COLORTERM и TERM, а если
+    они ничего не говорят - по числу цветов из базы terminfo. Модуль curses
+    импортируется только для этого запроса и может отсутствовать, например в Windows;
+    консоль Windows 10 с включённой обработкой виртуального терминала
+    поддерживает 24-битный цвет. Если определить глубину не удалось,
+    выбираются 16 цветов, которые поддерживает любой ANSI-терминал.
+    """
+    TRUECOLOR_TERMINAL_COLORS = 1 << 24
+    TRUECOLOR_NAMES = ("truecolor", "24bit")
+
+    @staticmethod
+    def detect_color_depth(environment: Mapping[str, str] | None = None) -> ColorDepth:
+        """
+        Определяет глубину цвета терминала.
+
+        Args:
+            environment: Переменные окружения; по умолчанию os.environ.
+
+        Returns:
+            Наибольшая глубина цвета, которую поддерживает терминал.
+        """
+        if environment is None:
+            environment = os.environ
+        if environment.get("COLORTERM", "").lower() in TerminalCapabilities.TRUECOLOR_NAMES:
+            return ColorDepth.TRUECOLOR
+        term = environment.get("TERM", "").lower()
+        if term.endswith("-direct") or any(name in term for name in TerminalCapabilities.TRUECOLOR_NAMES):
+            return ColorDepth.TRUECOLOR
+        if "256color" in term:
+            return ColorDepth.COLORS_256
+        if not term:
+            return ColorDepth.TRUECOLOR if os.name == "nt" else ColorDepth.COLORS_16
+        return TerminalCapabilities.__depth_from_colors(TerminalCapabilities.__terminfo_colors(term))
+
+    @staticmethod
+    def __depth_from_colors(colors: int) -> ColorDepth:
+        """
+        Переводит число цветов из terminfo в глубину цвета.
+
+        Args:
+            colors: Число цветов; отрицательное, если оно неизвестно.
+        """
+        if colors >= TerminalCapabilities.TRUECOLOR_TERMINAL_COLORS:
+            return ColorDepth.TRUECOLOR
+        if colors >= 256:
+            return ColorDepth.COLORS_256
+        return ColorDepth.COLORS_16
+
+    @staticmethod
+    def __terminfo_colors(term: str) -> int:
+        """
+        Возвращает число цветов терминала term из базы terminfo.
+
+        Args:
+            term: Имя терминала из переменной TERM.
+
+        Returns:
+            Значение возможности colors или -1, если curses недоступен,
+            терминала нет в базе или стандартный вывод не является файлом.
+        """
+        try:
+            import curses
+        except ImportError:
+            return -1
+        try:
+            curses.setupterm(term, sys.__stdout__.fileno())
+            return curses.tigetnum("colors")
+        except (curses.error, OSError, ValueError, AttributeError):
+            return -1
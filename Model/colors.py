@@ -1,7 +1,15 @@
+from Model.Render.ColorDepth import ColorDepth
+
+
 class Color:
     """
     Класс, содержащий статические методы и константы для работы с цветом в консоли
     с использованием ANSI-кодов.
+
+    RGB-цвета выводятся с глубиной, заданной set_depth: 24-битными последовательностями,
+    номером из палитры 256 цветов (куб 6x6x6 и шкала серого) или ближайшим из 16
+    стандартных цветов, у которого последовательность самая короткая. Номер
+    ближайшего цвета для каждого RGB вычисляется один раз и кэшируется.
     """
     RESET = "\033[0m"
     BLACK = "\033[30m"
@@ -13,8 +21,64 @@ class Color:
     CYAN = "\033[36m"
     WHITE = "\033[37m"
 
-    @staticmethod
-    def color_str_to_rgb(string: str, r: int, g: int, b: int) -> str:
+    ANSI_16_RGB = ((0, 0, 0), (128, 0, 0), (0, 128, 0), (128, 128, 0),
+                   (0, 0, 128), (128, 0, 128), (0, 128, 128), (192, 192, 192),
+                   (128, 128, 128), (255, 0, 0), (0, 255, 0), (255, 255, 0),
+                   (0, 0, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255))
+    CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+
+    __depth = ColorDepth.TRUECOLOR
+    __nearest: dict[tuple[ColorDepth, tuple[int, int, int]], int] = {}
+    __candidates: dict[ColorDepth, list[tuple[int, tuple[int, int, int]]]] = {}
+
+    @classmethod
+    def set_depth(cls, depth: ColorDepth) -> None:
+        """
+        Задаёт глубину цвета, с которой строятся последовательности. Строки, окрашенные
+        до вызова, не меняются, поэтому глубину нужно задать до создания игры.
+
+        Args:
+            depth: Глубина цвета терминала.
+        """
+        cls.__depth = depth
+
+    @classmethod
+    def depth(cls) -> ColorDepth:
+        """
+        Возвращает текущую глубину цвета.
+        """
+        return cls.__depth
+
+    @classmethod
+    def foreground(cls, r: int, g: int, b: int) -> str:
+        """
+        Возвращает последовательность, устанавливающую цвет текста.
+
+        Args:
+            r: Красный компонент (0-255).
+            g: Зеленый компонент (0-255).
+            b: Синий компонент (0-255).
+        """
+        if cls.__depth is ColorDepth.TRUECOLOR:
+            return f"\033[38;2;{r};{g};{b}m"
+        return cls.__indexed_sequence(cls.__nearest_index((r, g, b)), False)
+
+    @classmethod
+    def background(cls, r: int, g: int, b: int) -> str:
+        """
+        Возвращает последовательность, устанавливающую цвет фона.
+
+        Args:
+            r: Красный компонент (0-255).
+            g: Зеленый компонент (0-255).
+            b: Синий компонент (0-255).
+        """
+        if cls.__depth is ColorDepth.TRUECOLOR:
+            return f"\033[48;2;{r};{g};{b}m"
+        return cls.__indexed_sequence(cls.__nearest_index((r, g, b)), True)
+
+    @classmethod
+    def color_str_to_rgb(cls, string: str, r: int, g: int, b: int) -> str:
         """
         Окрашивает текст в заданный RGB цвет.
 
@@ -27,10 +91,10 @@ class Color:
         Returns:
             Строка с ANSI-кодами для цвета текста.
         """
-        return f"\033[38;2;{r};{g};{b}m{string}" + Color.RESET
+        return cls.foreground(r, g, b) + string + Color.RESET
 
-    @staticmethod
-    def color_str_back_to_rgb(string: str, r: int, g: int, b: int) -> str:
+    @classmethod
+    def color_str_back_to_rgb(cls, string: str, r: int, g: int, b: int) -> str:
         """
         Окрашивает фон текста в заданный RGB цвет.
 
@@ -43,4 +107,90 @@ class Color:
         Returns:
             Строка с ANSI-кодами для цвета фона.
         """
-        return f"\033[48;2;{r};{g};{b}m{string}" + Color.RESET
+        return cls.background(r, g, b) + string + Color.RESET
+
+    @classmethod
+    def compile_back_palette(cls, cells: list[tuple[str, int, int, int]]) -> list[str]:
+        """
+        Окрашивает фон набора ячеек так, чтобы ячейки с разными RGB цветами оставались
+        различимыми при текущей глубине цвета. Если ближайший цвет уже занят ячейкой
+        с другим RGB, выбирается следующий по близости. Приоритет у ячеек, идущих раньше.
+
+        Args:
+            cells: Кортежи (строка, r, g, b).
+
+        Returns:
+            Окрашенные строки в порядке cells.
+        """
+        if cls.__depth is ColorDepth.TRUECOLOR:
+            return [cls.color_str_back_to_rgb(*cell) for cell in cells]
+        assigned: dict[tuple[int, int, int], int] = {}
+        symbols = []
+        for string, r, g, b in cells:
+            rgb = (r, g, b)
+            if rgb not in assigned:
+                taken = set(assigned.values())
+                assigned[rgb] = next(index for index, _ in cls.__ranked_candidates(rgb) if index not in taken)
+            symbols.append(cls.__indexed_sequence(assigned[rgb], True) + string + Color.RESET)
+        return symbols
+
+    @classmethod
+    def __nearest_index(cls, rgb: tuple[int, int, int]) -> int:
+        """
+        Возвращает номер ближайшего к rgb цвета палитры текущей глубины.
+
+        Args:
+            rgb: Кортеж (r, g, b).
+        """
+        key = (cls.__depth, rgb)
+        index = cls.__nearest.get(key)
+        if index is None:
+            index = cls.__ranked_candidates(rgb)[0][0]
+            cls.__nearest[key] = index
+        return index
+
+    @classmethod
+    def __ranked_candidates(cls, rgb: tuple[int, int, int]) -> list[tuple[int, tuple[int, int, int]]]:
+        """
+        Возвращает цвета палитры текущей глубины, упорядоченные по удалённости от rgb.
+
+        Args:
+            rgb: Кортеж (r, g, b).
+        """
+        r, g, b = rgb
+        return sorted(cls.__palette_candidates(),
+                      key=lambda candidate: ((candidate[1][0] - r) ** 2 + (candidate[1][1] - g) ** 2
+                                             + (candidate[1][2] - b) ** 2))
+
+    @classmethod
+    def __palette_candidates(cls) -> list[tuple[int, tuple[int, int, int]]]:
+        """
+        Возвращает пары (номер, RGB) цветов палитры текущей глубины. Для 256 цветов
+        это куб 6x6x6 и шкала серого; первые 16 номеров не используются, так как
+        их оттенки зависят от настроек терминала.
+        """
+        candidates = cls.__candidates.get(cls.__depth)
+        if candidates is None:
+            if cls.__depth is ColorDepth.COLORS_16:
+                candidates = list(enumerate(Color.ANSI_16_RGB))
+            else:
+                levels = Color.CUBE_LEVELS
+                candidates = [(16 + 36 * red + 6 * green + blue, (levels[red], levels[green], levels[blue]))
+                              for red in range(6) for green in range(6) for blue in range(6)]
+                candidates += [(232 + step, (8 + 10 * step,) * 3) for step in range(24)]
+            cls.__candidates[cls.__depth] = candidates
+        return candidates
+
+    @classmethod
+    def __indexed_sequence(cls, index: int, background: bool) -> str:
+        """
+        Возвращает последовательность для цвета с номером index палитры текущей глубины.
+
+        Args:
+            index: Номер цвета.
+            background: True для цвета фона, False для цвета текста.
+        """
+        if cls.__depth is ColorDepth.COLORS_16:
+            base = (40 if background else 30) if index < 8 else (100 if background else 90)
+            return f"\033[{base + index % 8}m"
+        return f"\033[{48 if background else 38};5;{index}m"
@@ -0,0 +1,87 @@
+"""
+Проверки бесконечного лабиринта: после удаления строк выше окна игрок никогда
+не оказывается заперт и всегда может спуститься к последней порождённой строке.
+
+Запуск из корня проекта:
+    python -m unittest discover -s Tests
+"""
+import random
+import unittest
+from collections import deque
+
+from Model.LevelGeneration.EndlessMaze import EndlessMaze
+
+
+class EndlessMazeTest(unittest.TestCase):
+    """
+    Водит игрока случайными допустимыми ходами с перевесом вниз, как в режиме
+    «бесконечный коридор», и после каждого хода проверяет, что выход вниз есть.
+    """
+    WIDTH = 31
+    ROWS_BEHIND = 21
+    ROWS_AHEAD = 21
+    SEEDS = range(20)
+    MOVES = 1500
+    MOVE_WEIGHTS = {(0, 1): 4, (-1, 0): 2, (1, 0): 2, (0, -1): 3}
+
+    def test_player_always_reaches_last_row(self) -> None:
+        """
+        Из клетки игрока можно дойти до последней порождённой строки по строкам окна.
+        Достижимость меняется только при удалении строк, поэтому проверяется после него.
+        """
+        for seed in self.SEEDS:
+            with self.subTest(seed=seed):
+                random.seed(seed)
+                maze = EndlessMaze(self.WIDTH, "#", ".", self.ROWS_BEHIND, self.ROWS_AHEAD)
+                x, y = maze.entrance_x, 0
+                first_row = maze.first_row
+                for move in range(self.MOVES):
+                    x, y = self.__random_move(maze, x, y)
+                    maze.scroll_to(x, y)
+                    if maze.first_row != first_row:
+                        first_row = maze.first_row
+                        self.assertTrue(self.__reaches_last_row(maze, x, y), (move, x, y, first_row))
+
+    def __random_move(self, maze: EndlessMaze, x: int, y: int) -> tuple[int, int]:
+        """
+        Возвращает клетку после случайного допустимого хода из (x, y).
+
+        Args:
+            maze: Бесконечный лабиринт.
+            x: Координата X игрока.
+            y: Координата Y игрока.
+        """
+        moves = [(dx, dy) for dx, dy in self.MOVE_WEIGHTS
+                 if 0 <= x + dx < maze.width and y + dy >= 0 and maze.get_code(x + dx, y + dy) == EndlessMaze.ZERO_CODE]
+        if not moves:
+            return x, y
+        dx, dy = random.choices(moves, [self.MOVE_WEIGHTS[move] for move in moves])[0]
+        return x + dx, y + dy
+
+    @staticmethod
+    def __reaches_last_row(maze: EndlessMaze, x: int, y: int) -> bool:
+        """
+        Проверяет поиском в ширину по строкам окна, что из (x, y) достижима последняя строка.
+
+        Args:
+            maze: Бесконечный лабиринт.
+            x: Координата X игрока.
+            y: Координата Y игрока.
+        """
+        last_row = maze.last_row
+        visited = {(x, y)}
+        queue = deque(visited)
+        while queue:
+            cell_x, cell_y = queue.popleft()
+            if cell_y == last_row:
+                return True
+            for cell in ((cell_x + 1, cell_y), (cell_x - 1, cell_y), (cell_x, cell_y + 1), (cell_x, cell_y - 1)):
+                if (cell not in visited and 0 <= cell[0] < maze.width and maze.first_row <= cell[1] <= last_row
+                        and maze.get_code(*cell) == EndlessMaze.ZERO_CODE):
+                    visited.add(cell)
+                    queue.append(cell)
+        return False
+
+
+if __name__ == "__main__":
+    unittest.main()
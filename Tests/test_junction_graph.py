@@ -0,0 +1,131 @@
+"""
+Поведенческие проверки графа развилок: ответы Maze.distance_to_exit, Maze.route_to_exit
+и путь A*, развёрнутый JunctionGraph.expand_path, сравниваются с обычным поиском
+в ширину по клеткам матрицы.
+
+Запуск из корня проекта:
+    python -m unittest discover -s Tests
+"""
+import random
+import unittest
+from collections import deque
+from typing import Iterator
+
+from Model.Dijkstra.AStar import AStar
+from Model.Dijkstra.Dijkstra import Dijkstra
+from Model.Dijkstra.JunctionGraph import JunctionGraph
+from Model.LevelGeneration.Generators.BacktrackerGenerator import BacktrackerGenerator
+from Model.LevelGeneration.Generators.EllerGenerator import EllerGenerator
+from Model.LevelGeneration.Generators.KruskalGenerator import KruskalGenerator
+from Model.LevelGeneration.Generators.PrimGenerator import PrimGenerator
+from Model.LevelGeneration.Generators.WilsonGenerator import WilsonGenerator
+from Model.LevelGeneration.Matrix import Matrix
+from Model.LevelGeneration.MatrixPathBuilder import MatrixPathBuilder
+from Model.LevelGeneration.Maze import Maze
+
+
+class JunctionGraphTest(unittest.TestCase):
+    """
+    Проверяет граф развилок на лабиринтах всех стратегий генерации, с одним
+    и несколькими выходами, а также с пробитыми стенами, образующими циклы.
+    """
+    WALL = "#"
+    PASSAGE = "."
+    GENERATORS = [BacktrackerGenerator, PrimGenerator, KruskalGenerator, WilsonGenerator, EllerGenerator]
+    SEEDS = range(4)
+    SIZE = 17
+    HINT_STEPS = 5
+    OPENED_WALLS = 12
+
+    def test_distance_and_route_match_breadth_first_search(self) -> None:
+        """
+        Расстояние до ближайшего выхода совпадает с поиском в ширину из всех выходов,
+        а маршрут состоит из соседних проходимых клеток, по которым расстояние
+        уменьшается на единицу за шаг.
+        """
+        for maze, matrix in self.__mazes():
+            distances = self.__breadth_first_search(matrix, maze.exits)
+            for (x, y), expected in distances.items():
+                self.assertEqual(maze.distance_to_exit(x, y), expected, (x, y))
+                route = maze.route_to_exit(x, y, self.HINT_STEPS)
+                self.assertEqual(len(route), min(self.HINT_STEPS, expected), (x, y))
+                previous = (x, y)
+                for step, cell in enumerate(route, 1):
+                    self.assertEqual(abs(cell[0] - previous[0]) + abs(cell[1] - previous[1]), 1, (x, y))
+                    self.assertEqual(distances.get(cell), expected - step, (x, y))
+                    previous = cell
+            self.assertEqual(maze.distance_to_exit(0, 0), Dijkstra.INFINITY)
+            self.assertEqual(maze.route_to_exit(0, 0, self.HINT_STEPS), [])
+
+    def test_expanded_astar_path_matches_breadth_first_search(self) -> None:
+        """
+        Путь A* по графу развилок после развёртывания в клетки идёт от входа до
+        выхода по соседним проходимым клеткам и имеет кратчайшую длину.
+        """
+        for maze, matrix in self.__mazes():
+            target = maze.exits[0]
+            graph = JunctionGraph(matrix, self.PASSAGE, [maze.entrance_coordinate] + maze.exits)
+            search = AStar(graph, *maze.entrance_coordinate, *target)
+            cells = graph.expand_path(search.get_path())
+            expected = self.__breadth_first_search(matrix, [target])[maze.entrance_coordinate]
+
+            self.assertEqual(search.distance, expected)
+            self.assertEqual(len(cells), expected + 1)
+            self.assertEqual(cells[0], maze.entrance_coordinate)
+            self.assertEqual(cells[-1], target)
+            for previous, cell in zip(cells, cells[1:]):
+                self.assertEqual(abs(cell[0] - previous[0]) + abs(cell[1] - previous[1]), 1)
+                self.assertEqual(matrix.get(*cell), self.PASSAGE)
+
+    def __mazes(self) -> Iterator[tuple[Maze, Matrix]]:
+        """
+        Порождает пары (лабиринт, матрица) для каждой стратегии, зерна и количества выходов.
+        В лабиринтах с нечётным зерном пробиваются стены, чтобы между клетками было
+        несколько путей.
+        """
+        for generator in self.GENERATORS:
+            for seed in self.SEEDS:
+                for exits_count in (1, 3):
+                    with self.subTest(generator=generator.__name__, seed=seed, exits=exits_count):
+                        random.seed(seed)
+                        matrix = Matrix(self.SIZE, self.SIZE, self.WALL, self.PASSAGE)
+                        maze = Maze(MatrixPathBuilder(random.randrange(1, self.SIZE - 1), 0, matrix),
+                                    exits_count, generator=generator())
+                        if seed % 2:
+                            self.__open_walls(matrix)
+                        yield maze, matrix
+
+    def __open_walls(self, matrix: Matrix) -> None:
+        """
+        Делает проходимыми несколько случайных внутренних стен.
+
+        Args:
+            matrix: Матрица лабиринта.
+        """
+        walls = [(x, y) for x in range(1, matrix.width - 1) for y in range(1, matrix.height - 1)
+                 if matrix.get(x, y) == self.WALL]
+        for x, y in random.sample(walls, min(self.OPENED_WALLS, len(walls))):
+            matrix.set_zero(x, y)
+
+    def __breadth_first_search(self, matrix: Matrix, sources: list[tuple[int, int]]) -> dict[tuple[int, int], int]:
+        """
+        Возвращает расстояния от ближайшего из источников до каждой достижимой клетки.
+
+        Args:
+            matrix: Матрица лабиринта.
+            sources: Координаты источников.
+        """
+        distances = {source: 0 for source in sources}
+        queue = deque(sources)
+        while queue:
+            x, y = queue.popleft()
+            for cell in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if (cell not in distances and 0 <= cell[0] < matrix.width and 0 <= cell[1] < matrix.height
+                        and matrix.get(*cell) == self.PASSAGE):
+                    distances[cell] = distances[(x, y)] + 1
+                    queue.append(cell)
+        return distances
+
+
+if __name__ == "__main__":
+    unittest.main()
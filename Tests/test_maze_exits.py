@@ -0,0 +1,81 @@
+"""
+Проверки выходов лабиринта: каждый выход из Maze.exits открыт на проходную клетку
+границы, отличную от входа, для всех стратегий генерации и количества выходов
+простого и сложного режимов.
+
+Запуск из корня проекта:
+    python -m unittest discover -s Tests
+"""
+import random
+import unittest
+
+from Model.LevelGeneration.Generators.BacktrackerGenerator import BacktrackerGenerator
+from Model.LevelGeneration.Generators.EllerGenerator import EllerGenerator
+from Model.LevelGeneration.Generators.KruskalGenerator import KruskalGenerator
+from Model.LevelGeneration.Generators.PrimGenerator import PrimGenerator
+from Model.LevelGeneration.Generators.WilsonGenerator import WilsonGenerator
+from Model.LevelGeneration.Matrix import Matrix
+from Model.LevelGeneration.MatrixPathBuilder import MatrixPathBuilder
+from Model.LevelGeneration.Maze import Maze
+
+
+class MazeExitsTest(unittest.TestCase):
+    """
+    Генерирует лабиринты так же, как Game, начиная с размера первого уровня 8x8.
+    """
+    WALL = "#"
+    PASSAGE = "."
+    GENERATORS = [BacktrackerGenerator, PrimGenerator, KruskalGenerator, WilsonGenerator, EllerGenerator]
+    EXITS_COUNTS = (1, 3)
+    SIZES = (8, 11, 14)
+    SEEDS = range(150)
+
+    def test_exits_open_to_border_other_than_entrance(self) -> None:
+        """
+        Для каждого выхода среди самой клетки и её соседей есть проходная клетка
+        на границе матрицы, и это не вход.
+        """
+        for generator in self.GENERATORS:
+            for exits_count in self.EXITS_COUNTS:
+                for size in self.SIZES:
+                    for seed in self.SEEDS:
+                        random.seed(seed)
+                        matrix = Matrix(size, size, self.WALL, self.PASSAGE)
+                        entrance = (random.randrange(1, size - 1), 0)
+                        maze = Maze(MatrixPathBuilder(*entrance, matrix), exits_count, generator=generator())
+                        for exit_coordinate in maze.exits:
+                            with self.subTest(generator=generator.__name__, exits=exits_count, size=size,
+                                              seed=seed, exit=exit_coordinate):
+                                self.assertTrue(self.__opens_to_border(matrix, *exit_coordinate, entrance))
+
+    def test_first_easy_level_is_not_solved_in_one_step(self) -> None:
+        """
+        Уровень 8x8 с тремя выходами из зерна 61 раньше получал выход прямо под входом.
+        """
+        random.seed(61)
+        matrix = Matrix(8, 8, self.WALL, self.PASSAGE)
+        entrance = (random.randrange(1, 7), 0)
+        maze = Maze(MatrixPathBuilder(*entrance, matrix), 3)
+        self.assertNotIn((entrance[0], 1), maze.exits)
+        self.assertGreater(maze.optimal_distance(), 1)
+
+    def __opens_to_border(self, matrix: Matrix, x: int, y: int, entrance: tuple[int, int]) -> bool:
+        """
+        Проверяет, что клетка (x, y) или её сосед - проходная клетка границы, отличная от входа.
+
+        Args:
+            matrix: Матрица лабиринта.
+            x: Координата X выхода.
+            y: Координата Y выхода.
+            entrance: Координаты входа.
+        """
+        for cell_x, cell_y in ((x, y), (x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if (0 <= cell_x < matrix.width and 0 <= cell_y < matrix.height and (cell_x, cell_y) != entrance
+                    and (cell_x in (0, matrix.width - 1) or cell_y in (0, matrix.height - 1))
+                    and matrix.get(cell_x, cell_y) == self.PASSAGE):
+                return True
+        return False
+
+
+if __name__ == "__main__":
+    unittest.main()
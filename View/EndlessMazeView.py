@@ -0,0 +1,66 @@
+from Model.LevelGeneration.EndlessMaze import EndlessMaze
+from Model.Render.AnsiEncoder import AnsiEncoder
+from Model.Render.Renderer import Renderer
+
+
+class EndlessMazeView:
+    """
+    Класс для визуализации персонажа в бесконечном лабиринте.
+    Показывает окно строк вокруг персонажа и сдвигает окно лабиринта вслед за ним.
+    Методы visualize_* только обновляют состояние, окно выводится методом render.
+    """
+    def __init__(self, maze: EndlessMaze, character_symbol: str, view_height: int) -> None:
+        """
+        Инициализирует представление бесконечного лабиринта.
+
+        Args:
+            maze: Бесконечный лабиринт.
+            character_symbol: Символ для обозначения персонажа.
+            view_height: Количество строк лабиринта, выводимых на экран.
+        """
+        self.__maze = maze
+        self.__character_symbol = character_symbol
+        self.__view_height = view_height
+        self.__character_x = 0
+        self.__character_y = 0
+        self.__character_code = len(maze.palette)
+        self.__encoder = AnsiEncoder(maze.palette + [character_symbol])
+
+    def visualize_move(self, x: int, y: int) -> None:
+        """
+        Сдвигает окно лабиринта к новой позиции персонажа.
+
+        Args:
+            x: Новая координата X персонажа.
+            y: Новая координата Y персонажа.
+        """
+        self.__character_x = x
+        self.__character_y = y
+        self.__maze.scroll_to(x, y)
+
+    def visualize_wall(self, x: int, y: int) -> None:
+        """
+        Обрабатывает попытку персонажа пройти сквозь стену.
+        Стены бесконечного лабиринта видны всегда, поэтому окно не меняется.
+
+        Args:
+            x: Координата X стены.
+            y: Координата Y стены.
+        """
+
+    def render(self) -> None:
+        """
+        Выводит строки окна, в середине которого находится персонаж.
+        """
+        maze = self.__maze
+        top = max(maze.first_row, self.__character_y - self.__view_height // 3)
+
+        Renderer.clear()
+        for y in range(top, top + self.__view_height):
+            row = maze.row_to_string(y)
+            if y == self.__character_y:
+                codes = bytearray(maze.get_code(x, y) for x in range(maze.width))
+                codes[self.__character_x] = self.__character_code
+                row = self.__encoder.encode(codes)
+            Renderer.render(row)
+        Renderer.flush()
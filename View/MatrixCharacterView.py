@@ -1,13 +1,23 @@
 from Model.LevelGeneration.Matrix import Matrix
-from Model.Render.Renderer import Renderer
+from Model.Render.Camera import Camera
+from Model.Render.FrameDiffRenderer import FrameDiffRenderer
+from Model.Render.MiniMap import MiniMap
+from Model.Render.Terminal import Terminal
 
 
 class MatrixCharacterView:
     """
     Класс для визуализации персонажа и его окружения на матрице.
     Создает "туман войны", скрывая неисследованные области.
+    Методы visualize_* только обновляют состояние вида, кадр выводится методом
+    render, поэтому несколько ходов за такт отрисовываются одним кадром.
+    В режиме подсказок поверх карты показываются следующие шаги кратчайшего пути.
+    Между кадрами перерисовываются только изменившиеся ячейки, и только внутри
+    окна Camera, которое следует за персонажем. Рядом с окном может выводиться мини-карта.
     """
-    def __init__(self, matrix: Matrix, unknown_symbol: str, zero_symbol: str, character_symbol: str) -> None:
+    def __init__(self, matrix: Matrix, unknown_symbol: str, zero_symbol: str, character_symbol: str,
+                 hint_symbol: str | None = None, camera: Camera | None = None,
+                 minimap: MiniMap | None = None) -> None:
         """
         Инициализирует представление персонажа.
 
@@ -16,29 +26,42 @@ class MatrixCharacterView:
             unknown_symbol: Символ для неисследованных областей.
             zero_symbol: Символ для пустых (исследованных) областей.
             character_symbol: Символ для обозначения персонажа.
+            hint_symbol: Символ для клеток подсказки; по умолчанию совпадает с zero_symbol.
+            camera: Окно просмотра; по умолчанию выводится вся матрица.
+            minimap: Необязательная мини-карта уровня.
         """
         self.__view_matrix = Matrix(matrix.width, matrix.height, unknown_symbol, zero_symbol)
         self.__character_symbol = character_symbol
         self.__zero_symbol = zero_symbol
         self.__matrix = matrix
+        self.__character_position: tuple[int, int] | None = None
+        self.__hint_symbol = hint_symbol or zero_symbol
+        self.__hidden_by_hint: dict[tuple[int, int], str] = {}
+        self.__camera = camera or Camera(matrix.width, matrix.height, matrix.width, matrix.height)
+        self.__minimap = minimap
+        self.__renderer = FrameDiffRenderer(self.__view_matrix, self.__camera)
 
     def visualize_move(self, x: int, y: int) -> None:
         """
-        Обновляет и отображает перемещение персонажа.
+        Обновляет перемещение персонажа на карте вида.
         Старая позиция заменяется на 'zero_symbol', новая - на 'character_symbol'.
+        Если окно просмотра сдвигается вслед за персонажем, следующий кадр выводится целиком.
 
         Args:
             x: Новая координата X персонажа.
             y: Новая координата Y персонажа.
         """
-        if self.__view_matrix.exist_symbol(self.__character_symbol):
-            coords = self.__view_matrix.get_symbol_coord(self.__character_symbol)
-            if coords:
-                self.__view_matrix.set_symbol(coords[0], coords[1], self.__zero_symbol)
+        if self.__character_position:
+            self.__view_matrix.set_symbol(*self.__character_position, self.__zero_symbol)
+            self.__renderer.mark_dirty(*self.__character_position)
 
         self.__view_matrix.set_symbol(x, y, self.__character_symbol)
-        Renderer.clear()
-        self.__view_matrix.print_matrix()
+        self.__character_position = (x, y)
+        self.__renderer.mark_dirty(x, y)
+        if self.__minimap:
+            self.__minimap.mark_explored(x, y)
+        if self.__camera.follow(x, y):
+            self.__renderer.invalidate()
 
     def visualize_wall(self, x: int, y: int) -> None:
         """
@@ -52,5 +75,37 @@ class MatrixCharacterView:
         x = min(max(0, x), view.width - 1)
         y = min(max(0, y), view.height - 1)
         view.set_symbol(x, y, self.__matrix.get(x, y))
-        Renderer.clear()
-        self.__view_matrix.print_matrix()
+        self.__renderer.mark_dirty(x, y)
+        if self.__minimap:
+            self.__minimap.mark_explored(x, y)
+
+    def show_hint(self, cells: list[tuple[int, int]]) -> None:
+        """
+        Показывает подсказку на клетках cells, убирая предыдущую подсказку.
+        Клетки, на которые персонаж уже наступил, не восстанавливаются.
+
+        Args:
+            cells: Координаты клеток подсказки.
+        """
+        view = self.__view_matrix
+        for (x, y), symbol in self.__hidden_by_hint.items():
+            if view.get(x, y) == self.__hint_symbol:
+                view.set_symbol(x, y, symbol)
+                self.__renderer.mark_dirty(x, y)
+        self.__hidden_by_hint.clear()
+
+        for x, y in cells:
+            if (x, y) == self.__character_position:
+                continue
+            self.__hidden_by_hint[(x, y)] = view.get(x, y)
+            view.set_symbol(x, y, self.__hint_symbol)
+            self.__renderer.mark_dirty(x, y)
+
+    def render(self) -> None:
+        """
+        Выводит кадр с изменениями, накопленными с прошлого вызова, и мини-карту.
+        """
+        self.__renderer.render_frame()
+        if self.__minimap:
+            self.__minimap.render(self.__camera, self.__character_position)
+            Terminal.write(Terminal.cursor_position(self.__camera.rows + 1, 1))
@@ -22,3 +22,5 @@ class MenuView:
                 Renderer.render(f">{items[i]}")
             else:
                 Renderer.render(f" {items[i]}")
+
+        Renderer.flush()
@@ -0,0 +1,62 @@
+"""
+Запуск замеров производительности генерации, построения графа, поиска путей и отрисовки.
+
+Результаты записываются в JSON-файл и сравниваются с сохранённым базовым файлом;
+при регрессии скрипт завершается с кодом 1.
+
+Пример:
+    python benchmark.py --sizes 8 32 128 --save-baseline
+    python benchmark.py --sizes 8 32 128
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+
+from Benchmarks.MazeBenchmark import MazeBenchmark
+from Model.LevelGeneration.Generators.BacktrackerGenerator import BacktrackerGenerator
+from Model.LevelGeneration.Generators.EllerGenerator import EllerGenerator
+from Model.LevelGeneration.Generators.KruskalGenerator import KruskalGenerator
+from Model.LevelGeneration.Generators.PrimGenerator import PrimGenerator
+from Model.LevelGeneration.Generators.WilsonGenerator import WilsonGenerator
+
+
+parser = argparse.ArgumentParser(description="Замеры производительности лабиринта")
+parser.add_argument("--sizes", type=int, nargs="+", default=[8, 16, 32, 64, 128, 256, 512, 1000],
+                    help="размеры стороны лабиринта")
+parser.add_argument("--seed", type=int, default=2024, help="зерно генератора случайных чисел")
+parser.add_argument("--output", default=os.path.join("Benchmarks", "results.json"),
+                    help="файл для записи результатов")
+parser.add_argument("--baseline", default=os.path.join("Benchmarks", "baseline.json"),
+                    help="файл базовых результатов для сравнения")
+parser.add_argument("--save-baseline", action="store_true",
+                    help="сохранить текущие результаты как базовые")
+parser.add_argument("--tolerance", type=float, default=1.25,
+                    help="допустимое отношение к базовому времени и памяти")
+arguments = parser.parse_args()
+
+generators = [BacktrackerGenerator(), PrimGenerator(), KruskalGenerator(), WilsonGenerator(), EllerGenerator()]
+results = MazeBenchmark(generators, arguments.seed).run(arguments.sizes)
+report = {"seed": arguments.seed,
+          "python": platform.python_version(),
+          "results": results}
+
+for entry in results:
+    print(f"{entry['stage']:<36} {entry['size']:>5}x{entry['size']:<5} "
+          f"{entry['seconds']:>10.4f} с {entry['peak_bytes']:>12} Б памяти {entry['written_bytes']:>10} Б вывода")
+
+with open(arguments.output, "w", encoding="utf-8") as file:
+    json.dump(report, file, ensure_ascii=False, indent=2)
+
+if arguments.save_baseline:
+    with open(arguments.baseline, "w", encoding="utf-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+elif os.path.exists(arguments.baseline):
+    with open(arguments.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    regressions = MazeBenchmark.compare(results, baseline["results"], arguments.tolerance)
+    for regression in regressions:
+        print(f"РЕГРЕССИЯ: {regression}")
+    if regressions:
+        sys.exit(1)
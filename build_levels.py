@@ -0,0 +1,57 @@
+"""
+Параллельная генерация набора проверенных уровней для турниров.
+
+Уровни строятся во всех ядрах процессора, каждый с собственным зерном,
+проверяются на связность и достижимость выхода и записываются в файл набора
+вместе с длиной кратчайшего пути. Набор можно пройти в игре: python main.py --pack <файл>.
+
+Пример:
+    python build_levels.py --count 1000 --size 41 41 --generator prim --output Levels/tournament.mzpk
+"""
+import argparse
+import os
+import sys
+
+from Model.LevelPack.LevelPack import LevelPack
+from Model.LevelPack.LevelPackBuilder import LevelPackBuilder
+
+
+def main() -> None:
+    """
+    Генерирует уровни и записывает прошедшие проверку в файл набора.
+    """
+    parser = argparse.ArgumentParser(description="Генерация набора уровней лабиринта")
+    parser.add_argument("--count", type=int, default=100, help="количество уровней")
+    parser.add_argument("--size", type=int, nargs=2, default=[31, 31], metavar=("WIDTH", "HEIGHT"),
+                        help="ширина и высота лабиринтов")
+    parser.add_argument("--generator", choices=list(LevelPackBuilder.GENERATORS), default="backtracker",
+                        help="алгоритм генерации")
+    parser.add_argument("--seed", type=int, default=2024, help="зерно первого уровня")
+    parser.add_argument("--workers", type=int, default=None, help="количество процессов (по умолчанию - число ядер)")
+    parser.add_argument("--output", default=os.path.join("Levels", "pack.mzpk"), help="файл набора уровней")
+    arguments = parser.parse_args()
+
+    width, height = arguments.size
+    rejected = 0
+
+    def accepted_records():
+        nonlocal rejected
+        for record in LevelPackBuilder.build(arguments.count, width, height, arguments.generator,
+                                             arguments.seed, arguments.workers):
+            if record is None:
+                rejected += 1
+            else:
+                yield record
+
+    directory = os.path.dirname(arguments.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    written = LevelPack.save(arguments.output, accepted_records())
+
+    print(f"Записано уровней: {written}, отклонено: {rejected} -> {arguments.output}")
+    if rejected:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,70 @@
 """
 Основной файл для запуска игры.
 Создает экземпляр класса Game и запускает игровой процесс.
+Перед игрой терминал переключается на альтернативный экран, после выхода восстанавливается.
+
+Флаг --profile (или переменная окружения MAZE_PROFILE=1) включает профилирование:
+в игре выводится строка с длительностью кадра, а при выходе - сводка замеров.
+Флаг --pack <файл> запускает уровни из набора, собранного build_levels.py.
+Флаг --input выбирает источник нажатий: terminal - стандартный ввод терминала
+(не требует прав root), keyboard - библиотека keyboard.
+Флаг --color задаёт глубину цвета: truecolor, 256 или 16; по умолчанию (auto) она
+определяется по COLORTERM, TERM и terminfo до создания игры, чтобы палитра
+лабиринта один раз строилась из самых коротких последовательностей, которые
+поддерживает терминал.
 """
+import argparse
+
 from Model.Game import Game
+from Model.Input.Backends.KeyboardInputBackend import KeyboardInputBackend
+from Model.Input.Backends.TerminalInputBackend import TerminalInputBackend
+from Model.LevelPack.LevelPack import LevelPack
+from Model.Profiling.Profiler import Profiler
+from Model.Render.ColorDepth import ColorDepth
+from Model.Render.Terminal import Terminal
+from Model.Render.TerminalCapabilities import TerminalCapabilities
+from Model.colors import Color
+
+
+parser = argparse.ArgumentParser(description="Майнкрафт крипер лабиринт")
+parser.add_argument("--profile", action="store_true", help="включить профилирование игрового цикла")
+parser.add_argument("--pack", help="файл набора уровней, собранного build_levels.py")
+parser.add_argument("--input", choices=["terminal", "keyboard"],
+                    help="источник нажатий клавиш (по умолчанию keyboard в Windows, terminal в остальных системах)")
+parser.add_argument("--color", choices=["auto"] + [depth.value for depth in ColorDepth], default="auto",
+                    help="глубина цвета (по умолчанию определяется по терминалу)")
+arguments = parser.parse_args()
+
+level_pack = None
+if arguments.pack:
+    try:
+        level_pack = LevelPack(arguments.pack)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+    if not len(level_pack):
+        parser.error(f"в наборе {arguments.pack} нет уровней")
+
+Profiler.enable_from_environment()
+if arguments.profile:
+    Profiler.enable()
+
+input_backend = None
+match arguments.input:
+    case "terminal":
+        input_backend = TerminalInputBackend()
+    case "keyboard":
+        input_backend = KeyboardInputBackend()
 
+if arguments.color == "auto":
+    Color.set_depth(TerminalCapabilities.detect_color_depth())
+else:
+    Color.set_depth(ColorDepth(arguments.color))
 
-game = Game()
-game.play()
+game = Game(level_pack, input_backend)
+Terminal.setup()
+try:
+    game.play()
+finally:
+    Terminal.restore()
+    if Profiler.enabled:
+        print(Profiler.summary())